@@ -1,13 +1,25 @@
 # elegant_chart/__init__.py
 from ._logging import enable_logging
+from .background_writer import BackgroundWriter
 from .base import ChartBase
+from .data_export import ExportWorkbook
 from .data_mixin import XPlan
 from .elegant_chart import ElegantChart
+from .output_cache import OutputCache
+from .report import ChartReport
+from .spec import RenderPlan, compile_spec, load_spec
 from .types import FormatterCallable, FormatterSpec, YFormatter
 
 __all__ = [
     "ElegantChart",
     "ChartBase",
+    "BackgroundWriter",
+    "ExportWorkbook",
+    "ChartReport",
+    "OutputCache",
+    "RenderPlan",
+    "compile_spec",
+    "load_spec",
     "XPlan",
     "YFormatter",
     "FormatterSpec",
@@ -0,0 +1,356 @@
+# elegant_chart/animation_mixin.py
+from __future__ import annotations
+
+import math
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import animation, rc_context
+
+from ._logging import logger
+from .axis_utils import calc_y_axis
+from .static_layer import StaticLayer
+
+# Rendered frames allowed to wait for the encoder; bounds memory when
+# encoding is slower than blitting.
+_MAX_PENDING_FRAMES = 8
+
+
+class _BlittedFigure:
+    """Figure stand-in handed to ``PillowWriter`` / ``FFMpegWriter``.
+
+    Both writers take a frame with ``fig.savefig(sink, format="rgba",
+    dpi=...)``; this answers with the blitted RGBA frame instead of
+    redrawing the whole figure. It reports the frame's size, and when the
+    writer resizes it (``FFMpegWriter`` rounds h264 frames up to even
+    pixels) pads the frame with its edge pixels.
+    """
+
+    def __init__(self, frame: np.ndarray, dpi: float) -> None:
+        self.dpi = dpi
+        self.frame = frame
+        self._size = (frame.shape[1] / dpi, frame.shape[0] / dpi)
+
+    def get_size_inches(self) -> np.ndarray:
+        return np.array(self._size)
+
+    def set_size_inches(self, w: Any, h: Optional[float] = None, forward: bool = True) -> None:
+        self._size = (float(w), float(h)) if h is not None else tuple(map(float, w))
+
+    def savefig(self, fname: Any, *, format: str, dpi: float, **kwargs: Any) -> None:
+        if format != "rgba":
+            raise ValueError(f"Blitted frames are raw RGBA, not {format!r}")
+        # Same rounding as AbstractMovieWriter.frame_size.
+        width, height = (int(size * dpi + 1e-8) for size in self._size)
+        frame = self.frame
+        pad = ((0, max(0, height - frame.shape[0])), (0, max(0, width - frame.shape[1])), (0, 0))
+        if pad[0][1] or pad[1][1]:
+            frame = np.pad(frame, pad, mode="edge")
+        fname.write(np.ascontiguousarray(frame[:height, :width]).tobytes())
+
+
+# Writers that take a frame as one raw RGBA savefig(); fed blitted frames.
+_BLIT_WRITERS = (animation.PillowWriter, animation.FFMpegWriter)
+
+
+class _FrameEncoder:
+    """Feed blitted RGBA frames to a movie writer from a background thread.
+
+    The writer's public ``setup`` (on the first frame), ``grab_frame`` and
+    ``finish`` all run on that thread, against a :class:`_BlittedFigure`,
+    while the main thread blits the next frame. An encoder error stops
+    further writes and is re-raised on the next :meth:`put` or on
+    :meth:`close`.
+    """
+
+    def __init__(self, writer: animation.AbstractMovieWriter, path: Any, dpi: float) -> None:
+        self.writer = writer
+        self.path = os.fspath(path)
+        self.dpi = dpi
+        self._figure: Optional[_BlittedFigure] = None
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(_MAX_PENDING_FRAMES)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="elegant-chart-encoder", daemon=True)
+        self._thread.start()
+
+    def put(self, frame: np.ndarray) -> None:
+        self._raise_error()
+        # The canvas buffer is reused by the next render: hand over a copy.
+        self._queue.put(frame.copy())
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _run(self) -> None:
+        while (frame := self._queue.get()) is not None:
+            if self._error is None:
+                self._guarded(self._grab, frame)
+        if self._figure is not None:
+            self._guarded(self.writer.finish)
+
+    def _grab(self, frame: np.ndarray) -> None:
+        if self._figure is None:
+            self._figure = _BlittedFigure(frame, self.dpi)
+            self.writer.setup(self._figure, self.path, self.dpi)
+        self._figure.frame = frame
+        self.writer.grab_frame()
+
+    def _guarded(self, fn: Any, *args: Any) -> None:
+        try:
+            fn(*args)
+        except BaseException as exc:  # surfaced on the main thread
+            if self._error is None:
+                self._error = exc
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+class AnimationMixin:
+    def animate_line(
+        self,
+        save_path: str,
+        x: Optional[Sequence[Any]] = None,
+        ys: Optional[Union[Sequence[Any], Dict[str, Sequence[Any]]]] = None,
+        labels: Optional[Sequence[Optional[str]]] = None,
+        snapshots: bool = False,
+        frames: Optional[int] = None,
+        fps: float = 12.0,
+        dpi: int = 150,
+        hold: float = 1.0,
+        writer: Optional[Union[str, animation.AbstractMovieWriter]] = None,
+        **line_kwargs: Any,
+    ) -> Tuple[plt.Figure, plt.Axes]:
+        """Write a GIF / MP4 of a line chart drawing itself or stepping through snapshots.
+
+        The chart is rendered once with :meth:`~.line_mixin.LineMixin.line`
+        and the frame (axes, layout, title stack, legend, footer) is cached
+        as a static layer; each animation frame only updates the line data
+        (and value labels) and blits them over it. Finished frames are
+        encoded on a background thread while the next one renders.
+
+        Parameters
+        ----------
+        save_path:
+            Output file. ``.gif`` is written with matplotlib's
+            ``PillowWriter``; anything else with ``FFMpegWriter`` (needs
+            ``ffmpeg`` on the ``PATH``) unless ``writer`` says otherwise.
+        x, ys, labels:
+            As for :meth:`~.line_mixin.LineMixin.line`. With
+            ``snapshots=True``, ``ys`` is a sequence of payloads (each shaped
+            like a ``line()`` ``ys``) drawn against the same ``x``.
+        snapshots:
+            ``False`` (default) → reveal the series left to right.
+            ``True`` → step through the payloads in ``ys`` on one y scale
+            fitted to all of them.
+        frames:
+            Frame count. Default: one per point (reveal) or per snapshot.
+            More frames than that interpolate in between for smooth motion.
+        fps:
+            Playback rate.
+        dpi:
+            Frame resolution.
+        hold:
+            Seconds the last frame stays on screen.
+        writer:
+            A matplotlib writer name or ``AbstractMovieWriter`` instance.
+            ``PillowWriter`` and ``FFMpegWriter`` (``"pillow"``,
+            ``"ffmpeg"``) are handed the blitted frames and run on a
+            background thread; any other writer grabs each frame itself
+            with ``grab_frame()`` — a full redraw per frame, on this
+            thread.
+        **line_kwargs:
+            Passed to the ``line()`` render (``df``, ``y_formatter``,
+            ``show_value_labels``, ``linewidth`` …).
+
+        Returns
+        -------
+        (fig, ax) of the final frame.
+        """
+        if fps <= 0:
+            raise ValueError(f"fps must be > 0, got {fps}")
+        if frames is not None and frames < 1:
+            raise ValueError(f"frames must be >= 1, got {frames}")
+        if hold < 0:
+            raise ValueError(f"hold must be >= 0, got {hold}")
+        movie_writer = self._resolve_movie_writer(save_path, writer, fps)
+        line_kwargs.update(show=False, save_path=None, export_xlsx=False)
+
+        if snapshots:
+            if ys is None or isinstance(ys, dict) or len(ys) == 0:
+                raise ValueError("snapshots=True needs ys as a non-empty sequence of payloads")
+            fig, ax, steps = self._snapshot_steps(x, list(ys), labels, frames, line_kwargs)
+        else:
+            fig, ax = self.line(x=x, ys=ys, labels=labels, **line_kwargs)  # type: ignore[attr-defined]
+            steps = self._reveal_steps(frames)
+        state = self._render_state  # type: ignore[attr-defined]
+        self._write_animation(
+            fig, state.data_artists, steps, save_path, movie_writer, fps, dpi, hold
+        )
+        return fig, ax
+
+    # ── animation stages ──────────────────────────────────────────────────
+
+    def _write_animation(
+        self,
+        fig: plt.Figure,
+        artists: Sequence[Any],
+        steps: Sequence[Any],
+        save_path: str,
+        movie_writer: animation.AbstractMovieWriter,
+        fps: float,
+        dpi: int,
+        hold: float,
+    ) -> int:
+        """Blit *artists* over a static layer after each step; encode in the background.
+
+        Each entry of *steps* is a callable that moves the artists to one
+        frame. Writers other than ``PillowWriter`` / ``FFMpegWriter`` grab
+        every frame themselves instead. Returns the number of frames rendered
+        (``hold`` repeats not included).
+        """
+        n_hold = math.ceil(hold * fps)
+        if not isinstance(movie_writer, _BLIT_WRITERS):
+            n_frames = self._grab_animation(fig, steps, save_path, movie_writer, dpi, n_hold)
+            logger.info("Animated %d frames at %g fps -> %s", n_frames, fps, save_path)
+            return n_frames
+
+        layer = StaticLayer(fig, artists, dpi=dpi, rc=self._rc)  # type: ignore[attr-defined]
+        n_frames = 0
+        # As in AbstractMovieWriter.saving(): frames must not be cropped.
+        with rc_context({"savefig.bbox": None}):
+            encoder = _FrameEncoder(movie_writer, save_path, dpi)
+            try:
+                for step in steps:
+                    step()
+                    encoder.put(layer.render())
+                    n_frames += 1
+                last = layer.render()
+                for _ in range(n_hold):
+                    encoder.put(last)
+            finally:
+                encoder.close()
+        logger.info("Animated %d frames at %g fps -> %s", n_frames, fps, save_path)
+        return n_frames
+
+    def _grab_animation(
+        self,
+        fig: plt.Figure,
+        steps: Sequence[Any],
+        save_path: str,
+        movie_writer: animation.AbstractMovieWriter,
+        dpi: int,
+        n_hold: int,
+    ) -> int:
+        """Feed every frame through the writer's public ``setup`` / ``grab_frame`` / ``finish``."""
+        n_frames = 0
+        with movie_writer.saving(fig, os.fspath(save_path), dpi), rc_context(self._rc):  # type: ignore[attr-defined]
+            for step in steps:
+                step()
+                movie_writer.grab_frame()
+                n_frames += 1
+            for _ in range(n_hold):
+                movie_writer.grab_frame()
+        return n_frames
+
+    def _resolve_movie_writer(
+        self,
+        save_path: str,
+        writer: Optional[Union[str, animation.AbstractMovieWriter]],
+        fps: float,
+    ) -> animation.AbstractMovieWriter:
+        """The matplotlib writer instance for *writer* (default: by file extension)."""
+        if writer is None:
+            writer = "pillow" if os.fspath(save_path).lower().endswith(".gif") else "ffmpeg"
+        if isinstance(writer, str):
+            if not animation.writers.is_available(writer):
+                hint = " (is ffmpeg installed?)" if writer.startswith("ffmpeg") else ""
+                raise RuntimeError(f"Animation writer {writer!r} is not available{hint}")
+            writer = animation.writers[writer](fps=fps)
+        if not isinstance(writer, animation.AbstractMovieWriter):
+            raise ValueError(
+                "writer must be a writer name or a matplotlib AbstractMovieWriter, "
+                f"got {type(writer).__name__}"
+            )
+        return writer
+
+    def _reveal_steps(self, frames: Optional[int]) -> List[Any]:
+        """One callable per frame that cuts the rendered lines at a growing x."""
+        state = self._render_state  # type: ignore[attr-defined]
+        full = [
+            (np.asarray(ln.get_xdata(), dtype=float), np.asarray(ln.get_ydata(), dtype=float))
+            for ln in state.series_artists
+        ]
+        n = len(full[0][0])
+        if n < 2:
+            raise ValueError("Animating a line needs at least 2 points")
+        # Position of the line's leading edge, in (fractional) point indices.
+        edges = np.linspace(1, n - 1, frames or n - 1)
+
+        def reveal(edge: float) -> None:
+            i = int(edge)
+            frac = edge - i
+            for ln, (xs, vals) in zip(state.series_artists, full):
+                if frac > 0:
+                    ln.set_data(
+                        np.append(xs[: i + 1], xs[i] + frac * (xs[i + 1] - xs[i])),
+                        np.append(vals[: i + 1], vals[i] + frac * (vals[i + 1] - vals[i])),
+                    )
+                else:
+                    ln.set_data(xs[: i + 1], vals[: i + 1])
+            for artist, _, point in state.value_labels:
+                artist.set_visible(point <= edge)
+
+        return [lambda e=e: reveal(e) for e in edges]
+
+    def _snapshot_steps(
+        self,
+        x: Optional[Sequence[Any]],
+        payloads: List[Any],
+        labels: Optional[Sequence[Optional[str]]],
+        frames: Optional[int],
+        line_kwargs: Dict[str, Any],
+    ) -> Tuple[plt.Figure, plt.Axes, List[Any]]:
+        """Render the first snapshot on a scale fitted to all, then step through them."""
+        if x is None:
+            raise ValueError("snapshots=True needs x")
+        values = [
+            v
+            for p in payloads
+            for _, vals in self._normalize_series(p, labels)
+            for v in vals  # type: ignore[attr-defined]
+        ]
+
+        # One y scale for every snapshot, unless the chart already pins one.
+        saved_scale = self.y_scale  # type: ignore[attr-defined]
+        if line_kwargs.get("ylim") is None and self.ylim is None and saved_scale is None:  # type: ignore[attr-defined]
+            self.y_scale = calc_y_axis(  # type: ignore[attr-defined]
+                float(min(values)),
+                float(max(values)),
+                "line",
+                has_top_label=line_kwargs.get("show_value_labels", False),
+            )
+        try:
+            fig, ax = self.line(x=x, ys=payloads[0], labels=labels, **line_kwargs)  # type: ignore[attr-defined]
+        finally:
+            self.y_scale = saved_scale  # type: ignore[attr-defined]
+        state = self._render_state  # type: ignore[attr-defined]
+        matched = [self._match_payload(state, p, labels, x) for p in payloads]  # type: ignore[attr-defined]
+        names = [lbl for lbl, _ in matched[0]]
+        stack = np.array([[vals for _, vals in series] for series in matched], dtype=float)
+
+        def show_at(pos: float) -> None:
+            i = min(int(pos), len(stack) - 2) if len(stack) > 1 else 0
+            frac = pos - i
+            step = stack[i] if frac == 0 else stack[i] + frac * (stack[i + 1] - stack[i])
+            self._apply_series_data(state, list(zip(names, step.tolist())))  # type: ignore[attr-defined]
+
+        positions = np.linspace(0, len(stack) - 1, frames or len(stack))
+        return fig, ax, [lambda p=p: show_at(p) for p in positions]
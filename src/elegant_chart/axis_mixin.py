@@ -1,5 +1,4 @@
 # elegant_chart/axis_mixin.py
-import math
 import textwrap
 from datetime import datetime
 from typing import List, Optional, Sequence, Tuple
@@ -8,70 +7,77 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.lines import Line2D
-from matplotlib.ticker import AutoMinorLocator, FixedFormatter, FixedLocator, FuncFormatter
+from matplotlib.ticker import AutoMinorLocator, FixedFormatter, FixedLocator
 
 from ._logging import logger
+from .formatters import (
+    BatchFormatter,
+    CallableFormatter,
+    CompactFormatter,
+    NormMaxFormatter,
+    PercentFormatter,
+    PlainFormatter,
+    TemplateFormatter,
+)
 from .types import FormatterSpec, YFormatter
 
 
 class AxisMixin:
     def _compact_formatter(self, x: float, pos: int) -> str:
-        if abs(x) >= 1e9:
-            return f"{self._strip_trailing_zeros(x / 1e9)}B"
-        elif abs(x) >= 1e6:
-            return f"{self._strip_trailing_zeros(x / 1e6)}M"
-        elif abs(x) >= 1e3:
-            return f"{self._strip_trailing_zeros(x / 1e3)}K"
-        else:
-            interval = getattr(self, "_y_tick_interval", None)
-            decimals = max(0, -math.floor(math.log10(interval))) if interval else 0
-            formatted = f"{x:.{decimals}f}"
-            if formatted.startswith("-") and float(formatted) == 0:
-                formatted = formatted[1:]
-            return formatted
-
-    @staticmethod
-    def _strip_trailing_zeros(value: float) -> str:
-        return f"{value:.1f}".rstrip("0").rstrip(".")
+        return self._build_formatter(YFormatter.COMPACT)(x, pos)
 
     def _normalize_by_max_formatter(self, x: float, pos: int) -> str:
-        max_y = getattr(self, "_max_y_value", None)
-        decimals = getattr(self, "_norm_max_decimals", 0)
-
-        if max_y is None or max_y == 0:
-            return ""
-
-        value = x / max_y
-        fmt = f"{{:.{decimals}f}}"
-        out = fmt.format(value)
-        return out.rstrip("0").rstrip(".")
+        return self._build_formatter((YFormatter.NORM_MAX, self._norm_max_decimals))(x, pos)
 
     def _build_formatter(
         self, spec: FormatterSpec, default: str = "compact"
-    ) -> FuncFormatter:
+    ) -> BatchFormatter:
+        """Return the (cached) batch formatter for *spec*.
+
+        One formatter object per spec is kept for the chart's lifetime, so
+        its label memo is shared by tick labels, value labels and the
+        custom y-tick label renderers.
+        """
         if spec is None:
             spec = default
 
         if isinstance(spec, tuple) and spec[0] == YFormatter.NORM_MAX:
             self._norm_max_decimals = int(spec[1])
-            return FuncFormatter(self._normalize_by_max_formatter)
+
+        try:
+            cached = self._formatter_cache.get(spec)
+        except TypeError:  # unhashable spec — build, don't cache
+            return self._make_formatter(spec)
+        if cached is None:
+            cached = self._formatter_cache[spec] = self._make_formatter(spec)
+        return cached
+
+    def _make_formatter(self, spec: FormatterSpec) -> BatchFormatter:
+        if isinstance(spec, tuple) and spec[0] == YFormatter.NORM_MAX:
+            return NormMaxFormatter(lambda: getattr(self, "_max_y_value", None), int(spec[1]))
 
         if spec == YFormatter.COMPACT or spec == "compact":
-            return FuncFormatter(self._compact_formatter)
+            return CompactFormatter(lambda: getattr(self, "_y_tick_interval", None))
 
         if spec == YFormatter.PLAIN or spec == "plain":
-            return FuncFormatter(lambda x, pos: f"{x:g}")
+            return PlainFormatter()
 
         if spec == YFormatter.PERCENT or spec == "percent":
-            return FuncFormatter(lambda x, pos: f"{x * 100:g}%")
+            return PercentFormatter()
 
         if isinstance(spec, str):
-            return FuncFormatter(lambda x, pos, fmt=spec: fmt.format(x=x))
+            return TemplateFormatter(spec)
 
         if callable(spec):
-            return FuncFormatter(spec)
+            return CallableFormatter(spec)
 
-        return FuncFormatter(self._compact_formatter)
+        return CompactFormatter(lambda: getattr(self, "_y_tick_interval", None))
+
+    def _format_values(
+        self, values: Sequence[float], spec: FormatterSpec, default: str = "compact"
+    ) -> List[str]:
+        """Format many values at once via ``_build_formatter(spec).format_many``."""
+        return self._build_formatter(spec, default).format_many(values)
 
     def _format_tick_label_width(
         self,
@@ -197,11 +203,11 @@ class AxisMixin:
         Returns the list of created Text artists so callers can measure their
         rendered extent (e.g. to detect overlap with plotted data).
         """
-        formatter = ax.yaxis.get_major_formatter()
         locator = ax.yaxis.get_major_locator()
         ymin, ymax = ax.get_ylim()
         ticks = locator.tick_values(ymin, ymax)
         visible_ticks = [t for t in ticks if ymin <= t <= ymax]
+        labels = self._format_ytick_labels(ax, visible_ticks)
 
         # x is in axes fraction (0=left edge, 1=right edge); y is in data coordinates.
         pad = 0.01
@@ -210,8 +216,7 @@ class AxisMixin:
         transform = ax.get_yaxis_transform()
 
         texts = []
-        for tick_val in visible_ticks:
-            label_str = formatter(tick_val, 0)
+        for tick_val, label_str in zip(visible_ticks, labels):
             texts.append(
                 ax.text(
                     x_pos,
@@ -228,6 +233,14 @@ class AxisMixin:
             )
         return texts
 
+    @staticmethod
+    def _format_ytick_labels(ax: plt.Axes, ticks: Sequence[float]) -> List[str]:
+        """Label *ticks* with the y-axis formatter — in one batch when it supports it."""
+        formatter = ax.yaxis.get_major_formatter()
+        if isinstance(formatter, BatchFormatter):
+            return formatter.format_many(ticks)
+        return [formatter(t, 0) for t in ticks]
+
     def _draw_outside_ytick_labels(
         self,
         ax: plt.Axes,
@@ -248,7 +261,6 @@ class AxisMixin:
         Returns the list of created Text artists so callers (``_auto_expand_right``)
         can shrink the figure margin if the labels would otherwise bleed off-canvas.
         """
-        formatter = ax.yaxis.get_major_formatter()
         locator = ax.yaxis.get_major_locator()
         ymin, ymax = ax.get_ylim()
         ticks = locator.tick_values(ymin, ymax)
@@ -256,7 +268,7 @@ class AxisMixin:
         if not visible_ticks:
             return []
 
-        labels = [formatter(t, 0) for t in visible_ticks]
+        labels = self._format_ytick_labels(ax, visible_ticks)
 
         # x is in axes fraction (0=left edge, 1=right edge); y is in data coordinates.
         x_pos = 1.0 if secondary else 0.0
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
 
 NICE_FRACTIONS = (1, 2, 2.5, 5, 10)
 _EPS = 1e-9
+# Candidate magnitudes tried around the raw interval, as powers of ten.
+_EXP_OFFSETS = (-1, 0, 1, 2)
+# Every candidate as a multiple of the raw interval's magnitude, ascending.
+_NICE_FACTORS = np.array(
+    sorted({round(f * 10.0**o, 12) for o in _EXP_OFFSETS for f in NICE_FRACTIONS})
+)
 
 
 def _magnitude(x: float) -> float:
@@ -15,13 +25,18 @@ def _magnitude(x: float) -> float:
 
 def _nice_candidates(raw_interval: float) -> list[float]:
     """Sorted nice interval candidates spanning a couple of magnitudes around raw_interval."""
-    base_mag = _magnitude(raw_interval)
+    return list(_nice_candidates_for_exponent(math.floor(math.log10(raw_interval))))
+
+
+@lru_cache(maxsize=64)
+def _nice_candidates_for_exponent(exponent: int) -> tuple[float, ...]:
+    base_mag = 10**exponent
     candidates = set()
-    for exp_offset in (-1, 0, 1, 2):
+    for exp_offset in _EXP_OFFSETS:
         mag = base_mag * (10 ** exp_offset)
         for f in NICE_FRACTIONS:
             candidates.add(round(f * mag, 12))
-    return sorted(candidates)
+    return tuple(sorted(candidates))
 
 
 def _floor_to_tick(value: float, interval: float) -> float:
@@ -46,6 +61,30 @@ def calc_y_axis(
     chart_type: str,
     has_top_label: bool = False,
 ) -> dict:
+    """Nice y-axis limits and ticks for a data range.
+
+    Results are memoized on the arguments (see ``_calc_y_axis_cached``);
+    each call returns a fresh dict, so callers may mutate it freely.
+    """
+    y_min, y_max, ticks, interval, zero_baseline = _calc_y_axis_cached(
+        float(data_min), float(data_max), chart_type, bool(has_top_label)
+    )
+    return {
+        "y_min": y_min,
+        "y_max": y_max,
+        "ticks": list(ticks),
+        "tick_interval": interval,
+        "zero_baseline": zero_baseline,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _calc_y_axis_cached(
+    data_min: float,
+    data_max: float,
+    chart_type: str,
+    has_top_label: bool,
+) -> tuple:
     spans_zero = data_min < 0 < data_max
     raw_range = data_max - (0 if chart_type in ("bar", "area") else data_min)
     if raw_range <= 0:
@@ -94,10 +133,138 @@ def calc_y_axis(
         # plot area — see _draw_economist_ytick_labels).
         y_max = _round_clean(y_max + interval)
 
+    return (
+        y_min,
+        y_max,
+        tuple(ticks),
+        _round_clean(interval),
+        any(_approx_eq(t, 0.0, interval) for t in ticks),
+    )
+
+
+def calc_shared_y_axis(
+    mins: Sequence[float],
+    maxs: Sequence[float],
+    chart_type: str,
+    has_top_label: bool = False,
+) -> dict:
+    """One common nice axis covering every ``[mins[i], maxs[i]]`` range.
+
+    For a family of charts that must be read against the same scale (e.g.
+    one chart per airline): pass the result to each chart as
+    ``ElegantChart(y_scale=...)``. NaN entries are ignored.
+    """
+    lo = float(np.nanmin(np.asarray(mins, dtype=float)))
+    hi = float(np.nanmax(np.asarray(maxs, dtype=float)))
+    return calc_y_axis(lo, hi, chart_type, has_top_label=has_top_label)
+
+
+def calc_y_axis_many(
+    mins: Sequence[float],
+    maxs: Sequence[float],
+    chart_type: str,
+    has_top_label: bool = False,
+    shared: bool = False,
+) -> dict:
+    """Vectorized :func:`calc_y_axis` over arrays of data ranges.
+
+    Every range is solved at once: the nice-interval candidates form an
+    ``(n, k)`` matrix and the first candidate giving 4-6 ticks (else the
+    one closest to 5) is picked per row, exactly as in the scalar solver.
+
+    Parameters
+    ----------
+    mins, maxs:
+        Equal-length sequences of data minima / maxima, one per chart.
+    chart_type:
+        As for :func:`calc_y_axis`; applies to every range.
+    has_top_label:
+        As for :func:`calc_y_axis`.
+    shared:
+        ``True`` → solve one common axis over all ranges
+        (:func:`calc_shared_y_axis`) and broadcast it to every entry.
+
+    Returns
+    -------
+    dict
+        ``"y_min"``, ``"y_max"``, ``"tick_interval"`` (float arrays),
+        ``"n_ticks"`` (int array), ``"zero_baseline"`` (bool array) and
+        ``"ticks"`` (list of float arrays), all of length ``len(mins)``.
+    """
+    mins_arr = np.asarray(mins, dtype=float).ravel()
+    maxs_arr = np.asarray(maxs, dtype=float).ravel()
+    if mins_arr.shape != maxs_arr.shape:
+        raise ValueError(
+            f"mins and maxs must have the same length, got {mins_arr.size} and {maxs_arr.size}"
+        )
+    n = mins_arr.size
+
+    if shared and n:
+        one = calc_shared_y_axis(mins_arr, maxs_arr, chart_type, has_top_label)
+        return {
+            "y_min": np.full(n, one["y_min"]),
+            "y_max": np.full(n, one["y_max"]),
+            "tick_interval": np.full(n, one["tick_interval"]),
+            "n_ticks": np.full(n, len(one["ticks"])),
+            "zero_baseline": np.full(n, one["zero_baseline"]),
+            "ticks": [np.array(one["ticks"]) for _ in range(n)],
+        }
+
+    zero_based = chart_type in ("bar", "area")
+    spans_zero = (mins_arr < 0) & (0 < maxs_arr)
+    raw_range = maxs_arr - (0.0 if zero_based else mins_arr)
+    fallback = np.abs(maxs_arr)
+    fallback[fallback == 0] = 1.0
+    raw_range = np.where(raw_range <= 0, fallback, raw_range)
+
+    base_mag = 10.0 ** np.floor(np.log10(raw_range / 5))
+    intervals = np.round(base_mag[:, None] * _NICE_FACTORS[None, :], 12)  # (n, k)
+    tol = _EPS * np.maximum(1.0, intervals)
+    d_min = mins_arr[:, None]
+    d_max = maxs_arr[:, None]
+
+    y_max = np.ceil(d_max / intervals - _EPS) * intervals
+    y_max = np.where(np.abs(y_max - d_max) <= tol, y_max + intervals, y_max)
+
+    if zero_based:
+        y_min = np.zeros_like(intervals)
+    else:
+        floor_min = np.floor(d_min / intervals + _EPS) * intervals
+        floor_min = np.where(np.abs(floor_min - d_min) <= tol, floor_min - intervals, floor_min)
+        snap_zero = (floor_min < 0) & (0 < y_max) & (d_min <= 0.4 * d_max)
+        floor_min = np.where(snap_zero, 0.0, floor_min)
+        spans_min = -np.ceil(-d_min / intervals - _EPS) * intervals
+        y_min = np.where(spans_zero[:, None], spans_min, floor_min)
+
+    n_ticks = np.rint((y_max - y_min) / intervals).astype(int) + 1
+
+    # First candidate with 4-6 ticks; rows with none take the first one
+    # closest to 5 ticks.
+    in_band = (n_ticks >= 4) & (n_ticks <= 6)
+    pick = np.where(
+        in_band.any(axis=1), in_band.argmax(axis=1), np.abs(n_ticks - 5).argmin(axis=1)
+    )
+    rows = np.arange(n)
+    interval = intervals[rows, pick]
+    lo = y_min[rows, pick]
+    count = n_ticks[rows, pick]
+
+    ticks = [np.round(lo[i] + np.arange(count[i]) * interval[i], 10) for i in range(n)]
+    lo_out = np.array([t[0] for t in ticks]) if n else np.zeros(0)
+    hi_out = np.array([t[-1] for t in ticks]) if n else np.zeros(0)
+    if has_top_label:
+        hi_out = np.round(hi_out + interval, 10)
+
+    # Zero is a tick if it lies on the grid within [first, last] tick.
+    k0 = np.rint(-lo / interval)
+    on_grid = np.abs(lo + k0 * interval) <= _EPS * np.maximum(1.0, interval)
+    zero_baseline = (k0 >= 0) & (k0 < count) & on_grid
+
     return {
-        "y_min": y_min,
-        "y_max": y_max,
+        "y_min": lo_out,
+        "y_max": hi_out,
+        "tick_interval": np.round(interval, 10),
+        "n_ticks": count,
+        "zero_baseline": zero_baseline,
         "ticks": ticks,
-        "tick_interval": _round_clean(interval),
-        "zero_baseline": any(_approx_eq(t, 0.0, interval) for t in ticks),
     }
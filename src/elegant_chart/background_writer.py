@@ -0,0 +1,117 @@
+# elegant_chart/background_writer.py
+"""
+A bounded, single-thread queue for output work.
+
+Drawing a figure stays on the caller's thread (matplotlib is not thread-safe);
+what follows it — compressing the rendered pixels, post-processing SVG,
+writing files, writing the xlsx data export — is handed to a
+:class:`BackgroundWriter`, so the caller can start laying out the next chart
+meanwhile. Jobs run in submission order on one thread; Pillow's encoders and
+file I/O release the GIL, so a thread is enough and no pickling of pixels or
+DataFrames is needed.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+from ._logging import logger
+
+
+class BackgroundWriter:
+    """Run output jobs on a background thread, with back-pressure and error hand-back.
+
+    Parameters
+    ----------
+    max_pending:
+        Jobs allowed to wait in the queue. :meth:`submit` blocks while it is
+        full, so at most this many rendered images (plus the one being
+        encoded) are held in memory however far ahead the caller gets.
+
+    A job that raises does not stop the queue; the first error is re-raised
+    on the caller's thread by the next :meth:`submit`, :meth:`flush` or
+    :meth:`close` (any further ones are logged). Leaving a ``with`` block
+    on an exception still waits for the queue, but only logs job errors.
+
+    Example
+    -------
+    ::
+
+        with BackgroundWriter() as writer:
+            chart = ElegantChart(title="Revenue", output_writer=writer)
+            for region, values in regions.items():
+                chart.bar(x=quarters, ys=values, save_path=f"out/{region}.png", show=False)
+        # every file is written once the block exits
+    """
+
+    def __init__(self, max_pending: int = 4) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(max_pending)
+        self._errors: List[BaseException] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue ``fn(*args, **kwargs)``; blocks while ``max_pending`` jobs are waiting."""
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        self._raise_errors()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="elegant-chart-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self) -> None:
+        """Wait until every submitted job has finished; re-raise the first failure."""
+        self._queue.join()
+        self._raise_errors()
+
+    def close(self) -> None:
+        """:meth:`flush`, then stop the thread. Further submits raise ``RuntimeError``."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_errors()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # The block is already raising: finish the queue, but do not let a
+        # job's error replace the exception that is propagating.
+        try:
+            self.close()
+        except BaseException as exc:
+            logger.error("Background write failed: %r", exc)
+
+    def _run(self) -> None:
+        while (job := self._queue.get()) is not None:
+            fn, args, kwargs = job
+            try:
+                fn(*args, **kwargs)
+            except BaseException as exc:  # surfaced on the caller's thread
+                self._errors.append(exc)
+            finally:
+                self._queue.task_done()
+        self._queue.task_done()
+
+    def _raise_errors(self) -> None:
+        if not self._errors:
+            return
+        first, *rest = self._errors
+        self._errors.clear()
+        for exc in rest:
+            logger.error("Background write also failed: %r", exc)
+        raise first
@@ -12,8 +12,7 @@ from ._logging import logger
 from .axis_utils import calc_y_axis
 from .data_mixin import DataMixin
 from .figure_mixin import GRID_LINEWIDTH
-from .style_mixin import LINESPACING
-from .types import FormatterSpec
+from .types import FormatterSpec, SavePath
 
 
 class BarMixin(DataMixin):
@@ -52,7 +51,7 @@ class BarMixin(DataMixin):
         alpha_map: Optional[Dict[str, float]] = None,
         # output
         show: bool = True,
-        save_path: Optional[str] = None,
+        save_path: Optional[SavePath] = None,
         save_dpi: int = 500,
         save_format: Optional[str] = None,
         export_xlsx: bool = True,
@@ -61,6 +60,9 @@ class BarMixin(DataMixin):
     ) -> Tuple[plt.Figure, plt.Axes]:
         """Create a bar chart with categorical, numeric, or datetime x values."""
 
+        # The call as made, replayed by update() when new data needs a fresh layout.
+        render_call = {k: v for k, v in locals().items() if k != "self"}
+
         x, series_list, x_plan, active_xlim = self._prepare_render(
             "bar", x, ys, labels, df, x_col, y_cols,
             xlim, x_minor_ticks, x_upper_pad, align_x_edges,
@@ -110,14 +112,16 @@ class BarMixin(DataMixin):
 
             # ── draw bars ─────────────────────────────────────────────────
             n_series = len(series_list)
-            val_fmt = self._build_formatter(y_formatter if y_formatter is not None else self.y_formatter)  # type: ignore[attr-defined]
+            label_spec = y_formatter if y_formatter is not None else self.y_formatter  # type: ignore[attr-defined]
+            value_label_series = []
+            bar_patches = []
 
             if stacked or n_series == 1:
                 cumulative = np.zeros(len(base_positions))
                 for idx, (lbl, values) in enumerate(series_list):
                     color = self._series_color(idx, lbl)  # type: ignore[attr-defined]
                     alpha = (alpha_map or {}).get(lbl) if lbl is not None else None
-                    ax.bar(
+                    container = ax.bar(
                         base_positions,
                         values,
                         bottom=cumulative if stacked else None,
@@ -128,16 +132,11 @@ class BarMixin(DataMixin):
                         zorder=2,
                         align="center",
                     )
+                    bar_patches.append(list(container.patches))
                     if show_value_labels:
-                        for pos, v, cum in zip(base_positions, values, cumulative):
-                            bar_top = float(v) + float(cum) if stacked else float(v)
-                            ax.text(
-                                float(pos), bar_top, val_fmt(float(v), 0),
-                                ha="center", va="bottom",
-                                fontsize=self._ts("value_label"),  # type: ignore[attr-defined]
-                                color=self.color_text_main,  # type: ignore[attr-defined]
-                                zorder=6,
-                            )
+                        bar_tops = np.asarray(values, dtype=float) + (cumulative if stacked else 0.0)
+                        texts = self._format_values(values, label_spec)  # type: ignore[attr-defined]
+                        value_label_series.append((base_positions, bar_tops, texts, values))
                     if stacked:
                         cumulative += np.array(values, dtype=float)
 
@@ -150,7 +149,7 @@ class BarMixin(DataMixin):
                     offset = offset_start + idx * single_width
                     color = self._series_color(idx, lbl)  # type: ignore[attr-defined]
                     alpha = (alpha_map or {}).get(lbl) if lbl is not None else None
-                    ax.bar(
+                    container = ax.bar(
                         base_positions + offset,
                         values,
                         width=single_width,
@@ -160,15 +159,10 @@ class BarMixin(DataMixin):
                         zorder=2,
                         align="center",
                     )
+                    bar_patches.append(list(container.patches))
                     if show_value_labels:
-                        for pos, v in zip(base_positions, values):
-                            ax.text(
-                                float(pos) + offset, float(v), val_fmt(float(v), 0),
-                                ha="center", va="bottom",
-                                fontsize=self._ts("value_label"),  # type: ignore[attr-defined]
-                                color=self.color_text_main,  # type: ignore[attr-defined]
-                                zorder=6,
-                            )
+                        texts = self._format_values(values, label_spec)  # type: ignore[attr-defined]
+                        value_label_series.append((base_positions + offset, values, texts, values))
 
             # ── axis limits ───────────────────────────────────────────────
             if stacked:
@@ -218,9 +212,13 @@ class BarMixin(DataMixin):
                     self._x_data_bounds = (_xlo, _xhi)  # type: ignore[attr-defined]
                 ax.set_xlim(_xlo, _xhi)
 
+            value_label_texts, value_label_index = self._draw_value_labels(  # type: ignore[attr-defined]
+                ax, value_label_series, return_index=True
+            )
+
             # ── finalize + output ─────────────────────────────────────────
             has_legend = self._should_show_legend(series_list)
-            self._finalize_and_output(
+            ytick_texts = self._finalize_and_output(
                 fig, ax,
                 rotation=rotation,
                 has_legend=has_legend,
@@ -230,8 +228,17 @@ class BarMixin(DataMixin):
                 show=show,
                 export_xlsx=export_xlsx,
                 export_xlsx_path=export_xlsx_path,
+                value_label_texts=value_label_texts,
                 **save_kwargs,
             )
+            self._record_render(  # type: ignore[attr-defined]
+                fig, ax, "bar", bar_patches, value_label_texts, value_label_index, len(x),
+                label_spec,
+                stacked=stacked,
+                ytick_texts=ytick_texts,
+                y_range=(0.0, data_y_max),
+                render_call=render_call,
+            )
 
             return fig, ax
 
@@ -252,7 +259,7 @@ class BarMixin(DataMixin):
         alpha_map: Optional[Dict[str, float]],
         y_tick_logos: Optional[Dict[str, str]] = None,
         show: bool,
-        save_path: Optional[str],
+        save_path: Optional[SavePath],
         save_dpi: int,
         save_format: Optional[str],
         export_xlsx: bool,
@@ -272,7 +279,7 @@ class BarMixin(DataMixin):
         effective_bar_width = bar_width if bar_width is not None else self._auto_bar_width(x_plan, len(x))
         base_positions = x_plan.positions
         n_series = len(series_list)
-        val_fmt = self._build_formatter(y_formatter if y_formatter is not None else self.y_formatter)  # type: ignore[attr-defined]
+        label_spec = y_formatter if y_formatter is not None else self.y_formatter  # type: ignore[attr-defined]
         icon_size_pt = self._ts("tick_label") * 1.6  # type: ignore[attr-defined]
         gap_pt = self._px(3)  # type: ignore[attr-defined]
         logo_pad_pt = (icon_size_pt + gap_pt) if y_tick_logos else 0.0
@@ -284,6 +291,7 @@ class BarMixin(DataMixin):
 
             single_width = effective_bar_width / n_series
             offset_start = -effective_bar_width / 2 + single_width / 2
+            value_label_series = []
 
             for idx, (lbl, values) in enumerate(series_list):
                 offset = offset_start + idx * single_width
@@ -295,17 +303,8 @@ class BarMixin(DataMixin):
                     label=lbl, color=color, alpha=alpha, zorder=2, align="center",
                 )
                 if show_value_labels:
-                    for pos, v in zip(base_positions, values):
-                        ax.annotate(
-                            val_fmt(float(v), 0),
-                            xy=(float(v), float(pos) + offset),
-                            xytext=(self._px(3), 0),  # type: ignore[attr-defined]
-                            textcoords="offset points",
-                            ha="left", va="center",
-                            fontsize=self._ts("value_label"),  # type: ignore[attr-defined]
-                            color=self.color_text_main,  # type: ignore[attr-defined]
-                            zorder=6,
-                        )
+                    texts = self._format_values(values, label_spec)  # type: ignore[attr-defined]
+                    value_label_series.append((values, base_positions + offset, texts, values))
 
             data_x_max = float(
                 max(np.asarray(values, dtype=float).max() for _, values in series_list)
@@ -315,7 +314,9 @@ class BarMixin(DataMixin):
             elif self.ylim is not None:  # type: ignore[attr-defined]
                 ax.set_xlim(self.ylim)  # type: ignore[attr-defined]
             else:
-                result = calc_y_axis(0.0, data_x_max, "bar", has_top_label=show_value_labels)
+                result = self.y_scale or calc_y_axis(  # type: ignore[attr-defined]
+                    0.0, data_x_max, "bar", has_top_label=show_value_labels
+                )
                 ax.set_xlim(result["y_min"], result["y_max"])
                 ax.set_xticks(result["ticks"])
 
@@ -332,6 +333,9 @@ class BarMixin(DataMixin):
             ax.set_yticklabels(category_labels, fontsize=self._ts("tick_label"), color=self.color_tick)  # type: ignore[attr-defined]
             ax.tick_params(axis="y", which="both", length=0, pad=self._px(6) + logo_pad_pt)  # type: ignore[attr-defined]
             ax.set_ylim(base_positions.max() + 0.5, base_positions.min() - 0.5)  # first item on top
+            value_label_texts = self._draw_value_labels(  # type: ignore[attr-defined]
+                ax, value_label_series, offset=(self._px(3), 0), ha="left", va="center", along=1  # type: ignore[attr-defined]
+            )
 
             # ── baseline spine ───────────────────────────────────────────
             for spine in ax.spines.values():
@@ -346,22 +350,7 @@ class BarMixin(DataMixin):
             # is auto-expanded below to fit long category labels, which would
             # otherwise drag axes-anchored title/subtitle text off the right
             # edge of the figure.
-            axes_height = 0.7116 - 0.1266
-            if self.title:  # type: ignore[attr-defined]
-                fig.text(
-                    0.04, 0.1266 + 1.234 * axes_height, self.title,  # type: ignore[attr-defined]
-                    fontsize=self._ts("title"),  # type: ignore[attr-defined]
-                    va="bottom", ha="left", color=self.color_title,  # type: ignore[attr-defined]
-                    fontfamily=self.font_title_family, fontweight=self.font_title_weight,  # type: ignore[attr-defined]
-                    linespacing=LINESPACING, clip_on=False,
-                )
-            if self.subtitle:  # type: ignore[attr-defined]
-                fig.text(
-                    0.04, 0.1266 + 1.220 * axes_height, self.subtitle,  # type: ignore[attr-defined]
-                    fontsize=self._ts("subtitle"),  # type: ignore[attr-defined]
-                    va="top", ha="left", color=self.color_subtitle,  # type: ignore[attr-defined]
-                    fontfamily=self.font_main_family, linespacing=LINESPACING, clip_on=False,  # type: ignore[attr-defined]
-                )
+            self._draw_title_stack(fig)  # type: ignore[attr-defined]
             if self.xlabel:  # type: ignore[attr-defined]
                 ax.set_xlabel(self.xlabel, color=self.color_axes_label, fontsize=self._ts("axis_label"))  # type: ignore[attr-defined]
             if self.ylabel:  # type: ignore[attr-defined]
@@ -390,6 +379,7 @@ class BarMixin(DataMixin):
             extra_reserve = logo_pad_pt / 72.0 / fig.get_size_inches()[0]
             self._auto_expand_left(ax, extra_reserve=extra_reserve)  # type: ignore[attr-defined]
             self._auto_expand_right(ax, ax.get_xticklabels())  # type: ignore[attr-defined]
+            self._resolve_label_collisions(ax, value_label_texts)  # type: ignore[attr-defined]
 
             if y_tick_logos:
                 self._add_y_tick_logos(ax, base_positions, x, y_tick_logos, icon_size_pt, gap_pt)  # type: ignore[attr-defined]
@@ -398,18 +388,7 @@ class BarMixin(DataMixin):
                 self.save_figure(fig, save_path, dpi=save_dpi, fmt=save_format, **save_kwargs)  # type: ignore[attr-defined]
                 logger.info("Saved chart -> %s", save_path)
                 if export_xlsx:
-                    import os  # noqa: PLC0415
-                    target = export_xlsx_path or os.path.join(
-                        os.path.dirname(str(save_path)) or ".", "chart_data.xlsx"
-                    )
-                    try:
-                        self.export_data(target)  # type: ignore[attr-defined]
-                        logger.info("Exported chart data -> %s", target)
-                    except ImportError:
-                        logger.warning(
-                            "Skipped chart_data.xlsx export: openpyxl is not installed "
-                            "(install with `pip install openpyxl`)."
-                        )
+                    self._export_after_save(save_path, export_xlsx_path)
 
             if show:
                 plt.show()
@@ -0,0 +1,287 @@
+# elegant_chart/bar_race_mixin.py
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import animation
+from matplotlib.offsetbox import AnnotationBbox, OffsetImage
+from matplotlib.patches import Rectangle
+
+from ._logging import logger
+from .rank_utils import race_frames
+from .types import FormatterSpec
+
+
+class BarRaceMixin:
+    def bar_race(
+        self,
+        save_path: str,
+        x: Sequence[Any],
+        ys: Dict[str, Sequence[Optional[float]]],
+        top_n: int = 10,
+        ties: str = "first",
+        steps_per_period: int = 10,
+        fps: float = 20.0,
+        dpi: int = 150,
+        hold: float = 1.5,
+        show_value_labels: bool = True,
+        y_formatter: Optional[FormatterSpec] = None,
+        label_logos: Optional[Dict[str, str]] = None,
+        label_display: Optional[Dict[str, str]] = None,
+        show_period: bool = True,
+        writer: Optional[Union[str, animation.AbstractMovieWriter]] = None,
+    ) -> Tuple[plt.Figure, plt.Axes]:
+        """Write a bar-chart race (GIF / MP4) of a ranking over time.
+
+        Takes the same ``{series: [value per period]}`` input as
+        :meth:`~.bump_mixin.BumpMixin.bump`. The frame is one horizontal
+        :meth:`~.bar_mixin.BarMixin.bar` render (theme, title stack, footer,
+        category and logo margins); each series then gets one bar, name
+        label, logo and value label that are moved — never recreated — as
+        ranks and values are interpolated between periods, and blitted over
+        the cached frame. The value axis rescales to the leading bar every
+        frame, so it is not drawn; the value labels carry the numbers.
+
+        Parameters
+        ----------
+        save_path:
+            Output file; writer chosen as for
+            :meth:`~.animation_mixin.AnimationMixin.animate_line`.
+        x:
+            Ordered period labels.
+        ys:
+            ``{series_label: [value_at_period_0, …]}``; ``None`` / NaN where a
+            series is absent. Values must be >= 0.
+        top_n:
+            Bars shown; series that never reach the top ``top_n`` are dropped.
+        ties:
+            Tie-breaking, see :func:`~.rank_utils.rank_columns`.
+        steps_per_period:
+            Frames per period transition.
+        fps, dpi, hold, writer:
+            As for :meth:`~.animation_mixin.AnimationMixin.animate_line`.
+        show_value_labels:
+            Draw the (interpolated) value at the end of each bar.
+        y_formatter:
+            Value-label formatter spec (default: the chart's ``y_formatter``).
+        label_logos:
+            ``{series: image_path}`` logos drawn between each name and its bar.
+        label_display:
+            ``{series: display_text}`` name overrides.
+        show_period:
+            Stamp the current period label in the lower-right corner.
+
+        Returns
+        -------
+        (fig, ax) of the final frame.
+        """
+        if steps_per_period < 1:
+            raise ValueError(f"steps_per_period must be >= 1, got {steps_per_period}")
+        if fps <= 0:
+            raise ValueError(f"fps must be > 0, got {fps}")
+        movie_writer = self._resolve_movie_writer(save_path, writer, fps)  # type: ignore[attr-defined]
+        plan = self._prepare_bump(x, ys, False, False, ties, top_n)  # type: ignore[attr-defined]
+        values = np.array([ys[lbl] for lbl in plan.labels], dtype=float).reshape(plan.ranks.shape)
+        if np.nanmin(values, initial=0.0) < 0:
+            raise ValueError("bar_race() values must be >= 0")
+
+        n_slots = plan.n_ranks
+        t, frame_values, frame_ranks = race_frames(
+            values, plan.ranks, steps_per_period, off_rank=n_slots + 1
+        )
+        displays = [(label_display or {}).get(lbl, lbl) for lbl in plan.labels]
+        logger.info(
+            "Rendering bar race: %d series, %d periods, %d frames",
+            len(plan.labels),
+            len(plan.x),
+            len(t),
+        )
+
+        fig, ax, race = self._build_race_frame(
+            plan,
+            displays,
+            n_slots,
+            float(np.nanmax(values)),
+            show_value_labels,
+            y_formatter,
+            label_logos,
+        )
+        periods = [str(p) for p in plan.x]
+        label_spec = y_formatter if y_formatter is not None else self.y_formatter  # type: ignore[attr-defined]
+        if not show_period:
+            race["period"].set_visible(False)
+
+        def show_frame(k: int) -> None:
+            self._move_race_artists(
+                ax, race, frame_values[:, k], frame_ranks[:, k], n_slots, label_spec
+            )
+            race["period"].set_text(periods[int(round(t[k]))])
+
+        artists = [a for key in ("bars", "names", "logos", "values") for a in race[key]]
+        self._write_animation(  # type: ignore[attr-defined]
+            fig,
+            artists + [race["period"]],
+            [lambda k=k: show_frame(k) for k in range(len(t))],
+            save_path,
+            movie_writer,
+            fps,
+            dpi,
+            hold,
+        )
+        # The bar() frame's recorded artists were replaced; nothing to update().
+        self._render_state = None  # type: ignore[attr-defined]
+        return fig, ax
+
+    # ── bar-race stages ───────────────────────────────────────────────────
+
+    def _build_race_frame(
+        self,
+        plan: Any,
+        displays: List[str],
+        n_slots: int,
+        data_max: float,
+        show_value_labels: bool,
+        y_formatter: Optional[FormatterSpec],
+        label_logos: Optional[Dict[str, str]],
+    ) -> Tuple[plt.Figure, plt.Axes, Dict[str, Any]]:
+        """Lay out the frame with ``bar(horizontal=True)``, then pool one artist set per series."""
+        # The widest names size the category margin. Empty logo paths make the
+        # renderer reserve the logo column without drawing per-slot icons.
+        slot_names = sorted(displays, key=len, reverse=True)[:n_slots]
+        fig, ax = self.bar(  # type: ignore[attr-defined]
+            x=slot_names,
+            ys=[data_max] * len(slot_names),
+            horizontal=True,
+            show_value_labels=show_value_labels,
+            y_formatter=y_formatter,
+            y_tick_logos={name: "" for name in slot_names} if label_logos else None,
+            show=False,
+            export_xlsx=False,
+        )
+        slot_pos = np.asarray(ax.get_yticks(), dtype=float)
+        height = ax.patches[0].get_height()
+        for artist in [*ax.patches, *ax.texts]:
+            artist.remove()
+        ax.tick_params(axis="y", labelleft=False)
+        # The value axis is rescaled every frame but the frame is captured
+        # once: no value-axis ticks, gridlines or spines, so nothing in the
+        # cached layer can fall out of step with the bars (the value labels
+        # carry the numbers).
+        ax.xaxis.set_visible(False)
+        ax.grid(False, axis="x")
+        for side in ("top", "bottom"):
+            ax.spines[side].set_visible(False)
+
+        icon_pt = self._ts("tick_label") * 1.6  # type: ignore[attr-defined]
+        gap_pt = self._px(3)  # type: ignore[attr-defined]
+        name_pad = self._px(6) + ((icon_pt + gap_pt) if label_logos else 0.0)  # type: ignore[attr-defined]
+        row_axis = ax.get_yaxis_transform()
+        race: Dict[str, Any] = {
+            "slot0": float(slot_pos[0]),
+            "pitch": float(slot_pos[1] - slot_pos[0]) if len(slot_pos) > 1 else 1.0,
+            "height": height,
+            "x_ratio": ax.get_xlim()[1] / data_max if data_max > 0 else 1.0,
+            "bars": [],
+            "names": [],
+            "logos": [],
+            "logo_rows": [],
+            "values": [],
+        }
+        for row, (lbl, text) in enumerate(zip(plan.labels, displays)):
+            color = self._series_color(int(plan.series_idx[row]), lbl)  # type: ignore[attr-defined]
+            race["bars"].append(
+                ax.add_patch(Rectangle((0.0, 0.0), 0.0, height, color=color, zorder=2))
+            )
+            race["names"].append(
+                ax.annotate(
+                    text,
+                    xy=(0.0, 0.0),
+                    xycoords=row_axis,
+                    xytext=(-name_pad, 0),
+                    textcoords="offset points",
+                    ha="right",
+                    va="center",
+                    fontsize=self._ts("tick_label"),
+                    color=self.color_tick,  # type: ignore[attr-defined]
+                    annotation_clip=False,
+                )
+            )
+            logo_path = (label_logos or {}).get(lbl, "")
+            if logo_path and os.path.exists(logo_path):
+                img = plt.imread(logo_path)
+                race["logo_rows"].append(row)
+                race["logos"].append(
+                    ax.add_artist(
+                        AnnotationBbox(
+                            OffsetImage(img, zoom=icon_pt / max(img.shape[:2])),
+                            (0.0, 0.0),
+                            xycoords=row_axis,
+                            xybox=(-(self._px(6) + icon_pt / 2.0), 0),  # type: ignore[attr-defined]
+                            boxcoords="offset points",
+                            frameon=False,
+                            pad=0.0,
+                            annotation_clip=False,
+                        )
+                    )
+                )
+            if show_value_labels:
+                race["values"].append(
+                    ax.annotate(
+                        "",
+                        xy=(0.0, 0.0),
+                        xytext=(self._px(3), 0),  # type: ignore[attr-defined]
+                        textcoords="offset points",
+                        ha="left",
+                        va="center",
+                        fontsize=self._ts("value_label"),
+                        color=self.color_text_main,  # type: ignore[attr-defined]
+                        zorder=6,
+                    )
+                )
+        race["period"] = ax.text(
+            0.98,
+            0.03,
+            "",
+            transform=ax.transAxes,
+            ha="right",
+            va="bottom",
+            fontsize=self._ts("title") * 1.5,
+            color=self.color_annotation,  # type: ignore[attr-defined]
+            fontweight="bold",
+            zorder=1,
+        )
+        return fig, ax, race
+
+    def _move_race_artists(
+        self,
+        ax: plt.Axes,
+        race: Dict[str, Any],
+        values: np.ndarray,
+        ranks: np.ndarray,
+        n_slots: int,
+        label_spec: Optional[FormatterSpec],
+    ) -> None:
+        """Place every pooled artist for one frame and rescale the value axis."""
+        y = race["slot0"] + (ranks - 1.0) * race["pitch"]
+        shown = ranks < n_slots + 0.5
+        top = float(values[shown].max()) if shown.any() else 0.0
+        ax.set_xlim(0.0, (top if top > 0 else 1.0) * race["x_ratio"])
+
+        half = race["height"] / 2.0
+        for bar, name, yy, v, on in zip(race["bars"], race["names"], y, values, shown):
+            bar.set_y(yy - half)
+            bar.set_width(v)
+            name.xy = (0.0, yy)
+            name.set_visible(bool(on))
+        for logo, row in zip(race["logos"], race["logo_rows"]):
+            logo.xy = (0.0, y[row])
+            logo.set_visible(bool(shown[row]))
+        if race["values"]:
+            texts = self._format_values(values, label_spec)  # type: ignore[attr-defined]
+            for label, text, yy, v, on in zip(race["values"], texts, y, values, shown):
+                label.set_text(text)
+                label.xy = (v, yy)
+                label.set_visible(bool(on and v > 0))
@@ -11,6 +11,9 @@ Attribute contract (mixins may read, only __init__ writes)
 Presentation
     title, subtitle, xlabel, ylabel, caption  — str | None
     annotations — list[dict] (sparse muted-grey in-plot callouts; see FigureMixin._draw_annotations)
+    avoid_label_overlap — bool  (default True; nudge or hide colliding value
+                  labels, annotations and bump end labels — see
+                  FigureMixin._resolve_label_collisions)
     figsize    — (float, float)
     theme      — str
     color_map  — dict[str, str]  (series label -> role name or hex; optional
@@ -25,6 +28,10 @@ Axis / tick
     auto_x_thinning              — bool
     y_formatter                  — FormatterSpec
     xlim, ylim                   — (float, float) | None
+    y_scale                      — dict | None  (a precomputed calc_y_axis
+                                    result — e.g. from calc_shared_y_axis — used
+                                    instead of solving the value axis per chart;
+                                    an explicit ylim still wins)
     x_minor_ticks                — int | None  (minor ticks per major interval;
                                     1 == a single midpoint tick, e.g. mid-year)
     x_date_format                — str | None  (strftime format, e.g. "%Y", for
@@ -51,6 +58,24 @@ Logo / footer
     (absolute, ``~``-relative, or relative to the working directory) to use a
     different image, or "" to disable the logo entirely.
 
+Output
+    save_workers                 — int | None  (encoder threads when save_path
+                                    lists several targets; None == one per
+                                    raster target, capped at the CPU count.
+                                    See outputs.write_outputs)
+    output_writer                — BackgroundWriter | None  (when set, saves and
+                                    data exports only draw on the calling
+                                    thread; encoding and file writes queue on
+                                    this writer. See FigureMixin.flush_outputs)
+    export_format                — str  ("xlsx" | "csv" | "parquet"; format of the
+                                    chart_data.* export written next to a save)
+    export_workbook              — ExportWorkbook | None  (when set, every data
+                                    export becomes a sheet of this one
+                                    workbook instead of its own file)
+    output_cache                 — OutputCache | None  (content-addressed store of
+                                    rendered files consulted by
+                                    CacheMixin.render_cached)
+
 Internal (set once by _apply_base_style)
     _rc                          — dict[str, Any]   (matplotlib rcParams overlay)
     palette                      — list[str]
@@ -64,9 +89,30 @@ Norm-max formatter scratch
     _max_y_value                 — float | None
     _norm_max_decimals           — int
 
+Formatter cache (see AxisMixin._build_formatter)
+    _formatter_cache             — dict[FormatterSpec, BatchFormatter]
+
 Last-render cache (written by bar/line, read by export_data)
     _last_x                      — list | None
     _last_series_list            — list[tuple[str|None, list[float]]] | None
+    _render_state                — RenderState | None  (data artists of the last
+                                    line() / vertical bar(), plus its cached
+                                    static layer; read by LiveMixin.update / blit. Reset
+                                    by every other render)
+    _last_outputs                — list[OutputTarget]  (files written by the last
+                                    save, with sizes and encode times; read
+                                    through FigureMixin.last_outputs)
+    _stream                      — StreamState | None  (ring buffer and shifting-
+                                    axis state of LiveMixin.stream / append)
+    _plot_labels                 — (list, list[(float, float)]) | None  (in-plot
+                                    annotation artists of the last
+                                    _finalize_axes and the pre-placement
+                                    offsets of its annotations + value labels;
+                                    read by _record_render)
+    _prep_memo                   — dict | None  (geometry-independent prep —
+                                    normalised series, x plan, bump plan —
+                                    shared across one VariantsMixin.size_variants
+                                    batch; None outside it)
 
 Last-render x-axis state (written by bar/line, read by AxisMixin/FigureMixin
 during _finalize_axes)
@@ -81,14 +127,26 @@ during _finalize_axes)
 
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+from .background_writer import BackgroundWriter
+from .data_export import ExportWorkbook, export_format_for
+from .output_cache import OutputCache
 from .types import FormatterSpec
 
 # Design reference size (inches) — _figure_scale == 1.0 here; all font/geometry specs are
 # authored at this canvas size and scale proportionally when figsize differs.
 REFERENCE_FIGSIZE: Tuple[float, float] = (3.6, 4.5)
 
+# Social-format canvases (inches), all 1080 px on the short side at the default
+# 500 DPI; used by VariantsMixin.size_variants.
+FIGSIZE_PRESETS: Dict[str, Tuple[float, float]] = {
+    "feed": (2.16, 2.70),  # 4:5, the default figsize
+    "square": (2.16, 2.16),  # 1:1
+    "landscape": (3.84, 2.16),  # 16:9
+    "story": (2.16, 3.84),  # 9:16
+}
+
 
 class ChartBase:
     """Defines and initialises every attribute consumed by the mixins."""
@@ -113,6 +171,7 @@ class ChartBase:
         y_formatter: FormatterSpec = "compact",
         xlim: Optional[Tuple[float, float]] = None,
         ylim: Optional[Tuple[float, float]] = None,
+        y_scale: Optional[dict[str, Any]] = None,
         x_minor_ticks: Optional[int] = None,
         x_date_format: Optional[str] = None,
         x_upper_pad: Optional[float] = None,
@@ -127,6 +186,12 @@ class ChartBase:
         show_y_axis: bool = True,
         show_y_spine: bool = False,
         annotations: Optional[list[dict[str, Any]]] = None,
+        avoid_label_overlap: bool = True,
+        save_workers: Optional[int] = None,
+        output_writer: Optional[BackgroundWriter] = None,
+        export_format: str = "xlsx",
+        export_workbook: Optional[ExportWorkbook] = None,
+        output_cache: Optional[OutputCache] = None,
     ) -> None:
         # ── presentation ──────────────────────────────────────────────────
         self.title = title
@@ -135,6 +200,7 @@ class ChartBase:
         self.ylabel = ylabel
         self.caption = caption
         self.annotations = annotations or []
+        self.avoid_label_overlap = avoid_label_overlap
         self.figsize = figsize
         # Proportional scale relative to the reference design size.
         # 1.0 at the default figsize; grows / shrinks linearly with figure size.
@@ -157,6 +223,7 @@ class ChartBase:
 
         self.xlim = xlim
         self.ylim = ylim
+        self.y_scale = y_scale
 
         self.x_minor_ticks = x_minor_ticks
         self.x_date_format = x_date_format
@@ -174,14 +241,27 @@ class ChartBase:
         self.show_y_axis = show_y_axis
         self.show_y_spine = show_y_spine
 
+        # ── output ─────────────────────────────────────────────────────────
+        self.save_workers = save_workers
+        self.output_writer = output_writer
+        self.export_format = export_format_for("", export_format)
+        self.export_workbook = export_workbook
+        self.output_cache = output_cache
+
         # ── internal / scratch ────────────────────────────────────────────
         self._max_y_value: Optional[float] = None
         self._norm_max_decimals: int = 0
+        self._formatter_cache: dict = {}
         self._rc: dict = {}
 
         # ── last-render cache (populated by bar/line, read by export_data) ─
         self._last_x: Optional[list] = None
         self._last_series_list: Optional[list] = None
+        self._render_state: Optional[Any] = None
+        self._last_outputs: list = []
+        self._stream: Optional[Any] = None
+        self._plot_labels: Optional[tuple] = None
+        self._prep_memo: Optional[dict] = None
 
         # ── last-render x-axis state (populated by bar/line, read by
         # AxisMixin/FigureMixin during _finalize_axes) ─────────────────────
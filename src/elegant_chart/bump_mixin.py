@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import rc_context
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 
 from ._logging import logger
 from .data_mixin import DataMixin
 from .figure_mixin import GRID_LINEWIDTH
-from .style_mixin import LINESPACING
+from .rank_utils import TIE_METHODS, rank_columns, window_ranks
+from .types import SavePath
 
 _GHOST_COLOR = "#BBBBBB"
 _GHOST_ALPHA = 0.6
@@ -20,6 +23,25 @@ _HERO_LW_PT = 2.5
 _HERO_DOT_PT = 10.0  # markersize = diameter in points
 
 
+class BumpPlan(NamedTuple):
+    """Resolved bump-chart data: the ranked (and optionally top-N culled) series."""
+
+    x: List[Any]
+    labels: List[str]
+    # Original ``ys`` position of each surviving row — the palette index.
+    series_idx: np.ndarray
+    ranks: np.ndarray
+    # ``ranks`` with out-of-window cells NaN and exit/entry stubs pinned
+    # just below the window; identical to ``ranks`` without ``top_n``.
+    display: np.ndarray
+    # Cells where the series is present at all.
+    valid: np.ndarray
+    # Cells drawn with a dot / eligible for the label: the in-window ranks.
+    inside: np.ndarray
+    n_ranks: int
+    n_series_total: int
+
+
 class BumpMixin(DataMixin):
     """Adds a bump() (ranking-flow) chart to ElegantChart.
 
@@ -33,7 +55,9 @@ class BumpMixin(DataMixin):
         x: Sequence[Any],
         ys: Dict[str, Sequence[Optional[float]]],
         ascending: bool = False,
-        pre_ranked: bool = False,
+        pre_ranked: Union[bool, np.ndarray, Sequence[Sequence[float]]] = False,
+        ties: str = "first",
+        top_n: Optional[int] = None,
         # ── hero / ghost styling ──────────────────────────────────────────
         highlight: Optional[List[str]] = None,
         highlight_colors: Optional[Dict[str, str]] = None,
@@ -47,7 +71,7 @@ class BumpMixin(DataMixin):
         label_display: Optional[Dict[str, str]] = None,
         # ── output ───────────────────────────────────────────────────────
         show: bool = True,
-        save_path: Optional[str] = None,
+        save_path: Optional[SavePath] = None,
         save_dpi: int = 500,
         save_format: Optional[str] = None,
         export_xlsx: bool = True,
@@ -61,12 +85,26 @@ class BumpMixin(DataMixin):
         x:
             Ordered period labels, e.g. ``[2020, 2021, 2022, 2023]``.
         ys:
-            ``{series_label: [value_at_period_0, …]}``. Use ``None`` or
-            ``float("nan")`` for periods where a series is absent.
+            ``{series_label: [value_at_period_0, …]}`` (lists or numpy
+            arrays). Use ``None`` or ``float("nan")`` for periods where a
+            series is absent. Every series must have one value per period.
         ascending:
             ``True`` → smallest value = rank 1. Default ``False`` (largest = rank 1).
         pre_ranked:
             ``True`` → *ys* values are already rank integers; skip ranking.
+            May also be an ``(n_series, n_periods)`` array of ranks (rows in
+            *ys* order, NaN where absent), used as-is — *ys* then only
+            supplies the series names and the exported values.
+        ties:
+            Tie-breaking for equal values within a period — ``"first"``
+            (default, input order), ``"min"``, ``"max"``, ``"dense"`` or
+            ``"average"``. See :func:`~.rank_utils.rank_columns`.
+        top_n:
+            Show only ranks ``1..top_n``. Series that never enter that window
+            are dropped before anything is drawn; series that leave or join
+            it mid-chart get a short stub clipped at the window's lower edge
+            (see :func:`~.rank_utils.window_ranks`) and are labelled at their
+            last in-window point. ``None`` (default) shows every rank.
         highlight:
             Names of "hero" series. Heroes get a thick coloured line and a
             filled dot. Unlisted series become thin grey ghosts with no dot.
@@ -94,227 +132,51 @@ class BumpMixin(DataMixin):
         show, save_path, save_dpi, save_format, export_xlsx, export_xlsx_path:
             Standard output parameters (same semantics as ``bar()`` / ``line()``).
         """
-        if not ys:
-            raise ValueError("bump() requires at least one series in 'ys'.")
-
-        series_data: list[tuple[str, list]] = list(ys.items())
-        n_series = len(series_data)
-        n_periods = len(x)
-        x_positions = np.arange(n_periods, dtype=float)
-        hero_set: set[str] = (
-            set(highlight) if highlight is not None else {lbl for lbl, _ in series_data}
-        )
+        plan = self._prepare_bump(x, ys, ascending, pre_ranked, ties, top_n)
+        hero_set: set[str] = set(highlight) if highlight is not None else set(plan.labels)
         hcolors: Dict[str, str] = highlight_colors or {}
-
-        # ── value matrix → rank matrix ─────────────────────────────────────
-        values_matrix = np.full((n_series, n_periods), np.nan)
-        for i, (_, vals) in enumerate(series_data):
-            for j, v in enumerate(vals):
-                if v is not None and not (isinstance(v, float) and np.isnan(v)):
-                    values_matrix[i, j] = float(v)
-
-        if pre_ranked:
-            ranks_matrix = values_matrix.copy()
-        else:
-            ranks_matrix = np.full_like(values_matrix, np.nan)
-            for j in range(n_periods):
-                col = values_matrix[:, j]
-                valid_mask = ~np.isnan(col)
-                if not valid_mask.any():
-                    continue
-                order = np.argsort(col[valid_mask]) if ascending else np.argsort(-col[valid_mask])
-                valid_indices = np.where(valid_mask)[0]
-                for rank, arr_idx in enumerate(order):
-                    ranks_matrix[valid_indices[arr_idx], j] = rank + 1
-
-        n_ranks = int(np.nanmax(ranks_matrix)) if not np.all(np.isnan(ranks_matrix)) else n_series
-
-        # cache for export_data
-        self._last_x = list(x)  # type: ignore[attr-defined]
-        self._last_series_list = [(lbl, list(vals)) for lbl, vals in series_data]  # type: ignore[attr-defined]
+        hero_rows = [i for i, lbl in enumerate(plan.labels) if lbl in hero_set]
+        ghost_rows = [i for i, lbl in enumerate(plan.labels) if lbl not in hero_set]
 
         eff_hero_lw = hero_linewidth if hero_linewidth is not None else self._px(_HERO_LW_PT)  # type: ignore[attr-defined]
         eff_other_lw = other_linewidth if other_linewidth is not None else self._px(_GHOST_LW_PT)  # type: ignore[attr-defined]
-        dot_ms = self._px(_HERO_DOT_PT)  # type: ignore[attr-defined]
-
-        # right-margin label space (in data units) for series surviving to final period
-        label_x_units = 1.5 if show_labels else 0.0
-        x_lo = -0.5
-        x_hi = n_periods - 1 + 0.5 + label_x_units
 
         with rc_context(self._rc):  # type: ignore[attr-defined]
             fig, ax = self._init_figure_and_axes()  # type: ignore[attr-defined]
             ax.grid(False)
 
-            # ── rank reference lines (span data area only) ─────────────────
-            for r in range(1, n_ranks + 1):
-                ax.plot(
-                    [-0.35, n_periods - 1 + 0.35],
-                    [r, r],
-                    color=self.grid_color,
-                    linewidth=self._px(GRID_LINEWIDTH),  # type: ignore[attr-defined]
-                    alpha=0.9,
-                    zorder=0,
-                )
-
-            # ── draw series ────────────────────────────────────────────────
-            label_artists: list[tuple[plt.Text, str]] = []  # (text_obj, logo_path)
-
-            # Draw ghost lines first so heroes render on top
-            for idx, (lbl, _) in enumerate(series_data):
-                if lbl in hero_set:
-                    continue
-                ranks = ranks_matrix[idx]
-                valid = ~np.isnan(ranks)
-                xv, yv = x_positions[valid], ranks[valid]
-                if len(xv) > 1:
-                    ax.plot(
-                        xv,
-                        yv,
-                        color=other_color,
-                        linewidth=eff_other_lw,
-                        alpha=other_alpha,
-                        solid_capstyle="butt",
-                        solid_joinstyle="miter",
-                        zorder=1,
-                    )
-
-            for idx, (lbl, _) in enumerate(series_data):
-                is_hero = lbl in hero_set
-                ranks = ranks_matrix[idx]
-                valid = ~np.isnan(ranks)
-                if not valid.any():
-                    continue
-                xv, yv = x_positions[valid], ranks[valid]
-
-                if is_hero:
-                    color = hcolors.get(lbl) or self._series_color(idx, lbl)  # type: ignore[attr-defined]
-                    lw, alpha = eff_hero_lw, 1.0
-                    zorder_line, zorder_dot = 3, 5
-                else:
-                    continue  # already drawn above
-
-                if len(xv) > 1:
-                    ax.plot(
-                        xv,
-                        yv,
-                        color=color,
-                        linewidth=lw,
-                        alpha=alpha,
-                        solid_capstyle="butt",
-                        solid_joinstyle="miter",
-                        zorder=zorder_line,
-                    )
-
-                # Hero: filled dot at every valid position
-                for xp, yp in zip(xv.tolist(), yv.tolist()):
-                    ax.plot(
-                        xp,
-                        yp,
-                        "o",
-                        color=color,
-                        alpha=alpha,
-                        markersize=dot_ms,
-                        zorder=zorder_dot,
-                        markeredgewidth=0,
-                    )
+            self._draw_bump_rank_lines(ax, plan)
+            # Ghosts first so heroes render on top.
+            self._draw_bump_ghosts(ax, plan, ghost_rows, other_color, other_alpha, eff_other_lw)
+            self._draw_bump_heroes(ax, plan, hero_rows, hcolors, eff_hero_lw)
 
             # ── labels ────────────────────────────────────────────────────
+            label_artists: list[tuple[plt.Text, str]] = []  # (text_obj, logo_path)
+            label_texts: list[plt.Text] = []
+            label_priority: list[int] = []
             if show_labels:
-                last_period_idx = n_periods - 1
-                for idx, (lbl, _) in enumerate(series_data):
-                    ranks = ranks_matrix[idx]
-                    valid = ~np.isnan(ranks)
-                    if not valid.any():
-                        continue
+                for row, lbl in enumerate(plan.labels):
                     is_hero = lbl in hero_set
-                    color = (
-                        (hcolors.get(lbl) or self._series_color(idx, lbl))  # type: ignore[attr-defined]
-                        if is_hero
-                        else other_color
-                    )
-                    last_valid_idx = int(np.where(valid)[0][-1])
-                    lx = x_positions[last_valid_idx]
-                    ly = ranks[last_valid_idx]
-
-                    # Extra offset accommodates the logo that sits to the left of the text.
-                    x_label = lx + 1.25
-
-                    display_text = (label_display or {}).get(lbl, lbl) or ""
-                    font_size = self._ts("tick_label") * 0.88  # type: ignore[attr-defined]
-                    txt = ax.text(
-                        x_label,
-                        ly,
-                        display_text,
-                        ha="left",
-                        va="center",
-                        fontsize=font_size,
-                        color=color,
+                    txt = self._draw_bump_label(
+                        ax,
+                        plan,
+                        row,
+                        text=(label_display or {}).get(lbl, lbl) or "",
+                        color=self._bump_hero_color(plan, row, hcolors) if is_hero else other_color,
                         alpha=1.0 if is_hero else other_alpha,
-                        clip_on=False,
-                        zorder=6,
                     )
+                    if txt is None:
+                        continue
+                    label_texts.append(txt)
+                    label_priority.append(1 if is_hero else 0)
                     logo_path = (label_logos or {}).get(lbl, "")
                     if logo_path:
                         label_artists.append((txt, logo_path))
 
-            # ── left rank axis ─────────────────────────────────────────────
-            ax.set_ylim(n_ranks + 0.5, 0.5)  # rank 1 at top
-            ax.yaxis.tick_left()
-            ax.set_yticks(list(range(1, n_ranks + 1)))
-            ax.set_yticklabels(
-                [str(i) for i in range(1, n_ranks + 1)],
-                fontsize=self._ts("tick_label") * 0.78,  # type: ignore[attr-defined]
-                color=self.color_subtitle,  # type: ignore[attr-defined]
-            )
-            ax.tick_params(axis="y", length=0, pad=self._px(2))  # type: ignore[attr-defined]
-
-            # ── x axis ────────────────────────────────────────────────────
-            ax.set_xlim(x_lo, x_hi)
-            ax.set_xticks(x_positions)
-            ax.set_xticklabels(
-                [str(xi) for xi in x],
-                fontsize=self._ts("tick_label"),  # type: ignore[attr-defined]
-                color=self.color_tick,  # type: ignore[attr-defined]
-            )
-            ax.tick_params(axis="x", length=0, pad=self._px(5))  # type: ignore[attr-defined]
-
-            # ── spines ────────────────────────────────────────────────────
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-
-            # ── title / subtitle ──────────────────────────────────────────
-            axes_height = 0.7116 - 0.1266
-            if self.title:  # type: ignore[attr-defined]
-                fig.text(
-                    0.04,
-                    0.1266 + 1.234 * axes_height,
-                    self.title,  # type: ignore[attr-defined]
-                    fontsize=self._ts("title"),
-                    va="bottom",
-                    ha="left",  # type: ignore[attr-defined]
-                    color=self.color_title,  # type: ignore[attr-defined]
-                    fontfamily=self.font_title_family,  # type: ignore[attr-defined]
-                    fontweight=self.font_title_weight,  # type: ignore[attr-defined]
-                    linespacing=LINESPACING,
-                    clip_on=False,
-                )
-            if self.subtitle:  # type: ignore[attr-defined]
-                fig.text(
-                    0.04,
-                    0.1266 + 1.220 * axes_height,
-                    self.subtitle,  # type: ignore[attr-defined]
-                    fontsize=self._ts("subtitle"),
-                    va="top",
-                    ha="left",  # type: ignore[attr-defined]
-                    color=self.color_subtitle,  # type: ignore[attr-defined]
-                    fontfamily=self.font_main_family,  # type: ignore[attr-defined]
-                    linespacing=LINESPACING,
-                    clip_on=False,
-                )
-
-            plt.subplots_adjust(left=0.08, right=0.97, top=0.7116, bottom=0.1266)
-            self._add_footer(fig)  # type: ignore[attr-defined]
+            self._layout_bump_frame(fig, ax, plan, show_labels)
+            # Series ending early can park their label on top of a later
+            # series' label; heroes win any such contest.
+            self._resolve_label_collisions(ax, label_texts, priority=label_priority)  # type: ignore[attr-defined]
 
             # ── logos: placed after canvas draw so bboxes are available ───
             if label_artists:
@@ -322,9 +184,9 @@ class BumpMixin(DataMixin):
 
             logger.debug(  # type: ignore[attr-defined]
                 "Bump chart: %d series × %d periods, %d ranks, %d heroes",
-                n_series,
-                n_periods,
-                n_ranks,
+                plan.n_series_total,
+                len(plan.x),
+                plan.n_ranks,
                 len(hero_set),
             )
 
@@ -332,22 +194,463 @@ class BumpMixin(DataMixin):
                 self.save_figure(fig, save_path, dpi=save_dpi, fmt=save_format, **save_kwargs)  # type: ignore[attr-defined]
                 logger.info("Saved chart -> %s", save_path)  # type: ignore[attr-defined]
                 if export_xlsx:
-                    target = export_xlsx_path or os.path.join(
-                        os.path.dirname(str(save_path)) or ".", "chart_data.xlsx"
-                    )
-                    try:
-                        self.export_data(target)  # type: ignore[attr-defined]
-                        logger.info("Exported chart data -> %s", target)  # type: ignore[attr-defined]
-                    except ImportError:
-                        logger.warning(  # type: ignore[attr-defined]
-                            "Skipped xlsx export: openpyxl is not installed."
-                        )
+                    self._export_bump_data(save_path, export_xlsx_path)
 
             if show:
                 plt.show()
 
             return fig, ax
 
+    def bump_variants(
+        self,
+        x: Sequence[Any],
+        ys: Dict[str, Sequence[Optional[float]]],
+        highlights: Dict[str, List[str]],
+        save_path: str,
+        ascending: bool = False,
+        pre_ranked: Union[bool, np.ndarray, Sequence[Sequence[float]]] = False,
+        ties: str = "first",
+        top_n: Optional[int] = None,
+        highlight_colors: Optional[Dict[str, str]] = None,
+        hero_linewidth: Optional[float] = None,
+        other_linewidth: Optional[float] = None,
+        other_color: str = _GHOST_COLOR,
+        other_alpha: float = _GHOST_ALPHA,
+        show_labels: bool = True,
+        label_logos: Optional[Dict[str, str]] = None,
+        label_display: Optional[Dict[str, str]] = None,
+        save_dpi: int = 500,
+        save_format: Optional[str] = None,
+        export_xlsx: bool = True,
+        export_xlsx_path: Optional[str] = None,
+        **save_kwargs: Any,
+    ) -> Dict[str, str]:
+        """Save one bump chart per ``highlight`` set from a single shared render.
+
+        Equivalent to calling :meth:`bump` once per entry of *highlights*, but
+        the rank matrix, ghost layer, rank gridlines, axes, title/footer
+        layout and label logos are built once. Each variant only adds its
+        hero lines/dots, recolours its heroes' labels, hides their ghost
+        strokes, saves, and then strips the overlay again — e.g. one image per
+        airline for per-carrier social posts.
+
+        Parameters
+        ----------
+        highlights:
+            ``{variant_name: [hero, …]}``; one output is written per entry.
+        save_path:
+            Output path template containing ``{name}``, e.g.
+            ``"out/bump_{name}.png"``; formatted with each variant name.
+        x, ys, ascending, pre_ranked, ties, top_n, highlight_colors,
+        hero_linewidth, other_linewidth, other_color, other_alpha,
+        show_labels, label_logos, label_display:
+            As for :meth:`bump`.
+        save_dpi, save_format, export_xlsx, export_xlsx_path:
+            Standard output parameters; the (shared) data is exported once.
+
+        Returns
+        -------
+        dict
+            ``{variant_name: written_path}``. The shared figure is closed
+            before returning.
+        """
+        if "{name}" not in save_path:
+            raise ValueError("bump_variants() save_path must contain a '{name}' placeholder.")
+
+        plan = self._prepare_bump(x, ys, ascending, pre_ranked, ties, top_n)
+        hcolors: Dict[str, str] = highlight_colors or {}
+        row_of = {lbl: row for row, lbl in enumerate(plan.labels)}
+        eff_hero_lw = hero_linewidth if hero_linewidth is not None else self._px(_HERO_LW_PT)  # type: ignore[attr-defined]
+        eff_other_lw = other_linewidth if other_linewidth is not None else self._px(_GHOST_LW_PT)  # type: ignore[attr-defined]
+
+        written: Dict[str, str] = {}
+        with rc_context(self._rc):  # type: ignore[attr-defined]
+            fig, ax = self._init_figure_and_axes()  # type: ignore[attr-defined]
+            ax.grid(False)
+
+            # ── shared base layer: every series as a ghost ────────────────
+            self._draw_bump_rank_lines(ax, plan)
+            ghosts, ghost_path_rows = self._draw_bump_ghosts(
+                ax, plan, range(len(plan.labels)), other_color, other_alpha, eff_other_lw
+            )
+            ghost_rgba = ghosts.get_colors().copy() if ghosts is not None else None
+
+            labels: Dict[int, plt.Text] = {}
+            label_artists: list[tuple[plt.Text, str]] = []
+            if show_labels:
+                for row, lbl in enumerate(plan.labels):
+                    txt = self._draw_bump_label(
+                        ax,
+                        plan,
+                        row,
+                        text=(label_display or {}).get(lbl, lbl) or "",
+                        color=other_color,
+                        alpha=other_alpha,
+                    )
+                    if txt is None:
+                        continue
+                    labels[row] = txt
+                    logo_path = (label_logos or {}).get(lbl, "")
+                    if logo_path:
+                        label_artists.append((txt, logo_path))
+
+            self._layout_bump_frame(fig, ax, plan, show_labels)
+            # Resolved once for every variant: any series that is a hero in
+            # some variant outranks the pure ghosts, so a hero label is never
+            # the one hidden.
+            any_hero = {lbl for heroes in highlights.values() for lbl in heroes}
+            self._resolve_label_collisions(  # type: ignore[attr-defined]
+                ax,
+                list(labels.values()),
+                priority=[1 if plan.labels[row] in any_hero else 0 for row in labels],
+            )
+            # Hero labels keep the ghost label's text and font, so its bbox —
+            # and hence each logo's position — is identical across variants.
+            if label_artists:
+                self._place_bump_logos(fig, label_artists)
+
+            # ── per-variant hero overlay ──────────────────────────────────
+            for name, heroes in highlights.items():
+                hero_rows = [row_of[lbl] for lbl in heroes if lbl in row_of]
+                overlay = self._draw_bump_heroes(ax, plan, hero_rows, hcolors, eff_hero_lw)
+                if ghosts is not None:
+                    rgba = ghost_rgba.copy()
+                    rgba[np.isin(ghost_path_rows, hero_rows), 3] = 0.0
+                    ghosts.set_colors(rgba)
+                for row in hero_rows:
+                    if row in labels:
+                        labels[row].set_color(self._bump_hero_color(plan, row, hcolors))
+                        labels[row].set_alpha(1.0)
+
+                path = save_path.format(name=name)
+                self.save_figure(fig, path, dpi=save_dpi, fmt=save_format, **save_kwargs)  # type: ignore[attr-defined]
+                logger.info("Saved chart -> %s", path)  # type: ignore[attr-defined]
+                written[name] = path
+
+                for artist in overlay:
+                    artist.remove()
+                if ghosts is not None:
+                    ghosts.set_colors(ghost_rgba)
+                for row in hero_rows:
+                    if row in labels:
+                        labels[row].set_color(other_color)
+                        labels[row].set_alpha(other_alpha)
+
+            logger.debug(  # type: ignore[attr-defined]
+                "Bump variants: %d outputs from one %d-series base layer",
+                len(written),
+                len(plan.labels),
+            )
+            plt.close(fig)
+
+        if export_xlsx and written:
+            self._export_bump_data(next(iter(written.values())), export_xlsx_path)
+        return written
+
+    # ── bump stages (shared by bump() and bump_variants()) ─────────────────────
+
+    def _prepare_bump(
+        self,
+        x: Sequence[Any],
+        ys: Dict[str, Sequence[Optional[float]]],
+        ascending: bool,
+        pre_ranked: Union[bool, np.ndarray, Sequence[Sequence[float]]],
+        ties: str,
+        top_n: Optional[int],
+    ) -> BumpPlan:
+        """Validate *ys*, build the rank matrix and apply the ``top_n`` window.
+
+        Reused from ``self._prep_memo`` while a size-variant batch repeats
+        the call or a compiled spec is executed (see
+        :meth:`~.data_mixin.DataMixin._prepare_render`).
+        """
+        # Checked here, not only in rank_columns: pre-ranked input skips it.
+        if ties not in TIE_METHODS:
+            raise ValueError(f"ties must be one of {TIE_METHODS}, got {ties!r}")
+        memo = self._prep_memo  # type: ignore[attr-defined]
+        if memo is not None and "bump" in memo:
+            plan, last_series = memo["bump"]
+            self._last_x = list(plan.x)  # type: ignore[attr-defined]
+            self._last_series_list = list(last_series)  # type: ignore[attr-defined]
+            self._render_state = None  # type: ignore[attr-defined]
+            return plan
+        if not ys:
+            raise ValueError("bump() requires at least one series in 'ys'.")
+
+        series_data: list[tuple[str, list]] = list(ys.items())
+        n_series = len(series_data)
+        n_periods = len(x)
+
+        # ── value matrix → rank matrix ─────────────────────────────────────
+        # One 2-D conversion: None → NaN under dtype=float, so absent periods
+        # need no per-cell inspection.
+        self._validate_series_lengths(x, series_data)
+        values_matrix = np.array([vals for _, vals in series_data], dtype=float).reshape(
+            n_series, n_periods
+        )
+
+        if isinstance(pre_ranked, bool):
+            ranks_matrix = (
+                values_matrix.copy()
+                if pre_ranked
+                else rank_columns(values_matrix, ascending=ascending, ties=ties)
+            )
+        else:
+            ranks_matrix = np.array(pre_ranked, dtype=float)
+            if ranks_matrix.shape != (n_series, n_periods):
+                raise ValueError(
+                    f"pre_ranked array shape {ranks_matrix.shape} does not match "
+                    f"(n_series, n_periods) = {(n_series, n_periods)}"
+                )
+
+        n_ranks = (
+            int(np.ceil(np.nanmax(ranks_matrix)))
+            if not np.all(np.isnan(ranks_matrix))
+            else n_series
+        )
+
+        # cache for export_data (the full universe, before any top_n culling)
+        self._last_x = list(x)  # type: ignore[attr-defined]
+        self._last_series_list = [(lbl, list(vals)) for lbl, vals in series_data]  # type: ignore[attr-defined]
+        self._render_state = None  # type: ignore[attr-defined]
+
+        # ── top-N window ───────────────────────────────────────────────────
+        # ``series_idx`` keeps each surviving row's original position so
+        # palette colours don't shift when other series are culled.
+        series_idx = np.arange(n_series)
+        display_matrix = ranks_matrix
+        if top_n is not None:
+            keep, display_matrix = window_ranks(ranks_matrix, top_n)
+            series_idx = np.flatnonzero(keep)
+            ranks_matrix = ranks_matrix[keep]
+            display_matrix = display_matrix[keep]
+            n_ranks = min(n_ranks, top_n)
+            logger.debug("Bump top_n=%d: kept %d of %d series", top_n, len(series_idx), n_series)
+
+        valid_matrix = ~np.isnan(ranks_matrix)
+        plan = BumpPlan(
+            x=list(x),
+            labels=[series_data[i][0] for i in series_idx],
+            series_idx=series_idx,
+            ranks=ranks_matrix,
+            display=display_matrix,
+            valid=valid_matrix,
+            inside=valid_matrix & (ranks_matrix <= n_ranks),
+            n_ranks=n_ranks,
+            n_series_total=n_series,
+        )
+        if memo is not None:
+            memo["bump"] = (plan, self._last_series_list)  # type: ignore[attr-defined]
+        return plan
+
+    def _bump_hero_color(self, plan: BumpPlan, row: int, hcolors: Dict[str, str]) -> str:
+        lbl = plan.labels[row]
+        return hcolors.get(lbl) or self._series_color(int(plan.series_idx[row]), lbl)  # type: ignore[attr-defined]
+
+    def _draw_bump_rank_lines(self, ax: plt.Axes, plan: BumpPlan) -> None:
+        """Rank reference lines (data area only), as one LineCollection."""
+        n_ranks = plan.n_ranks
+        rank_segments = np.empty((n_ranks, 2, 2))
+        rank_segments[:, 0, 0] = -0.35
+        rank_segments[:, 1, 0] = len(plan.x) - 1 + 0.35
+        rank_segments[:, :, 1] = np.arange(1, n_ranks + 1, dtype=float)[:, None]
+        ax.add_collection(
+            LineCollection(
+                rank_segments,
+                colors=self.grid_color,  # type: ignore[attr-defined]
+                linewidths=self._px(GRID_LINEWIDTH),  # type: ignore[attr-defined]
+                alpha=0.9,
+                zorder=0,
+            ),
+            autolim=False,
+        )
+
+    def _draw_bump_ghosts(
+        self,
+        ax: plt.Axes,
+        plan: BumpPlan,
+        rows: Sequence[int],
+        color: str,
+        alpha: float,
+        linewidth: float,
+    ) -> Tuple[Optional[LineCollection], np.ndarray]:
+        """Draw *rows* as thin ghost lines in a single LineCollection.
+
+        Each polyline joins only the valid periods, bridging absent (NaN)
+        periods, and breaks wherever a series is outside the ``top_n``
+        window. Opacity is baked into per-path RGBA colours (rather than the
+        collection's ``alpha``) so individual paths can be hidden later.
+
+        Returns the collection (``None`` if nothing was drawable) and the
+        plan row behind each of its paths.
+        """
+        x_positions = np.arange(len(plan.x), dtype=float)
+        paths: list[np.ndarray] = []
+        path_rows: list[int] = []
+        for row in rows:
+            valid = plan.valid[row]
+            for path in self._bump_polylines(x_positions[valid], plan.display[row][valid]):
+                paths.append(path)
+                path_rows.append(row)
+        if not paths:
+            return None, np.asarray(path_rows, dtype=int)
+
+        ghosts = LineCollection(
+            paths,
+            colors=[to_rgba(color, alpha)] * len(paths),
+            linewidths=linewidth,
+            capstyle="butt",
+            joinstyle="miter",
+            zorder=1,
+        )
+        ax.add_collection(ghosts, autolim=False)
+        return ghosts, np.asarray(path_rows, dtype=int)
+
+    def _draw_bump_heroes(
+        self,
+        ax: plt.Axes,
+        plan: BumpPlan,
+        rows: Sequence[int],
+        hcolors: Dict[str, str],
+        linewidth: float,
+    ) -> list:
+        """Draw hero lines and dots for *rows*; returns the created artists."""
+        x_positions = np.arange(len(plan.x), dtype=float)
+        dot_ms = self._px(_HERO_DOT_PT)  # type: ignore[attr-defined]
+        artists: list = []
+        for row in rows:
+            valid, inside = plan.valid[row], plan.inside[row]
+            if not inside.any():
+                continue
+            color = self._bump_hero_color(plan, row, hcolors)
+            # NaN (out-of-window) cells break the hero's line, as in ghosts.
+            xv, yv = x_positions[valid], plan.display[row][valid]
+            if len(xv) > 1:
+                artists += ax.plot(
+                    xv,
+                    yv,
+                    color=color,
+                    linewidth=linewidth,
+                    alpha=1.0,
+                    solid_capstyle="butt",
+                    solid_joinstyle="miter",
+                    zorder=3,
+                )
+
+            # Hero: filled dot at every in-window position, one PathCollection
+            # per hero (scatter size is area, i.e. markersize squared).
+            artists.append(
+                ax.scatter(
+                    x_positions[inside],
+                    plan.ranks[row][inside],
+                    s=dot_ms**2,
+                    color=color,
+                    alpha=1.0,
+                    marker="o",
+                    linewidths=0,
+                    zorder=5,
+                )
+            )
+        return artists
+
+    def _draw_bump_label(
+        self,
+        ax: plt.Axes,
+        plan: BumpPlan,
+        row: int,
+        text: str,
+        color: str,
+        alpha: float,
+    ) -> Optional[plt.Text]:
+        """Label *row* at its last in-window point; ``None`` if it has none."""
+        inside = plan.inside[row]
+        if not inside.any():
+            return None
+        last_valid_idx = int(np.flatnonzero(inside)[-1])
+
+        # Extra offset accommodates the logo that sits to the left of the text.
+        x_label = last_valid_idx + 1.25
+
+        return ax.text(
+            x_label,
+            plan.ranks[row][last_valid_idx],
+            text,
+            ha="left",
+            va="center",
+            fontsize=self._ts("tick_label") * 0.88,  # type: ignore[attr-defined]
+            color=color,
+            alpha=alpha,
+            clip_on=False,
+            zorder=6,
+        )
+
+    def _layout_bump_frame(
+        self,
+        fig: plt.Figure,
+        ax: plt.Axes,
+        plan: BumpPlan,
+        show_labels: bool,
+    ) -> None:
+        """Rank/period axes, spines, title/subtitle, margins and footer."""
+        n_periods = len(plan.x)
+        n_ranks = plan.n_ranks
+
+        # right-margin label space (in data units) for series surviving to final period
+        label_x_units = 1.5 if show_labels else 0.0
+        x_lo = -0.5
+        x_hi = n_periods - 1 + 0.5 + label_x_units
+
+        # ── left rank axis ─────────────────────────────────────────────────
+        ax.set_ylim(n_ranks + 0.5, 0.5)  # rank 1 at top
+        ax.yaxis.tick_left()
+        ax.set_yticks(list(range(1, n_ranks + 1)))
+        ax.set_yticklabels(
+            [str(i) for i in range(1, n_ranks + 1)],
+            fontsize=self._ts("tick_label") * 0.78,  # type: ignore[attr-defined]
+            color=self.color_subtitle,  # type: ignore[attr-defined]
+        )
+        ax.tick_params(axis="y", length=0, pad=self._px(2))  # type: ignore[attr-defined]
+
+        # ── x axis ────────────────────────────────────────────────────────
+        ax.set_xlim(x_lo, x_hi)
+        ax.set_xticks(np.arange(n_periods, dtype=float))
+        ax.set_xticklabels(
+            [str(xi) for xi in plan.x],
+            fontsize=self._ts("tick_label"),  # type: ignore[attr-defined]
+            color=self.color_tick,  # type: ignore[attr-defined]
+        )
+        ax.tick_params(axis="x", length=0, pad=self._px(5))  # type: ignore[attr-defined]
+
+        # ── spines ────────────────────────────────────────────────────────
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+        # ── title / subtitle ──────────────────────────────────────────────
+        self._draw_title_stack(fig)  # type: ignore[attr-defined]
+
+        plt.subplots_adjust(left=0.08, right=0.97, top=0.7116, bottom=0.1266)
+        self._add_footer(fig)  # type: ignore[attr-defined]
+
+    def _export_bump_data(self, save_path: str, export_xlsx_path: Optional[str]) -> None:
+        self._export_after_save(save_path, export_xlsx_path)
+
+    # ── geometry helpers ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _bump_polylines(xv: np.ndarray, yv: np.ndarray) -> list[np.ndarray]:
+        """Split one series' ``(x, rank)`` points into ``(k, 2)`` polylines at NaN
+        ranks, dropping runs too short to draw a segment."""
+        drawn = ~np.isnan(yv)
+        if drawn.all():
+            return [np.column_stack((xv, yv))] if len(xv) > 1 else []
+        # Boundaries of each run of consecutive drawn points.
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], drawn.astype(np.int8), [0]))))
+        return [
+            np.column_stack((xv[start:stop], yv[start:stop]))
+            for start, stop in zip(edges[::2], edges[1::2])
+            if stop - start > 1
+        ]
+
     # ── logo helper ────────────────────────────────────────────────────────────
 
     def _place_bump_logos(
@@ -371,7 +674,7 @@ class BumpMixin(DataMixin):
             gap_px = self._px(3) * fig.dpi / 72.0  # type: ignore[attr-defined]
 
             for txt, logo_path in label_artists:
-                if not logo_path or not os.path.exists(logo_path):
+                if not txt.get_visible() or not logo_path or not os.path.exists(logo_path):
                     continue
                 try:
                     img = plt.imread(logo_path)
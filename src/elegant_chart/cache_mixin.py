@@ -0,0 +1,142 @@
+# elegant_chart/cache_mixin.py
+from __future__ import annotations
+
+import inspect
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import matplotlib.pyplot as plt
+
+from ._logging import logger
+from ._paths import BUNDLED_FONT_FILES, DEFAULT_LOGO_PATH, FONTS_DIR
+from .data_export import check_export_dependency, export_format_for
+from .output_cache import deterministic_output, fingerprint
+from .outputs import resolve_targets
+from .types import SavePath
+
+# Renderers whose outputs (files + data export) are fully described by their arguments.
+_CACHED_KINDS = ("line", "bar", "bump", "facet")
+
+# Attributes that route output somewhere but do not change what is drawn.
+_UNHASHED_ATTRS = {"save_workers", "output_writer", "export_workbook", "output_cache"}
+
+
+class CacheMixin:
+    def render_cached(self, kind: str, save_path: SavePath, **render_kwargs: Any) -> bool:
+        """Render and save a chart, or reuse the files of an identical earlier render.
+
+        The inputs — this chart's configuration and theme, the call's
+        arguments and data, the font and logo files, the library versions —
+        are hashed (see :func:`~.output_cache.fingerprint`). If
+        ``output_cache`` already holds the files for that hash, they are
+        placed at *save_path* (and the data export path) and nothing is
+        drawn. Otherwise the chart is rendered as ``line()`` / ``bar()`` /
+        ``bump()`` / ``facet()`` would, with byte-deterministic output (see
+        :func:`~.output_cache.deterministic_output`), and its files stored.
+
+        Parameters
+        ----------
+        kind:
+            ``"line"``, ``"bar"``, ``"bump"`` or ``"facet"``.
+        save_path:
+            As for the renderer: a path, a list of targets or a dict spec.
+        **render_kwargs:
+            Passed to the renderer (``x``, ``ys``, ``export_xlsx`` …);
+            ``show`` is always ``False``.
+
+        Returns
+        -------
+        bool
+            ``True`` when the files came from the cache. After a hit there
+            is no figure and no recorded data (``export_data()`` raises until
+            the next render); after a miss the figure has been closed.
+
+        Raises
+        ------
+        RuntimeError
+            Without an ``output_cache``.
+
+        A chart with an ``export_workbook`` always renders, since its sheet
+        has to be written from the data.
+        """
+        cache = self.output_cache  # type: ignore[attr-defined]
+        if cache is None:
+            raise RuntimeError(
+                "render_cached() needs an output_cache, e.g. "
+                "ElegantChart(output_cache=OutputCache('.chart-cache'))."
+            )
+        if kind not in _CACHED_KINDS:
+            raise ValueError(f"kind must be one of {_CACHED_KINDS}, got {kind!r}")
+
+        render = getattr(self, kind)
+        signature = inspect.signature(render)
+        bound = signature.bind(save_path=save_path, **{**render_kwargs, "show": False})
+        bound.apply_defaults()
+        args = dict(bound.arguments)
+        save_kwargs: Dict[str, Any] = next(
+            (args.pop(p.name) for p in signature.parameters.values() if p.kind is p.VAR_KEYWORD),
+            {},
+        )
+
+        paths = self._cached_output_paths(args, save_kwargs)
+        key = fingerprint(
+            kind, self._cache_config(), args, save_kwargs, files=self._cache_input_files(args)
+        )
+        if self.export_workbook is None and cache.restore(key, paths):  # type: ignore[attr-defined]
+            self._last_x = self._last_series_list = None  # type: ignore[attr-defined]
+            self._render_state = None  # type: ignore[attr-defined]
+            self._last_outputs = []  # type: ignore[attr-defined]
+            return True
+
+        if cache.link:
+            # A previous hit may have linked these to a cache entry; drawing
+            # into the shared file would rewrite the entry too.
+            for path in paths:
+                Path(path).unlink(missing_ok=True)
+        with deterministic_output():
+            fig, _ = render(*bound.args, **bound.kwargs)
+        plt.close(fig)
+        self._render_state = None  # type: ignore[attr-defined]
+        # Queued behind the saves when there is an output_writer.
+        self._write_export(cache.store, key, paths)  # type: ignore[attr-defined]
+        logger.debug("Output cache miss %s for %s chart %r", key[:12], kind, self.title)  # type: ignore[attr-defined]
+        return False
+
+    def _cache_config(self) -> Dict[str, Any]:
+        """Every attribute that shapes the drawing: public config plus the derived
+        figure scale and rcParams overlay."""
+        config = {
+            name: value
+            for name, value in vars(self).items()
+            if not name.startswith("_") and name not in _UNHASHED_ATTRS
+        }
+        config["_figure_scale"] = self._figure_scale  # type: ignore[attr-defined]
+        config["_rc"] = self._rc  # type: ignore[attr-defined]
+        return config
+
+    def _cache_input_files(self, args: Dict[str, Any]) -> List[Any]:
+        """Font and logo files whose bytes end up in the drawing."""
+        files: List[Any] = [FONTS_DIR / name for name in BUNDLED_FONT_FILES]
+        files += [Path("fonts") / name for name in BUNDLED_FONT_FILES]
+        logo = self.logo_path  # type: ignore[attr-defined]
+        files.append(DEFAULT_LOGO_PATH if logo is None else logo)
+        for name, value in args.items():
+            if name.endswith("_logos") and isinstance(value, dict):
+                files += list(value.values())
+        return [f for f in files if f]
+
+    def _cached_output_paths(self, args: Dict[str, Any], save_kwargs: Dict[str, Any]) -> List[Any]:
+        """Every file the render writes: its targets, srcset manifests and data export."""
+        save_path = args["save_path"]
+        targets = resolve_targets(save_path, args["save_dpi"], args["save_format"], **save_kwargs)
+        paths: List[Any] = [os.fspath(t.path) for t in targets]
+        paths += sorted({t.manifest for t in targets if t.manifest})
+        if args.get("export_xlsx") and self.export_workbook is None:  # type: ignore[attr-defined]
+            export = self._export_target(save_path, args.get("export_xlsx_path"))  # type: ignore[attr-defined]
+            try:
+                check_export_dependency(export_format_for(export))
+                paths.append(export)
+            except ImportError:
+                pass  # the render skips the export too (with a warning)
+        return paths
@@ -0,0 +1,202 @@
+# elegant_chart/data_export.py
+"""
+Chart data export: CSV, Parquet and streaming xlsx.
+
+Every render can export the data it drew (see
+:meth:`~.data_mixin.DataMixin.export_data`). The table is one ``x`` column
+plus one column per series, written by :func:`write_table` in the format
+named by the file extension:
+
+* ``.csv`` — the stdlib :mod:`csv` writer; by far the fastest.
+* ``.parquet`` — :meth:`pandas.DataFrame.to_parquet` (needs ``pyarrow`` or
+  ``fastparquet``).
+* ``.xlsx`` — openpyxl in write-only mode: rows are streamed out instead of
+  building a worksheet object model, so memory stays flat.
+
+For a whole run of charts, :class:`ExportWorkbook` keeps one write-only
+workbook open and appends each chart's table as a sheet, saving once.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+EXPORT_FORMATS = ("xlsx", "csv", "parquet")
+
+# Excel's sheet-name rules: at most 31 characters, none of []:*?/\
+_SHEET_NAME_MAX = 31
+_SHEET_NAME_BAD = re.compile(r"[\[\]:*?/\\]")
+
+
+def export_columns(
+    x: Sequence[Any], series_list: Sequence[Tuple[Optional[str], Sequence[Any]]]
+) -> Dict[str, List[Any]]:
+    """``{"x": x, <label>: values, …}``; unlabelled series become ``value``, ``value_1`` …"""
+    data: Dict[str, List[Any]] = {"x": list(x)}
+    for lbl, vals in series_list:
+        col = lbl if lbl else "value"
+        # Avoid duplicate column names when multiple unlabelled series exist
+        if col in data:
+            col = f"{col}_{list(data.keys()).count(col)}"
+        data[col] = list(vals)
+    return data
+
+
+def export_format_for(path: Any, fmt: Optional[str] = None) -> str:
+    """The export format: *fmt*, else *path*'s extension; must be in :data:`EXPORT_FORMATS`."""
+    fmt = (fmt or os.path.splitext(os.fspath(path))[1].lstrip(".")).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {fmt!r}; expected one of {EXPORT_FORMATS}")
+    return fmt
+
+
+def _cell(value: Any) -> Any:
+    """A plain Python cell value: NaN blanked (Excel and CSV have none), numpy unwrapped."""
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value).to_pydatetime()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _rows(columns: Dict[str, List[Any]]) -> Iterator[List[Any]]:
+    for row in zip(*columns.values()):
+        yield [_cell(v) for v in row]
+
+
+def check_export_dependency(fmt: str) -> None:
+    """Raise ``ImportError`` now if *fmt*'s library is missing, not mid-write.
+
+    (A queued background export would otherwise only fail at flush time.)
+    """
+    if fmt == "xlsx":
+        candidates = ("openpyxl",)
+    elif fmt == "parquet":
+        candidates = ("pyarrow", "fastparquet")
+    else:
+        return
+    for module in candidates:
+        try:
+            __import__(module)
+            return
+        except ImportError:
+            continue
+    raise ImportError(
+        f"{' or '.join(candidates)} is required for {fmt} export. "
+        f"Install it with: pip install {candidates[0]}"
+    )
+
+
+def _write_only_workbook() -> Any:
+    check_export_dependency("xlsx")
+    import openpyxl  # noqa: PLC0415
+
+    return openpyxl.Workbook(write_only=True)
+
+
+def write_table(path: Any, columns: Dict[str, List[Any]], fmt: Optional[str] = None) -> None:
+    """Write *columns* (from :func:`export_columns`) to *path* as CSV, Parquet or xlsx.
+
+    Raises
+    ------
+    ValueError
+        For an unsupported format.
+    ImportError
+        If the format's library (openpyxl, pyarrow) is not installed.
+    """
+    fmt = export_format_for(path, fmt)
+    if fmt == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(columns.keys())
+            writer.writerows(_rows(columns))
+    elif fmt == "parquet":
+        check_export_dependency(fmt)
+        pd.DataFrame(columns).to_parquet(path, index=False)
+    else:
+        workbook = _write_only_workbook()
+        _append_sheet(workbook.create_sheet("data"), columns)
+        workbook.save(path)
+
+
+def _append_sheet(sheet: Any, columns: Dict[str, List[Any]]) -> None:
+    sheet.append(list(columns.keys()))
+    for row in _rows(columns):
+        sheet.append(row)
+
+
+class ExportWorkbook:
+    """One streaming xlsx workbook collecting a sheet per chart for a whole run.
+
+    Pass it to a chart as ``export_workbook=``; every data export then
+    becomes a sheet here instead of its own file, and the workbook is saved
+    once on :meth:`close`.
+
+    Parameters
+    ----------
+    path:
+        Destination ``.xlsx`` file, written on :meth:`close`.
+
+    Example
+    -------
+    ::
+
+        with ExportWorkbook("out/run_data.xlsx") as book:
+            chart = ElegantChart(export_workbook=book)
+            chart.bar(x=q, ys=revenue, save_path="out/revenue.png", show=False)  # sheet "revenue"
+            chart.line(x=q, ys=margin, save_path="out/margin.png", show=False)   # sheet "margin"
+
+    With a :class:`~.background_writer.BackgroundWriter`, open the workbook
+    first so the writer is flushed before the workbook is saved::
+
+        with ExportWorkbook("run.xlsx") as book, BackgroundWriter() as writer:
+            ...
+    """
+
+    def __init__(self, path: Any) -> None:
+        self.path = path
+        self._workbook = _write_only_workbook()
+        self._names: set = set()
+        self._closed = False
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return [sheet.title for sheet in self._workbook.worksheets]
+
+    def add_sheet(self, name: str, columns: Dict[str, List[Any]]) -> str:
+        """Stream *columns* into a new sheet; returns the (sanitised, unique) sheet name."""
+        if self._closed:
+            raise RuntimeError("ExportWorkbook is closed")
+        base = _SHEET_NAME_BAD.sub("_", str(name)).strip("'")[:_SHEET_NAME_MAX] or "data"
+        title, n = base, 1
+        while title.lower() in self._names:
+            n += 1
+            suffix = f" ({n})"
+            title = base[: _SHEET_NAME_MAX - len(suffix)] + suffix
+        self._names.add(title.lower())
+        _append_sheet(self._workbook.create_sheet(title), columns)
+        return title
+
+    def close(self) -> None:
+        """Save the workbook (an empty one gets a blank sheet, as Excel requires one)."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._names:
+            self._workbook.create_sheet("data")
+        self._workbook.save(self.path)
+
+    def __enter__(self) -> "ExportWorkbook":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -10,7 +10,12 @@ import numpy as np
 import pandas as pd
 
 from ._logging import logger
-from .types import FormatterSpec  # noqa: F401 — re-exported for mixin consumers
+from .data_export import check_export_dependency, export_columns, export_format_for, write_table
+from .outputs import first_output_path
+from .types import (
+    FormatterSpec,  # noqa: F401 — re-exported for mixin consumers
+    SavePath,
+)
 
 
 class XPlan(NamedTuple):
@@ -207,6 +212,55 @@ class DataMixin:
 
     # ── shared bar()/line() setup ───────────────────────────────────────────
 
+    def _prepare_data(
+        self,
+        x: Optional[Sequence[Any]],
+        ys: Optional[Union[Sequence[Any], Dict[str, Sequence[Any]]]],
+        labels: Optional[Sequence[Optional[str]]],
+        df: Optional[pd.DataFrame],
+        x_col: Optional[str],
+        y_cols: Optional[Union[str, Sequence[str]]],
+        xlim: Optional[Tuple[float, float]],
+    ) -> Tuple[Sequence[Any], List[Tuple[Optional[str], List[float]]], "XPlan"]:
+        """Resolve the DataFrame shortcut, validate and normalise ``x``/``ys`` and
+        classify the x-axis; returns ``(x, series_list, x_plan)``.
+
+        None of this depends on geometry. While
+        :meth:`~.variants_mixin.VariantsMixin.size_variants` repeats one call
+        at several sizes, or a compiled spec (:class:`~.spec.RenderPlan`) is
+        executed, it is taken from ``self._prep_memo`` instead; only the
+        per-render bookkeeping (max value, export cache) is redone.
+        """
+        memo = self._prep_memo  # type: ignore[attr-defined]
+        if memo is not None and "render" in memo:
+            x, series_list, x_plan = memo["render"]
+            self._compute_max_y_value(series_list)
+            self._store_series(x, series_list)
+            return x, series_list, x_plan
+
+        # ── DataFrame shortcut ────────────────────────────────────────────
+        if df is not None:
+            if x_col is None or y_cols is None:
+                raise ValueError("If df is provided, x_col and y_cols must be set")
+            x, ys, labels = self._from_dataframe(df, x_col, y_cols)
+
+        if x is None:
+            raise ValueError("x must be provided (or use df + x_col + y_cols)")
+        if ys is None:
+            raise ValueError("ys must be provided (or use df + x_col + y_cols)")
+
+        # ── validate ──────────────────────────────────────────────────────
+        self._validate_x_nonempty(x)
+        series_list = self._normalize_series(ys, labels)
+        self._validate_series_lengths(x, series_list)
+        self._validate_values(series_list)
+        self._compute_max_y_value(series_list)
+        self._store_series(x, series_list)
+        x_plan = self._resolve_x_plan(x, xlim if xlim is not None else self.xlim)  # type: ignore[attr-defined]
+        if memo is not None:
+            memo["render"] = (x, series_list, x_plan)
+        return x, series_list, x_plan
+
     def _prepare_render(
         self,
         chart_kind: str,
@@ -237,28 +291,12 @@ class DataMixin:
         read during ``_finalize_axes``.
 
         Returns ``(x, series_list, x_plan, active_xlim)``.
-        """
-        # ── DataFrame shortcut ────────────────────────────────────────────
-        if df is not None:
-            if x_col is None or y_cols is None:
-                raise ValueError("If df is provided, x_col and y_cols must be set")
-            x, ys, labels = self._from_dataframe(df, x_col, y_cols)
 
-        if x is None:
-            raise ValueError("x must be provided (or use df + x_col + y_cols)")
-        if ys is None:
-            raise ValueError("ys must be provided (or use df + x_col + y_cols)")
-
-        # ── validate ──────────────────────────────────────────────────────
-        self._validate_x_nonempty(x)
-        series_list = self._normalize_series(ys, labels)
-        self._validate_series_lengths(x, series_list)
-        self._validate_values(series_list)
-        self._compute_max_y_value(series_list)
-        self._store_series(x, series_list)
+        The data half is :meth:`_prepare_data`.
+        """
+        x, series_list, x_plan = self._prepare_data(x, ys, labels, df, x_col, y_cols, xlim)
 
         active_xlim = xlim if xlim is not None else self.xlim  # type: ignore[attr-defined]
-        x_plan = self._resolve_x_plan(x, active_xlim)
 
         # Resolve x-axis knobs: explicit call argument wins, else instance default.
         self._x_minor_ticks = x_minor_ticks if x_minor_ticks is not None else self.x_minor_ticks  # type: ignore[attr-defined]
@@ -484,23 +522,33 @@ class DataMixin:
         """Cache the most recent render's data so export_data() can access it."""
         self._last_x = list(x)  # type: ignore[attr-defined]
         self._last_series_list = list(series_list)  # type: ignore[attr-defined]
+        # Any new render supersedes the artists a live update would target.
+        self._render_state = None  # type: ignore[attr-defined]
 
-    def export_data(self, path: str) -> None:
+    def export_data(self, path: str, fmt: Optional[str] = None) -> None:
         """
-        Export the data from the most recent ``bar()`` or ``line()`` call to an
-        Excel file (``.xlsx``).
+        Export the data from the most recent ``bar()`` or ``line()`` call to a
+        ``.xlsx``, ``.csv`` or ``.parquet`` file.
 
         Parameters
         ----------
         path:
             Destination file path, e.g. ``"output/chart_data.xlsx"``.
+        fmt:
+            ``"xlsx"``, ``"csv"`` or ``"parquet"``; default: *path*'s
+            extension. See :mod:`~elegant_chart.data_export`.
 
         Raises
         ------
         RuntimeError
             If called before any chart has been rendered on this instance.
+        ValueError
+            For an unsupported format.
         ImportError
-            If ``openpyxl`` is not installed.
+            If the format's library (``openpyxl``, ``pyarrow``) is not installed.
+
+        With an ``output_writer`` the file is written in the background (see
+        :meth:`~.figure_mixin.FigureMixin.flush_outputs`).
 
         Example
         -------
@@ -510,47 +558,82 @@ class DataMixin:
             chart.bar(x=["Q1", "Q2", "Q3"], ys=[10, 20, 15], show=False)
             chart.export_data("revenue.xlsx")
         """
+        fmt = export_format_for(path, fmt)
+        check_export_dependency(fmt)
+        self._write_export(write_table, path, self._export_columns(), fmt)
+
+    def _export_columns(self) -> Dict[str, List[Any]]:
         if self._last_x is None or self._last_series_list is None:  # type: ignore[attr-defined]
             raise RuntimeError(
                 "No chart data to export. Call bar() or line() first."
             )
+        return export_columns(self._last_x, self._last_series_list)  # type: ignore[attr-defined]
 
-        try:
-            import openpyxl  # noqa: F401, PLC0415
-        except ImportError as exc:
-            raise ImportError(
-                "openpyxl is required for Excel export. "
-                "Install it with: pip install openpyxl"
-            ) from exc
-
-        data: dict = {"x": self._last_x}  # type: ignore[attr-defined]
-        for lbl, vals in self._last_series_list:  # type: ignore[attr-defined]
-            col = lbl if lbl else "value"
-            # Avoid duplicate column names when multiple unlabelled series exist
-            if col in data:
-                col = f"{col}_{list(data.keys()).count(col)}"
-            data[col] = vals
+    def _write_export(self, fn: Any, *args: Any) -> None:
+        """Run an export write now, or queue it on ``output_writer``.
 
-        pd.DataFrame(data).to_excel(path, index=False)
+        *args* are a snapshot; the next render may replace ``_last_*``.
+        """
+        if self.output_writer is not None:  # type: ignore[attr-defined]
+            self.output_writer.submit(fn, *args)  # type: ignore[attr-defined]
+        else:
+            fn(*args)
 
     # ── shared finalisation ───────────────────────────────────────────────
 
+    def _export_target(self, save_path: SavePath, export_xlsx_path: Optional[str] = None) -> str:
+        """Where the data export for *save_path* goes: *export_xlsx_path*, else
+        ``chart_data.<export_format>`` next to the first output."""
+        return export_xlsx_path or os.path.join(
+            os.path.dirname(os.fspath(first_output_path(save_path))) or ".",
+            f"chart_data.{self.export_format}",  # type: ignore[attr-defined]
+        )
+
+    def _export_after_save(
+        self, save_path: SavePath, export_xlsx_path: Optional[str] = None
+    ) -> None:
+        """Export the last render's data next to *save_path* (or to *export_xlsx_path*).
+
+        With several targets the export goes next to the first one. With an
+        ``export_workbook`` it becomes a sheet there instead, named after
+        *export_xlsx_path* or the first output file.
+        """
+        first = os.fspath(first_output_path(save_path))
+        book = self.export_workbook  # type: ignore[attr-defined]
+        if book is not None:
+            name = os.path.splitext(os.path.basename(export_xlsx_path or first))[0]
+            self._write_export(book.add_sheet, name, self._export_columns())
+            logger.info("Exported chart data -> %s [%s]", book.path, name)
+            return
+        target = self._export_target(save_path, export_xlsx_path)
+        try:
+            self.export_data(target)
+            logger.info("Exported chart data -> %s", target)
+        except ImportError as exc:
+            logger.warning("Skipped %s export: %s", os.path.basename(target), exc)
+
     def _finalize_and_output(
         self,
         fig: Any,
         ax: Any,
         rotation: float,
         has_legend: bool,
-        save_path: Optional[str],
+        save_path: Optional[SavePath],
         save_dpi: int,
         save_format: Optional[str],
         show: bool,
         export_xlsx: bool = True,
         export_xlsx_path: Optional[str] = None,
+        value_label_texts: Sequence[Any] = (),
         **save_kwargs: Any,
-    ) -> None:
-        """Call finalize_axes, add_footer, optional save, optional export, optional show."""
-        self._finalize_axes(ax, rotation=rotation, has_legend=has_legend)  # type: ignore[attr-defined]
+    ) -> list:
+        """Call finalize_axes, add_footer, optional save, optional export, optional show.
+
+        Returns the y-tick label texts from ``_finalize_axes``.
+        """
+        ytick_texts = self._finalize_axes(  # type: ignore[attr-defined]
+            ax, rotation=rotation, has_legend=has_legend, value_label_texts=value_label_texts
+        )
         self._add_footer(fig)  # type: ignore[attr-defined]
 
         if save_path is not None:
@@ -558,18 +641,9 @@ class DataMixin:
             logger.info("Saved chart -> %s", save_path)
 
             if export_xlsx:
-                target = export_xlsx_path or os.path.join(
-                    os.path.dirname(str(save_path)) or ".", "chart_data.xlsx"
-                )
-                try:
-                    self.export_data(target)
-                    logger.info("Exported chart data -> %s", target)
-                except ImportError:
-                    logger.warning(
-                        "Skipped chart_data.xlsx export: openpyxl is not installed "
-                        "(install with `pip install openpyxl`)."
-                    )
+                self._export_after_save(save_path, export_xlsx_path)
 
         import matplotlib.pyplot as plt  # noqa: PLC0415
         if show:
             plt.show()
+        return ytick_texts
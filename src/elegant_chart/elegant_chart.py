@@ -2,7 +2,9 @@
 """
 ElegantChart — the main public class.
 
-MRO (left-to-right): StyleMixin → AxisMixin → FigureMixin → LineMixin → BarMixin → BumpMixin → ChartBase
+MRO (left-to-right): StyleMixin → AxisMixin → FigureMixin → LineMixin → BarMixin → BumpMixin →
+FacetMixin → SparklineMixin → LiveMixin → AnimationMixin → BarRaceMixin →
+VariantsMixin → CacheMixin → ChartBase
 ``__init__`` resolves to ``ChartBase.__init__``, which populates the shared attribute contract
 and then calls ``self._apply_base_style()`` (supplied by StyleMixin).
 """
@@ -16,6 +18,13 @@ from .figure_mixin import FigureMixin
 from .line_mixin import LineMixin
 from .bar_mixin import BarMixin
 from .bump_mixin import BumpMixin
+from .facet_mixin import FacetMixin
+from .sparkline_mixin import SparklineMixin
+from .live_mixin import LiveMixin
+from .animation_mixin import AnimationMixin
+from .bar_race_mixin import BarRaceMixin
+from .variants_mixin import VariantsMixin
+from .cache_mixin import CacheMixin
 
 
 class ElegantChart(
@@ -25,6 +34,13 @@ class ElegantChart(
     LineMixin,
     BarMixin,
     BumpMixin,
+    FacetMixin,
+    SparklineMixin,
+    LiveMixin,
+    AnimationMixin,
+    BarRaceMixin,
+    VariantsMixin,
+    CacheMixin,
     ChartBase,
 ):
     """
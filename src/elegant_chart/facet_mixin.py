@@ -0,0 +1,379 @@
+# elegant_chart/facet_mixin.py
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib import rc_context
+from matplotlib.ticker import MaxNLocator
+
+from ._logging import logger
+from .axis_utils import calc_shared_y_axis, calc_y_axis_many
+from .data_mixin import DataMixin
+from .figure_mixin import GRID_LINEWIDTH
+from .types import SavePath
+from .value_labels import CHAR_WIDTH_EM
+
+# Panel title / tick label sizes relative to the single-chart type scale:
+# small multiples trade type size for density.
+_PANEL_TITLE_SCALE = 0.9
+_PANEL_TICK_SCALE = 0.8
+
+# Plot-area frame shared with the single-chart layouts (figure fractions).
+_FRAME_LEFT, _FRAME_RIGHT, _FRAME_TOP, _FRAME_BOTTOM = 0.04, 0.97, 0.7116, 0.1266
+
+PanelData = Union[Sequence[float], Dict[str, Sequence[float]]]
+
+
+def _scale_within(y_min: float, y_max: float) -> dict:
+    """A fixed y range with nice ticks inside it (the steps matplotlib's
+    default locator picks for a single chart's ``ylim``)."""
+    locator = MaxNLocator(nbins=5, steps=[1, 2, 2.5, 5, 10])
+    span = abs(y_max - y_min) * 1e-9
+    lo, hi = min(y_min, y_max) - span, max(y_min, y_max) + span
+    ticks = [float(t) for t in locator.tick_values(y_min, y_max) if lo <= t <= hi]
+    return {
+        "y_min": y_min,
+        "y_max": y_max,
+        "ticks": ticks,
+        "tick_interval": ticks[1] - ticks[0] if len(ticks) > 1 else None,
+    }
+
+
+class FacetMixin(DataMixin):
+    def facet(
+        self,
+        x: Sequence[Any],
+        panels: Dict[str, PanelData],
+        kind: str = "line",
+        ncols: Optional[int] = None,
+        sharey: bool = True,
+        linewidth: Optional[float] = None,
+        show: bool = True,
+        save_path: Optional[SavePath] = None,
+        save_dpi: int = 500,
+        save_format: Optional[str] = None,
+        export_xlsx: bool = True,
+        export_xlsx_path: Optional[str] = None,
+        **save_kwargs: Any,
+    ) -> Tuple[plt.Figure, np.ndarray]:
+        """Render a grid of small panels (small multiples) into one figure.
+
+        The theme, fonts, title/subtitle stack and footer/logo are set up
+        once for the whole grid, and the grid geometry is computed from the
+        type scale up front rather than by measuring each panel.
+
+        Parameters
+        ----------
+        x:
+            Shared x values (categorical, numeric or datetime) for every panel.
+        panels:
+            ``{panel title: ys}``; ``ys`` is one sequence or a ``{label: values}``
+            dict of series, each ``len(x)`` long. Panels are laid out
+            row-major in dict order.
+        kind:
+            ``"line"`` or ``"bar"`` (grouped when a panel has several series).
+        ncols:
+            Grid columns. Default: ``ceil(sqrt(n_panels))``.
+        sharey:
+            ``True`` (default) → one common nice axis for all panels (or the
+            chart's ``ylim`` with nice ticks inside it, else its
+            ``y_scale``), labelled on the first column only. ``False`` → a
+            nice axis solved per panel.
+        linewidth:
+            Line width in points for ``kind="line"``. ``None`` → ``_px(0.6)``.
+        show, save_path, save_dpi, save_format, export_xlsx, export_xlsx_path, **save_kwargs:
+            As for :meth:`~.line_mixin.LineMixin.line`. The exported sheet has
+            one column per panel series, named ``"<panel>"`` or
+            ``"<panel> — <series>"``.
+
+        Returns
+        -------
+        (fig, axes)
+            ``axes`` is the ``(nrows, ncols)`` array of panel axes; unused
+            trailing cells are hidden.
+        """
+        if kind not in ("line", "bar"):
+            raise ValueError(f"kind must be 'line' or 'bar', got {kind!r}")
+        if not panels:
+            raise ValueError("panels cannot be empty")
+        if ncols is not None and ncols < 1:
+            raise ValueError(f"ncols must be >= 1, got {ncols}")
+
+        # ── validate + flatten ────────────────────────────────────────────
+        self._validate_x_nonempty(x)
+        panel_series: List[Tuple[str, List[Tuple[Optional[str], List[float]]]]] = []
+        flat: List[Tuple[Optional[str], List[float]]] = []
+        for name, ys in panels.items():
+            series_list = self._normalize_series(ys)
+            self._validate_series_lengths(x, series_list)
+            self._validate_values(series_list)
+            panel_series.append((str(name), series_list))
+            for lbl, vals in series_list:
+                flat.append((f"{name} — {lbl}" if lbl else str(name), vals))
+        self._compute_max_y_value(flat)
+        self._store_series(x, flat)
+
+        x_plan = self._resolve_x_plan(x, None)
+        positions = x_plan.positions
+        n_panels = len(panel_series)
+        ncols = ncols or math.ceil(math.sqrt(n_panels))
+        nrows = math.ceil(n_panels / ncols)
+
+        # ── y axes: one vectorized solve (shared or per panel) ────────────
+        mins = np.array([min(min(v) for _, v in s) for _, s in panel_series], dtype=float)
+        maxs = np.array([max(max(v) for _, v in s) for _, s in panel_series], dtype=float)
+        if kind == "bar":
+            mins = np.minimum(mins, 0.0)
+        if sharey and (self.ylim is not None or self.y_scale is not None):  # type: ignore[attr-defined]
+            # As in _apply_axis_limits: an explicit ylim beats y_scale.
+            if self.ylim is not None:  # type: ignore[attr-defined]
+                fixed = _scale_within(*self.ylim)  # type: ignore[attr-defined]
+            else:
+                fixed = self.y_scale  # type: ignore[attr-defined]
+            scales = [fixed] * n_panels
+        elif sharey:
+            scales = [calc_shared_y_axis(mins, maxs, kind)] * n_panels
+        else:
+            many = calc_y_axis_many(mins, maxs, kind)
+            scales = [
+                {
+                    "y_min": many["y_min"][i],
+                    "y_max": many["y_max"][i],
+                    "ticks": list(many["ticks"][i]),
+                    "tick_interval": many["tick_interval"][i],
+                }
+                for i in range(n_panels)
+            ]
+        formatter = self._build_formatter(self.y_formatter)  # type: ignore[attr-defined]
+        tick_labels = []
+        for scale in scales:
+            self._y_tick_interval = scale.get("tick_interval")  # type: ignore[attr-defined]
+            tick_labels.append(formatter.format_many(scale.get("ticks", [])))
+
+        logger.info(
+            "Rendering facet grid %r: %d %s panels (%d x %d), sharey=%s",
+            self.title,
+            n_panels,
+            kind,
+            nrows,
+            ncols,
+            sharey,  # type: ignore[attr-defined]
+        )
+
+        effective_lw = linewidth if linewidth is not None else self._px(0.6)  # type: ignore[attr-defined]
+        bar_width = self._auto_bar_width(x_plan, len(x)) if kind == "bar" else 0.0
+
+        with rc_context(self._rc):  # type: ignore[attr-defined]
+            fig, axes = plt.subplots(nrows, ncols, figsize=self.figsize, squeeze=False)  # type: ignore[attr-defined]
+            fig.patch.set_facecolor(self.bg_color)  # type: ignore[attr-defined]
+
+            for i, (name, series_list) in enumerate(panel_series):
+                ax = axes[i // ncols, i % ncols]
+                self._draw_facet_panel(
+                    ax,
+                    name,
+                    series_list,
+                    positions,
+                    kind,
+                    effective_lw,
+                    bar_width,
+                )
+                self._style_facet_panel(
+                    ax,
+                    x,
+                    x_plan,
+                    scales[i],
+                    tick_labels[i],
+                    show_y_labels=(not sharey) or i % ncols == 0,
+                    bar_half_width=bar_width / 2.0,
+                )
+            for j in range(n_panels, nrows * ncols):
+                axes[j // ncols, j % ncols].set_visible(False)
+
+            # Footer first, in the standard frame, so its rule and logo align
+            # with the title whatever the grid's label margin; it may raise
+            # the bottom margin for a tall caption, which the grid honours.
+            fig.subplots_adjust(
+                left=_FRAME_LEFT, right=_FRAME_RIGHT, top=_FRAME_TOP, bottom=_FRAME_BOTTOM
+            )
+            self._add_footer(fig)  # type: ignore[attr-defined]
+            self._layout_facet_grid(fig, nrows, ncols, tick_labels, sharey)
+            self._draw_title_stack(fig)  # type: ignore[attr-defined]
+
+            first_series = panel_series[0][1]
+            if self._should_show_legend(first_series):
+                handles, labels = axes[0, 0].get_legend_handles_labels()
+                axes_height = _FRAME_TOP - _FRAME_BOTTOM
+                fig.legend(
+                    handles,
+                    labels,
+                    loc="upper left",
+                    bbox_to_anchor=(_FRAME_LEFT, _FRAME_BOTTOM + 1.15 * axes_height),
+                    ncol=max(1, min(self.legend_ncol or 3, len(labels))),  # type: ignore[attr-defined]
+                    frameon=False,
+                    fontsize=self._ts("legend"),  # type: ignore[attr-defined]
+                    handlelength=self._px(1.4),  # type: ignore[attr-defined]
+                    handletextpad=self._px(0.4),  # type: ignore[attr-defined]
+                    columnspacing=self._px(1.0),  # type: ignore[attr-defined]
+                    borderaxespad=0.0,
+                )
+
+            if save_path is not None:
+                self.save_figure(fig, save_path, dpi=save_dpi, fmt=save_format, **save_kwargs)  # type: ignore[attr-defined]
+                logger.info("Saved chart -> %s", save_path)
+                if export_xlsx:
+                    self._export_after_save(save_path, export_xlsx_path)
+
+            if show:
+                plt.show()
+
+            return fig, axes
+
+    # ── facet stages ───────────────────────────────────────────────────────
+
+    def _draw_facet_panel(
+        self,
+        ax: plt.Axes,
+        name: str,
+        series_list: List[Tuple[Optional[str], List[float]]],
+        positions: np.ndarray,
+        kind: str,
+        linewidth: float,
+        bar_width: float,
+    ) -> None:
+        """Plot one panel's series and its left-aligned panel title."""
+        ax.set_facecolor(self.bg_color)  # type: ignore[attr-defined]
+        n_series = len(series_list)
+        single_width = bar_width / n_series if n_series else bar_width
+        for idx, (lbl, values) in enumerate(series_list):
+            color = self._series_color(idx, lbl)  # type: ignore[attr-defined]
+            if kind == "bar":
+                offset = -bar_width / 2 + single_width / 2 + idx * single_width
+                ax.bar(
+                    positions + offset,
+                    values,
+                    width=single_width,
+                    label=lbl,
+                    color=color,
+                    zorder=2,
+                    align="center",
+                )
+            else:
+                ax.plot(positions, values, label=lbl, color=color, linewidth=linewidth, zorder=2)
+
+        ax.set_title(
+            name,
+            loc="left",
+            fontsize=self._ts("subtitle") * _PANEL_TITLE_SCALE,  # type: ignore[attr-defined]
+            color=self.color_title,  # type: ignore[attr-defined]
+            fontfamily=self.font_main_family,  # type: ignore[attr-defined]
+            pad=self._px(3),  # type: ignore[attr-defined]
+        )
+
+    def _style_facet_panel(
+        self,
+        ax: plt.Axes,
+        x: Sequence[Any],
+        x_plan: Any,
+        scale: dict,
+        y_labels: List[str],
+        show_y_labels: bool,
+        bar_half_width: float,
+    ) -> None:
+        """Axis limits, gridlines, baseline and first/last x tick labels."""
+        tick_fs = self._ts("tick_label") * _PANEL_TICK_SCALE  # type: ignore[attr-defined]
+        positions = x_plan.positions
+
+        ax.set_ylim(scale["y_min"], scale["y_max"])
+        ticks = scale.get("ticks")
+        if ticks:
+            ax.set_yticks(ticks)
+            ax.set_yticklabels(y_labels if show_y_labels else [])
+        ax.grid(True, axis="y", linewidth=self._px(GRID_LINEWIDTH), color=self.grid_color, zorder=0)  # type: ignore[attr-defined]
+        ax.grid(False, axis="x")
+        ax.tick_params(
+            axis="y",
+            length=0,
+            pad=self._px(2),
+            labelsize=tick_fs,  # type: ignore[attr-defined]
+            labelcolor=self.color_tick,  # type: ignore[attr-defined]
+        )
+
+        lo, hi = float(positions.min()), float(positions.max())
+        ax.set_xlim(lo - bar_half_width, hi + bar_half_width if hi > lo else lo + 1.0)
+        # Small multiples label only the ends of the shared x range.
+        ends = [0, len(x) - 1] if len(x) > 1 else [0]
+        ax.set_xticks([positions[i] for i in ends])
+        ax.set_xticklabels([self._facet_x_label(x[i], x_plan) for i in ends])
+        ax.tick_params(
+            axis="x",
+            length=0,
+            pad=self._px(3),
+            labelsize=tick_fs,  # type: ignore[attr-defined]
+            labelcolor=self.color_tick,  # type: ignore[attr-defined]
+        )
+        if not bar_half_width:
+            # Lines run edge to edge: keep the end labels inside the panel.
+            for label, ha in zip(ax.get_xticklabels(), ("left", "right")):
+                label.set_horizontalalignment(ha)
+
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        ax.spines["bottom"].set_visible(True)
+        ax.spines["bottom"].set_color(self.color_spine)  # type: ignore[attr-defined]
+        ax.spines["bottom"].set_linewidth(self._px(GRID_LINEWIDTH + 0.5))  # type: ignore[attr-defined]
+        if scale["y_min"] < 0 < scale["y_max"]:
+            ax.spines["bottom"].set_position(("data", 0))
+
+    def _facet_x_label(self, value: Any, x_plan: Any) -> str:
+        if x_plan.is_datetime:
+            return pd.Timestamp(value).strftime(self.x_date_format or "%Y")  # type: ignore[attr-defined]
+        return str(value)
+
+    def _layout_facet_grid(
+        self,
+        fig: plt.Figure,
+        nrows: int,
+        ncols: int,
+        tick_labels: List[List[str]],
+        sharey: bool,
+    ) -> None:
+        """Place the grid inside the standard frame in one analytic pass.
+
+        Keeps the current bottom margin (set by ``_add_footer``).
+
+        Gaps are sized from the type scale: a row gap holds the x tick
+        labels plus the next row's panel title; a column gap holds the
+        widest y tick label when every panel is labelled. No draw or text
+        measurement is needed.
+        """
+        fig_w, fig_h = fig.get_size_inches()
+        tick_fs = self._ts("tick_label") * _PANEL_TICK_SCALE  # type: ignore[attr-defined]
+        title_fs = self._ts("subtitle") * _PANEL_TITLE_SCALE  # type: ignore[attr-defined]
+
+        widest = max((len(s) for labels in tick_labels for s in labels), default=0)
+        y_label_in = (widest * CHAR_WIDTH_EM * tick_fs + self._px(4)) / 72.0  # type: ignore[attr-defined]
+        row_gap_in = (1.3 * tick_fs + 1.3 * title_fs + self._px(12)) / 72.0  # type: ignore[attr-defined]
+        col_gap_in = self._px(10) / 72.0 + (0.0 if sharey else y_label_in)  # type: ignore[attr-defined]
+
+        left = _FRAME_LEFT + y_label_in / fig_w
+        grid_w_in = (_FRAME_RIGHT - left) * fig_w
+        # The top row's panel titles sit inside the frame.
+        top = _FRAME_TOP - 1.3 * title_fs / 72.0 / fig_h
+        bottom = fig.subplotpars.bottom
+        grid_h_in = (top - bottom) * fig_h
+
+        axes_w_in = max((grid_w_in - (ncols - 1) * col_gap_in) / ncols, 1e-3)
+        axes_h_in = max((grid_h_in - (nrows - 1) * row_gap_in) / nrows, 1e-3)
+        fig.subplots_adjust(
+            left=left,
+            right=_FRAME_RIGHT,
+            top=top,
+            bottom=bottom,
+            wspace=col_gap_in / axes_w_in,
+            hspace=row_gap_in / axes_h_in,
+        )
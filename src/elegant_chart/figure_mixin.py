@@ -1,13 +1,28 @@
 # elegant_chart/figure_mixin.py
 import os
-from typing import Any, Dict, Optional, Sequence, Tuple
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.text import Annotation
+from matplotlib.transforms import offset_copy
 
 from ._logging import logger
 from ._paths import DEFAULT_LOGO_PATH
 from .axis_utils import calc_y_axis
+from .label_placement import DEFAULT_CANDIDATES, place_labels
+from .outputs import (
+    OutputTarget,
+    is_multi_target,
+    record_written,
+    resolve_targets,
+    wants_encoder,
+    write_outputs,
+)
 from .style_mixin import LINESPACING
+from .types import SavePath
+from .value_labels import anchored_boxes, cull_value_labels, estimate_text_extents
 
 # Hairline weight for horizontal gridlines, in design points (scaled via _px()).
 # The x-axis baseline is drawn at GRID_LINEWIDTH + 0.5 so it reads as visually
@@ -59,8 +74,12 @@ class FigureMixin:
             ax.set_ylim(ylim)
         elif self.ylim is not None:
             ax.set_ylim(self.ylim)
-        elif data_y_min is not None and data_y_max is not None and chart_type is not None:
-            result = calc_y_axis(data_y_min, data_y_max, chart_type, has_top_label=has_top_label)
+        elif self.y_scale is not None or (
+            data_y_min is not None and data_y_max is not None and chart_type is not None
+        ):
+            result = self.y_scale or calc_y_axis(
+                data_y_min, data_y_max, chart_type, has_top_label=has_top_label
+            )
             ax.set_ylim(result["y_min"], result["y_max"])
             self._calculated_y_ticks = result["ticks"]
             self._y_tick_interval = result["tick_interval"]
@@ -71,7 +90,18 @@ class FigureMixin:
             ymax += 0.5
             ax.set_ylim(ymin, ymax)
 
-    def _finalize_axes(self, ax: plt.Axes, rotation: float = 0, has_legend: bool = False) -> None:
+    def _finalize_axes(
+        self,
+        ax: plt.Axes,
+        rotation: float = 0,
+        has_legend: bool = False,
+        value_label_texts: Sequence[Any] = (),
+    ) -> list:
+        """Style spines, draw the title stack / legend / y-tick labels, settle layout.
+
+        Returns the y-tick label texts (inside or outside), so a live update
+        can relabel the axis without redoing the layout.
+        """
         for spine in ax.spines.values():
             spine.set_visible(False)
 
@@ -177,7 +207,7 @@ class FigureMixin:
                     ax, secondary=(self.y_axis_side == "right")
                 )
 
-        self._draw_annotations(ax)
+        annotation_texts = self._draw_annotations(ax)
 
         self._auto_expand_bottom(ax)
 
@@ -206,12 +236,68 @@ class FigureMixin:
         # x start/end, after layout has settled (geometry-dependent).
         self._draw_x_boundary_ticks(ax)  # type: ignore[attr-defined]
 
-    def _draw_annotations(self, ax: plt.Axes) -> None:
+        # De-overlap in-plot text last, once every position is final:
+        # annotations outrank (and are never dropped for) value labels, and
+        # both steer clear of the y-tick labels.
+        movable = list(annotation_texts) + list(value_label_texts)
+        # Pre-placement offsets, so LiveMixin.update can re-place moved labels.
+        self._plot_labels = (list(annotation_texts), [tuple(t.xyann) for t in movable])
+        if movable:
+            n_ann = len(annotation_texts)
+            self._resolve_label_collisions(
+                ax,
+                movable,
+                priority=[1] * n_ann + [0] * (len(movable) - n_ann),
+                required=[True] * n_ann + [False] * (len(movable) - n_ann),
+                obstacles=inside_ytick_texts + outside_ytick_texts,
+            )
+        return inside_ytick_texts + outside_ytick_texts
+
+    def _draw_title_stack(self, fig: plt.Figure) -> None:
+        """Title and subtitle in figure coordinates, at the standard frame's offsets.
+
+        Used by layouts that do not anchor the stack to a single axes
+        (horizontal bar, bump, facet grid); the positions match the
+        axes-anchored stack of ``_finalize_axes`` for the default frame.
+        """
+        axes_height = 0.7116 - 0.1266
+        if self.title:
+            fig.text(
+                0.04,
+                0.1266 + 1.234 * axes_height,
+                self.title,
+                fontsize=self._ts("title"),
+                va="bottom",
+                ha="left",
+                color=self.color_title,
+                fontfamily=self.font_title_family,
+                fontweight=self.font_title_weight,
+                linespacing=LINESPACING,
+                clip_on=False,
+            )
+        if self.subtitle:
+            fig.text(
+                0.04,
+                0.1266 + 1.220 * axes_height,
+                self.subtitle,
+                fontsize=self._ts("subtitle"),
+                va="top",
+                ha="left",
+                color=self.color_subtitle,
+                fontfamily=self.font_main_family,
+                linespacing=LINESPACING,
+                clip_on=False,
+            )
+
+    def _draw_annotations(self, ax: plt.Axes) -> list:
         """Draw sparse, muted-grey in-plot annotations declared via `annotations=[...]`.
 
         Each entry is a dict: {"x", "y", "text", "dx"=0, "dy"=0,
         "ha"="left", "va"="bottom", "arrow"=False}.
+
+        Returns the created Annotation artists (for collision resolution).
         """
+        texts = []
         for ann in self.annotations:
             arrowprops = None
             if ann.get("arrow"):
@@ -220,7 +306,7 @@ class FigureMixin:
                     color=self.color_annotation,
                     linewidth=self._px(0.5),
                 )
-            ax.annotate(
+            ann_text = ax.annotate(
                 ann["text"],
                 xy=(ann["x"], ann["y"]),
                 xytext=(ann.get("dx", 0), ann.get("dy", 0)),
@@ -233,6 +319,130 @@ class FigureMixin:
                 arrowprops=arrowprops,
                 zorder=5,
             )
+            texts.append(ann_text)
+        return texts
+
+    def _draw_value_labels(
+        self,
+        ax: plt.Axes,
+        series: Sequence[Tuple[Sequence[float], Sequence[float], Sequence[str], Sequence[float]]],
+        offset: Tuple[float, float] = (0.0, 0.0),
+        ha: str = "center",
+        va: str = "bottom",
+        along: int = 0,
+        return_index: bool = False,
+    ) -> Any:
+        """Draw pre-formatted value labels, culled to the ones that fit.
+
+        ``series`` holds one ``(xs, ys, texts, values)`` tuple per series:
+        data-space anchors, the formatted label strings (see
+        ``AxisMixin._format_values``) and the raw values that rank the
+        candidates. Call once the axis limits are set. With
+        ``avoid_label_overlap`` on, footprints are estimated from character
+        counts and only labels that fit are created — the last point, the
+        extrema and an every-k-th subset first — so dense series cost a
+        handful of artists rather than one per point. ``offset`` is in
+        points; ``along`` is the axis (0 = x, 1 = y) the labels advance on.
+
+        Returns the created Annotation artists; with ``return_index``, an
+        ``(artists, indices)`` pair whose indices point into the concatenated
+        series (so a later update can find each label's value again).
+        """
+        if not series:
+            return ([], np.zeros(0, dtype=int)) if return_index else []
+        xs = np.concatenate([np.asarray(s[0], dtype=float) for s in series])
+        ys = np.concatenate([np.asarray(s[1], dtype=float) for s in series])
+        texts = [t for s in series for t in s[2]]
+        fontsize = self._ts("value_label")
+
+        keep = np.ones(len(texts), dtype=bool)
+        if self.avoid_label_overlap and len(texts) > 1:
+            px_per_pt = ax.get_figure().dpi / 72.0
+            anchors = ax.transData.transform(np.column_stack([xs, ys]))
+            widths, heights = estimate_text_extents(texts, fontsize * px_per_pt)
+            boxes = anchored_boxes(
+                anchors, widths, heights, ha=ha, va=va,
+                offset=(offset[0] * px_per_pt, offset[1] * px_per_pt),
+            )
+            keep = cull_value_labels(
+                boxes, [s[3] for s in series], along=along, padding=self._px(1) * px_per_pt
+            )
+
+        kept = np.flatnonzero(keep)
+        artists = [
+            ax.annotate(
+                texts[i],
+                xy=(xs[i], ys[i]),
+                xytext=offset,
+                textcoords="offset points",
+                ha=ha,
+                va=va,
+                fontsize=fontsize,
+                color=self.color_text_main,
+                zorder=6,
+            )
+            for i in kept
+        ]
+        logger.debug("Value labels: drew %d of %d", len(artists), len(texts))
+        return (artists, kept) if return_index else artists
+
+    def _resolve_label_collisions(
+        self,
+        ax: plt.Axes,
+        texts: Sequence[Any],
+        priority: Optional[Sequence[float]] = None,
+        required: Optional[Sequence[bool]] = None,
+        obstacles: Sequence[Any] = (),
+        candidates: Sequence[Tuple[float, float]] = DEFAULT_CANDIDATES,
+    ) -> None:
+        """Nudge or hide overlapping Text artists via :func:`~.label_placement.place_labels`.
+
+        Shared by ``bar()``, ``line()`` and ``bump()``. Boxes are the texts'
+        rendered extents (no full canvas draw needed); each label is tried
+        at its own position, then one line up, then one line down, and
+        hidden if all three collide with a higher-priority label or an
+        ``obstacles`` artist. Offsets are applied in points, so they hold at
+        any save DPI. A no-op when ``avoid_label_overlap`` is off.
+        """
+        if not self.avoid_label_overlap or not texts:
+            return
+
+        fig = ax.get_figure()
+        try:
+            renderer = fig.canvas.get_renderer()
+            boxes = np.array([t.get_window_extent(renderer).extents for t in texts])
+            fixed = [o.get_window_extent(renderer).extents for o in obstacles if o.get_visible()]
+            accepted, offsets = place_labels(
+                boxes,
+                candidates=candidates,
+                priority=priority,
+                obstacles=np.array(fixed) if fixed else None,
+                padding=self._px(1) * fig.dpi / 72.0,
+                required=required,
+            )
+        except Exception:
+            logger.debug("_resolve_label_collisions geometry step failed", exc_info=True)
+            return
+
+        px_to_pt = 72.0 / fig.dpi
+        for text, ok, (dx, dy) in zip(texts, accepted, offsets):
+            if not ok:
+                text.set_visible(False)
+            elif dx or dy:
+                if isinstance(text, Annotation) and text.anncoords == "offset points":
+                    x_off, y_off = text.xyann
+                    text.xyann = (x_off + dx * px_to_pt, y_off + dy * px_to_pt)
+                else:
+                    text.set_transform(
+                        offset_copy(
+                            text.get_transform(),
+                            fig=fig,
+                            x=dx * px_to_pt,
+                            y=dy * px_to_pt,
+                            units="points",
+                        )
+                    )
+        logger.debug("Label placement: kept %d of %d labels", int(accepted.sum()), len(texts))
 
     def _auto_expand_bottom(self, ax: plt.Axes) -> None:
         """Re-adjust bottom margin if x-tick labels bleed below the figure boundary."""
@@ -605,19 +815,70 @@ class FigureMixin:
     def save_figure(
         self,
         fig: plt.Figure,
-        save_path: str,
+        save_path: SavePath,
         dpi: int = 500,
         fmt: Optional[str] = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> List[OutputTarget]:
+        """Save *fig*; a list of targets (or a dict spec) is written from this one layout.
+
+        See :mod:`~elegant_chart.outputs` for the multi-target forms, including
+        ``{"densities": …, "thumbnail": …}`` srcset variants. With a list,
+        each target's own extension picks its format before *fmt*. Encoder
+        options (``compress_level``, ``quantize``, ``quality``,
+        ``strip_metadata``) and SVG writer options (``compact_svg``,
+        ``svg_precision``, ``rasterize_dense``) in *kwargs* route even a
+        single path through :func:`~elegant_chart.outputs.write_outputs`, as
+        does a chart ``output_writer`` (the files are then written in the
+        background; see :meth:`flush_outputs`).
+
+        Returns the written :class:`~elegant_chart.outputs.OutputTarget`
+        entries with their ``size_bytes`` and ``encode_seconds`` (for a plain
+        single-path save, the whole ``savefig`` call); also kept as
+        :attr:`last_outputs`. With an ``output_writer`` they are filled in
+        once the writer has flushed.
+        """
+        writer = self.output_writer  # type: ignore[attr-defined]
+        if writer is not None or is_multi_target(save_path) or wants_encoder(kwargs):
+            targets = resolve_targets(save_path, dpi, fmt, **kwargs)
+            write_outputs(
+                fig,
+                targets,
+                workers=self.save_workers,  # type: ignore[attr-defined]
+                writer=writer,
+            )
+            self._last_outputs = targets
+            return targets
         if fmt is None:
             ext = os.path.splitext(str(save_path))[1].lower().lstrip(".")
             if ext:
                 fmt = ext
 
+        target = OutputTarget(save_path, fmt or plt.rcParams["savefig.format"], float(dpi), kwargs)
+        start = time.perf_counter()
         fig.savefig(
             save_path,
             dpi=dpi,
             format=fmt,
             **kwargs,
         )
+        record_written(target, start)
+        self._last_outputs = [target]
+        return [target]
+
+    @property
+    def last_outputs(self) -> List[OutputTarget]:
+        """The files written by the last save of a render, ``update()`` or
+        :meth:`save_figure`: one :class:`~elegant_chart.outputs.OutputTarget`
+        each, with its path, format, dpi, ``size_bytes`` and
+        ``encode_seconds``. Empty before the first save.
+        """
+        return list(self._last_outputs)  # type: ignore[attr-defined]
+
+    def flush_outputs(self) -> None:
+        """Wait for saves/exports queued on ``output_writer``; re-raise the first failure.
+
+        A no-op without an ``output_writer``, when every save is synchronous.
+        """
+        if self.output_writer is not None:  # type: ignore[attr-defined]
+            self.output_writer.flush()  # type: ignore[attr-defined]
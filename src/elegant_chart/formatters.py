@@ -0,0 +1,186 @@
+"""Batch tick / value-label formatters.
+
+Each formatter is a matplotlib :class:`~matplotlib.ticker.Formatter` that
+also offers ``format_many(values) -> list[str]``: the built-in formats are
+applied to a whole array in one numpy pass, and results are memoized per
+value, so tick labels, value labels and the custom y-tick label renderers
+all share one cheap formatting path. matplotlib's own tick update goes
+through :meth:`BatchFormatter.format_ticks`, i.e. the same batch path.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Callable, Hashable, Optional, Sequence
+
+import numpy as np
+from matplotlib.ticker import Formatter
+
+# Memoized labels kept per formatter before the memo is reset.
+_MEMO_SIZE = 4096
+
+
+def _strip_zeros(labels: np.ndarray) -> np.ndarray:
+    return np.char.rstrip(np.char.rstrip(labels, "0"), ".")
+
+
+@lru_cache(maxsize=256)
+def decimals_for_interval(interval: Optional[float]) -> int:
+    """Decimals needed to tell ticks ``interval`` apart (0 for >= 1 or unset)."""
+    return max(0, -math.floor(math.log10(interval))) if interval else 0
+
+
+def format_compact(values: Sequence[float], decimals: int = 0) -> list[str]:
+    """Compact labels: K / M / B suffix at >= 1e3 / 1e6 / 1e9, else fixed decimals.
+
+    Suffixed values keep one decimal with trailing zeros stripped; smaller
+    values use ``decimals`` fixed decimals, with ``-0`` normalised to ``0``.
+    """
+    v = np.asarray(values, dtype=float).ravel()
+    mag = np.abs(v)
+    small = f"%.{int(decimals)}f"
+    out = np.char.mod(small, v).astype(object)
+    zero = small % 0.0
+    out[out == "-" + zero] = zero
+    # Largest scale last, so it wins for values above every threshold.
+    for scale, suffix in ((1e3, "K"), (1e6, "M"), (1e9, "B")):
+        mask = mag >= scale
+        if mask.any():
+            out[mask] = np.char.add(_strip_zeros(np.char.mod("%.1f", v[mask] / scale)), suffix)
+    return out.tolist()
+
+
+def format_plain(values: Sequence[float]) -> list[str]:
+    """Vectorized ``f"{x:g}"``."""
+    return np.char.mod("%g", np.asarray(values, dtype=float).ravel()).tolist()
+
+
+def format_percent(values: Sequence[float]) -> list[str]:
+    """Vectorized ``f"{x * 100:g}%"``."""
+    return np.char.mod("%g%%", np.asarray(values, dtype=float).ravel() * 100).tolist()
+
+
+def format_norm_max(
+    values: Sequence[float], max_y: Optional[float], decimals: int = 0
+) -> list[str]:
+    """``x / max_y`` to ``decimals`` places, trailing zeros stripped; ``""`` without a max."""
+    v = np.asarray(values, dtype=float).ravel()
+    if max_y is None or max_y == 0:
+        return [""] * len(v)
+    return _strip_zeros(np.char.mod(f"%.{int(decimals)}f", v / max_y)).tolist()
+
+
+class BatchFormatter(Formatter):
+    """Base class: memoized, array-at-a-time formatting.
+
+    Subclasses implement :meth:`_format_array`; ones whose output depends on
+    external state (tick interval, data max) report it from :meth:`_state`,
+    and the memo is dropped whenever that state changes.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[float, str] = {}
+        self._memo_state: Hashable = None
+
+    def _state(self) -> Hashable:
+        return None
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        raise NotImplementedError
+
+    def format_many(self, values: Sequence[float]) -> list[str]:
+        """Format every value in *values*, reusing memoized labels."""
+        state = self._state()
+        if state != self._memo_state or len(self._memo) > _MEMO_SIZE:
+            self._memo.clear()
+            self._memo_state = state
+
+        flat = np.asarray(values, dtype=float).ravel()
+        keys = flat.tolist()
+        memo = self._memo
+        out = [memo.get(k) for k in keys]
+        missing = [i for i, s in enumerate(out) if s is None]
+        if missing:
+            fresh = self._format_array(flat[missing])
+            for i, label in zip(missing, fresh):
+                out[i] = label
+                memo[keys[i]] = label
+        return out
+
+    def format_ticks(self, values: Sequence[float]) -> list[str]:
+        return self.format_many(values)
+
+    def __call__(self, x: float, pos: Optional[int] = None) -> str:
+        return self.format_many([x])[0]
+
+
+class CompactFormatter(BatchFormatter):
+    """K / M / B compact labels; sub-1000 decimals follow the tick interval."""
+
+    def __init__(self, interval: Callable[[], Optional[float]] = lambda: None) -> None:
+        super().__init__()
+        self._interval = interval
+
+    def _state(self) -> Hashable:
+        return decimals_for_interval(self._interval())
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        return format_compact(values, self._memo_state)
+
+
+class PlainFormatter(BatchFormatter):
+    """``f"{x:g}"`` labels."""
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        return format_plain(values)
+
+
+class PercentFormatter(BatchFormatter):
+    """Fractions as percentages: ``0.25`` → ``"25%"``."""
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        return format_percent(values)
+
+
+class NormMaxFormatter(BatchFormatter):
+    """Values as a fraction of the data maximum, to ``decimals`` places."""
+
+    def __init__(self, max_y: Callable[[], Optional[float]], decimals: int = 0) -> None:
+        super().__init__()
+        self._max_y = max_y
+        self.decimals = int(decimals)
+
+    def _state(self) -> Hashable:
+        return self._max_y()
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        return format_norm_max(values, self._memo_state, self.decimals)
+
+
+class TemplateFormatter(BatchFormatter):
+    """``str.format`` template with an ``{x}`` field, e.g. ``"{x:.1f}%"``."""
+
+    def __init__(self, template: str) -> None:
+        super().__init__()
+        self.template = template
+
+    def _format_array(self, values: np.ndarray) -> list[str]:
+        return [self.template.format(x=v) for v in values.tolist()]
+
+
+class CallableFormatter(BatchFormatter):
+    """User ``(x, pos) -> str`` callable; never memoized, as it may use ``pos``."""
+
+    def __init__(self, func: Callable[[float, int], str]) -> None:
+        super().__init__()
+        self.func = func
+
+    def format_many(self, values: Sequence[float]) -> list[str]:
+        return [self.func(v, 0) for v in np.asarray(values, dtype=float).ravel().tolist()]
+
+    def format_ticks(self, values: Sequence[float]) -> list[str]:
+        return [self.func(v, pos) for pos, v in enumerate(values)]
+
+    def __call__(self, x: float, pos: Optional[int] = None) -> str:
+        return self.func(x, pos)
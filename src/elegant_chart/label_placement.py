@@ -0,0 +1,159 @@
+"""Collision-aware label placement over a grid-bucket spatial index.
+
+Labels are treated as axis-aligned boxes in display (pixel) space. Each one
+is tried at a short list of candidate offsets, in priority order, and
+accepted at the first offset whose box overlaps nothing already placed;
+labels with no free candidate are rejected (dropped by the caller).
+
+Placed boxes are hashed into a uniform grid of cells about one typical
+label in size, so each collision query only inspects the handful of boxes
+sharing its cells rather than every box placed so far. With the priority
+sort that makes a full pass roughly O(n log n) instead of the O(n²) of
+pairwise checks.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Default candidate offsets, in multiples of the label's own (width, height):
+# stay put, then nudge one line up, then one line down.
+DEFAULT_CANDIDATES: Tuple[Tuple[float, float], ...] = ((0.0, 0.0), (0.0, 1.0), (0.0, -1.0))
+
+# Smallest grid cell edge, in display units.
+_MIN_CELL = 4.0
+
+
+class LabelGrid:
+    """Uniform-grid spatial hash of axis-aligned boxes ``(x0, y0, x1, y1)``."""
+
+    def __init__(self, cell_w: float, cell_h: float) -> None:
+        self.cell_w = max(float(cell_w), _MIN_CELL)
+        self.cell_h = max(float(cell_h), _MIN_CELL)
+        self._cells: defaultdict[Tuple[int, int], list[int]] = defaultdict(list)
+        self._boxes: list[Tuple[float, float, float, float]] = []
+
+    def _cell_range(self, box: Tuple[float, float, float, float]) -> Tuple[range, range]:
+        x0, y0, x1, y1 = box
+        return (
+            range(math.floor(x0 / self.cell_w), math.floor(x1 / self.cell_w) + 1),
+            range(math.floor(y0 / self.cell_h), math.floor(y1 / self.cell_h) + 1),
+        )
+
+    def insert(self, box: Tuple[float, float, float, float]) -> None:
+        idx = len(self._boxes)
+        self._boxes.append(box)
+        cols, rows = self._cell_range(box)
+        for i in cols:
+            for j in rows:
+                self._cells[(i, j)].append(idx)
+
+    def collides(self, box: Tuple[float, float, float, float]) -> bool:
+        """True if *box* overlaps (with positive area) any inserted box."""
+        x0, y0, x1, y1 = box
+        cols, rows = self._cell_range(box)
+        seen: set[int] = set()
+        for i in cols:
+            for j in rows:
+                for idx in self._cells.get((i, j), ()):
+                    if idx in seen:
+                        continue
+                    seen.add(idx)
+                    bx0, by0, bx1, by1 = self._boxes[idx]
+                    if x0 < bx1 and bx0 < x1 and y0 < by1 and by0 < y1:
+                        return True
+        return False
+
+
+def place_labels(
+    boxes: np.ndarray,
+    candidates: Sequence[Tuple[float, float]] = DEFAULT_CANDIDATES,
+    priority: Optional[Sequence[float]] = None,
+    obstacles: Optional[np.ndarray] = None,
+    padding: float = 0.0,
+    required: Optional[Sequence[bool]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Choose a non-overlapping offset for each label box, or reject it.
+
+    Parameters
+    ----------
+    boxes:
+        ``(n, 4)`` array of label boxes ``(x0, y0, x1, y1)`` in display units.
+    candidates:
+        Offsets to try, in order, as multiples of each box's own
+        ``(width, height)``; ``(0, 0)`` (the original position) should
+        normally come first.
+    priority:
+        Optional per-label score; higher-priority labels are placed first and
+        so win any contest for space. Ties keep input order. Default: input
+        order.
+    obstacles:
+        Optional ``(m, 4)`` array of fixed boxes (e.g. tick labels or
+        user annotations) that labels must avoid but which never move.
+    padding:
+        Extra clearance added around every label box, in display units.
+    required:
+        Optional per-label mask of labels that must never be dropped (e.g.
+        user-declared annotations). A required label with no free candidate
+        is still accepted, at its original position.
+
+    Returns
+    -------
+    (accepted, offsets)
+        ``accepted`` is a boolean mask of the labels that found a free spot;
+        ``offsets`` is an ``(n, 2)`` array of the chosen display-unit
+        ``(dx, dy)`` shift (zero for rejected labels).
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    n = len(boxes)
+    accepted = np.zeros(n, dtype=bool)
+    offsets = np.zeros((n, 2))
+    if n == 0:
+        return accepted, offsets
+
+    widths = boxes[:, 2] - boxes[:, 0]
+    heights = boxes[:, 3] - boxes[:, 1]
+    # Empty labels (e.g. "") occupy no space: always accepted, never indexed.
+    empty = (widths <= 0) | (heights <= 0)
+    accepted[empty] = True
+    if empty.all():
+        return accepted, offsets
+
+    # Cells about one median label in size keep every bucket short; the
+    # floor stops a degenerate median from exploding the cell count.
+    cell_w = max(float(np.median(widths[~empty])) + 2 * padding, _MIN_CELL)
+    cell_h = max(float(np.median(heights[~empty])) + 2 * padding, _MIN_CELL)
+    grid = LabelGrid(cell_w, cell_h)
+    if obstacles is not None:
+        for box in np.asarray(obstacles, dtype=float).reshape(-1, 4):
+            grid.insert(tuple(box))
+
+    if priority is None:
+        order = np.arange(n)
+    else:
+        # Stable descending sort: equal priorities keep their input order.
+        order = np.argsort(-np.asarray(priority, dtype=float), kind="stable")
+
+    must_keep = np.zeros(n, dtype=bool) if required is None else np.asarray(required, dtype=bool)
+    cand = np.asarray(candidates, dtype=float).reshape(-1, 2)
+    for i in order:
+        if empty[i]:
+            continue
+        x0, y0, x1, y1 = boxes[i]
+        for fx, fy in cand:
+            dx, dy = fx * widths[i], fy * heights[i]
+            box = (x0 + dx - padding, y0 + dy - padding, x1 + dx + padding, y1 + dy + padding)
+            if not grid.collides(box):
+                grid.insert(box)
+                accepted[i] = True
+                offsets[i] = (dx, dy)
+                break
+        else:
+            if must_keep[i]:
+                grid.insert((x0 - padding, y0 - padding, x1 + padding, y1 + padding))
+                accepted[i] = True
+    return accepted, offsets
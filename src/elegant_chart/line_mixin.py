@@ -9,7 +9,7 @@ from matplotlib import rc_context
 
 from ._logging import logger
 from .data_mixin import DataMixin
-from .types import FormatterSpec
+from .types import FormatterSpec, SavePath
 
 
 class LineMixin(DataMixin):
@@ -45,7 +45,7 @@ class LineMixin(DataMixin):
         align_x_edges: Optional[bool] = None,
         alpha_map: Optional[Dict[str, float]] = None,
         show: bool = True,
-        save_path: Optional[str] = None,
+        save_path: Optional[SavePath] = None,
         save_dpi: int = 500,
         save_format: Optional[str] = None,
         export_xlsx: bool = True,
@@ -54,6 +54,9 @@ class LineMixin(DataMixin):
     ) -> Tuple[plt.Figure, plt.Axes]:
         """Create a line chart with categorical, numeric, or datetime x values."""
 
+        # The call as made, replayed by update() when new data needs a fresh layout.
+        render_call = {k: v for k, v in locals().items() if k != "self"}
+
         x, series_list, x_plan, active_xlim = self._prepare_render(
             "line", x, ys, labels, df, x_col, y_cols,
             xlim, x_minor_ticks, x_upper_pad, align_x_edges,
@@ -79,15 +82,14 @@ class LineMixin(DataMixin):
                 ax.xaxis_date()
 
             # ── draw lines ────────────────────────────────────────────────
-            val_fmt = self._build_formatter(
-                y_formatter if y_formatter is not None else self.y_formatter
-            )  # type: ignore[attr-defined]
-
+            label_spec = y_formatter if y_formatter is not None else self.y_formatter  # type: ignore[attr-defined]
+            value_label_series = []
+            lines = []
             for idx, (lbl, values) in enumerate(series_list):
                 color = self._series_color(idx, lbl)  # type: ignore[attr-defined]
                 alpha = (alpha_map or {}).get(lbl) if lbl is not None else None
                 if markers:
-                    ax.plot(
+                    (artist,) = ax.plot(
                         x_positions,
                         values,
                         label=lbl,
@@ -99,7 +101,7 @@ class LineMixin(DataMixin):
                         zorder=2,
                     )
                 else:
-                    ax.plot(
+                    (artist,) = ax.plot(
                         x_positions,
                         values,
                         label=lbl,
@@ -108,20 +110,13 @@ class LineMixin(DataMixin):
                         linewidth=effective_lw,
                         zorder=2,
                     )
+                lines.append(artist)
 
                 if show_value_labels:
-                    for xp, v in zip(x_positions, values):
-                        ax.annotate(
-                            val_fmt(float(v), 0),
-                            xy=(float(xp), float(v)),
-                            xytext=(0, self._px(5)),  # type: ignore[attr-defined]
-                            textcoords="offset points",
-                            ha="center",
-                            va="bottom",
-                            fontsize=self._ts("value_label"),  # type: ignore[attr-defined]
-                            color=self.color_text_main,  # type: ignore[attr-defined]
-                            zorder=6,
-                        )
+                    # Formatted now, one pass per series; drawn (and culled)
+                    # once the axis limits below are known.
+                    texts = self._format_values(values, label_spec)  # type: ignore[attr-defined]
+                    value_label_series.append((x_positions, values, texts, values))
 
             # ── axis limits ───────────────────────────────────────────────
             all_values = [v for _, values in series_list for v in values]
@@ -163,9 +158,13 @@ class LineMixin(DataMixin):
                 x_year_tick_interval=x_year_tick_interval,
             )
 
+            value_label_texts, value_label_index = self._draw_value_labels(  # type: ignore[attr-defined]
+                ax, value_label_series, offset=(0, self._px(5)), return_index=True  # type: ignore[attr-defined]
+            )
+
             # ── finalize + output ─────────────────────────────────────────
             has_legend = self._should_show_legend(series_list)
-            self._finalize_and_output(
+            ytick_texts = self._finalize_and_output(
                 fig,
                 ax,
                 rotation=rotation,
@@ -176,7 +175,14 @@ class LineMixin(DataMixin):
                 show=show,
                 export_xlsx=export_xlsx,
                 export_xlsx_path=export_xlsx_path,
+                value_label_texts=value_label_texts,
                 **save_kwargs,
             )
+            self._record_render(  # type: ignore[attr-defined]
+                fig, ax, "line", lines, value_label_texts, value_label_index, len(x), label_spec,
+                ytick_texts=ytick_texts,
+                y_range=(data_y_min, data_y_max),
+                render_call=render_call,
+            )
 
             return fig, ax
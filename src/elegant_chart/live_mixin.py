@@ -0,0 +1,658 @@
+# elegant_chart/live_mixin.py
+from __future__ import annotations
+
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import rc_context
+from matplotlib.ticker import FixedLocator, FuncFormatter, MaxNLocator
+
+from ._logging import logger
+from .axis_utils import calc_y_axis
+from .data_mixin import DataMixin
+from .formatters import NormMaxFormatter
+from .outputs import OutputTarget, encode_raster, is_multi_target, record_written
+from .ring_buffer import RingBuffer
+from .static_layer import RenderState, StaticLayer
+from .types import FormatterSpec, SavePath
+from .value_labels import estimate_text_extents
+
+
+@dataclass
+class StreamState:
+    """Buffer, settings and shifting-axis bookkeeping of a ``stream()`` chart.
+
+    ``cadence`` maps ``"major"`` / ``"minor"`` to the ``(anchor, step)`` of
+    the x ticks; frames with the same span as ``cadence_span`` (a full
+    window at a steady sample rate) slide those ticks along, and only a
+    changed span asks ``locator`` for a new cadence. ``boundary`` pairs each
+    boundary-tick line with the data edge (0 = first, 1 = last) it marks.
+    """
+
+    window: int
+    labels: Optional[List[Optional[str]]]
+    max_fps: float
+    save_path: Optional[str]
+    save_dpi: int
+    line_kwargs: Dict[str, Any]
+    buffer: Optional[RingBuffer] = None
+    is_datetime: bool = False
+    last_frame: float = -math.inf
+    state: Optional[RenderState] = None
+    x_pad: Tuple[float, float] = (0.0, 0.0)
+    cadence: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    cadence_span: float = 0.0
+    locator: Any = None
+    boundary: List[Tuple[Any, int]] = field(default_factory=list)
+
+
+class LiveMixin(DataMixin):
+    def stream(
+        self,
+        window: int,
+        labels: Optional[Sequence[Optional[str]]] = None,
+        max_fps: float = 2.0,
+        save_path: Optional[str] = None,
+        save_dpi: int = 500,
+        **line_kwargs: Any,
+    ) -> None:
+        """Start a live line chart fed point by point through :meth:`append`.
+
+        The last ``window`` points of every series live in a preallocated
+        ring buffer. The first frame is one ordinary ``line()`` render; after
+        that a frame only moves the lines, slides the x ticks (same cadence,
+        shifted; the locator only runs again when the window's span changes,
+        e.g. while it fills), settles the value axis as :meth:`update` does
+        and blits everything over the cached static layer. Frames are
+        rendered at most ``max_fps`` times a second.
+
+        Parameters
+        ----------
+        window:
+            Points kept per series.
+        labels:
+            Series labels. Default: taken from the first :meth:`append`
+            (dict keys), else unlabelled.
+        max_fps:
+            Frame-rate cap; ``0`` renders on every append.
+        save_path:
+            Write each frame here as PNG (overwritten in place).
+        save_dpi:
+            Frame resolution.
+        **line_kwargs:
+            Passed to the frame's ``line()`` render (``linewidth``,
+            ``y_formatter``, ``x_date_format``, ``ylim`` …).
+        """
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+        if max_fps < 0:
+            raise ValueError(f"max_fps must be >= 0, got {max_fps}")
+        if self._stream is not None and self._stream.state is not None:  # type: ignore[attr-defined]
+            plt.close(self._stream.state.fig)  # type: ignore[attr-defined]
+        self._stream = StreamState(  # type: ignore[attr-defined]
+            window=int(window),
+            labels=list(labels) if labels is not None else None,
+            max_fps=float(max_fps),
+            save_path=save_path,
+            save_dpi=save_dpi,
+            line_kwargs=dict(line_kwargs),
+        )
+
+    def append(
+        self,
+        t: Any,
+        values: Union[float, Sequence[float], Dict[str, float]],
+        force: bool = False,
+    ) -> Optional[bytes]:
+        """Add one point per series to the :meth:`stream` and maybe draw a frame.
+
+        Parameters
+        ----------
+        t:
+            Timestamp (``datetime`` / ``numpy.datetime64`` / ``pandas.Timestamp``)
+            or number; must not mix kinds within a stream.
+        values:
+            One value per series: a number (single series), a sequence in
+            series order, or a ``{label: value}`` dict.
+        force:
+            Draw a frame now, ignoring the frame-rate cap.
+
+        Returns
+        -------
+        bytes or None
+            The frame's PNG, or ``None`` when no frame was drawn (rate-capped,
+            or fewer than two points buffered).
+        """
+        st = self._stream  # type: ignore[attr-defined]
+        if st is None:
+            raise RuntimeError("No stream to append to. Call stream(window=...) first.")
+
+        if isinstance(values, dict):
+            if st.labels is None:
+                st.labels = [str(k) for k in values]
+            missing = [lbl for lbl in st.labels if lbl not in values]
+            if missing or len(values) != len(st.labels):
+                raise ValueError(f"values must have exactly the series {st.labels}")
+            row = [values[lbl] for lbl in st.labels]
+        else:
+            row = list(np.atleast_1d(np.asarray(values, dtype=float)))
+            if st.labels is None:
+                st.labels = [None] * len(row)
+            if len(row) != len(st.labels):
+                raise ValueError(f"values must have {len(st.labels)} entries, got {len(row)}")
+        if not np.all(np.isfinite(row)):
+            raise ValueError("values contain non-finite values (NaN or +/-inf)")
+
+        is_datetime = isinstance(t, (datetime, np.datetime64))
+        if st.buffer is None:
+            st.buffer = RingBuffer(st.window, 1 + len(row))
+            st.is_datetime = is_datetime
+        elif is_datetime != st.is_datetime:
+            raise ValueError("t must stay datetime-like or numeric for the whole stream")
+        st.buffer.append([mdates.date2num(t) if is_datetime else float(t), *row])
+
+        now = time.monotonic()
+        if len(st.buffer) < 2 or (
+            not force and st.max_fps > 0 and now - st.last_frame < 1.0 / st.max_fps
+        ):
+            return None
+        st.last_frame = now
+        return self._render_stream_frame(st)
+
+    def update(
+        self,
+        ys: Optional[Union[Sequence[Any], Dict[str, Sequence[Any]]]] = None,
+        x: Optional[Sequence[Any]] = None,
+        labels: Optional[Sequence[Optional[str]]] = None,
+        save_path: Optional[SavePath] = None,
+        show: bool = False,
+    ) -> Tuple[plt.Figure, plt.Axes]:
+        """Push new data into the last ``line()`` / vertical ``bar()`` chart.
+
+        Work is done in three escalating tiers:
+
+        1. The existing ``Line2D`` data, bar heights and value labels are
+           moved to the new values, and the labels de-overlapped again as
+           the render placed them. If the value axis that ``calc_y_axis``
+           solves for the new range is unchanged (or the axis is pinned by
+           ``ylim`` / ``y_scale``), nothing else is touched and the output
+           is blitted over the cached static layer.
+        2. Otherwise the limits and ticks are reset and the y-tick labels
+           redrawn in place — as long as the widest label keeps its width.
+        3. Only when the tick-label width changes (which moves the layout),
+           the zero baseline appears or disappears, or a new ``x`` is given,
+           is the chart re-rendered with the original arguments.
+
+        The figure is then re-saved where the render saved it (or to
+        ``save_path``), with the render's data export settings.
+
+        Parameters
+        ----------
+        ys, labels:
+            The new payload, shaped like the rendered one (a dict is matched
+            by series label). ``None`` keeps the current values.
+        x:
+            New x values. Re-renders (tier 3); the point count may change.
+        save_path:
+            Save here instead of the render's ``save_path``.
+        show:
+            Call ``plt.show()`` afterwards.
+
+        Returns
+        -------
+        (fig, ax)
+            The live figure and axes — new objects after a tier-3 re-render.
+
+        Raises
+        ------
+        RuntimeError
+            If no ``line()`` or vertical ``bar()`` chart has been rendered.
+        """
+        state = self._live_state()
+        new_x = x is not None and list(x) != list(self._last_x)  # type: ignore[attr-defined]
+        if ys is not None:
+            series_list = self._match_payload(state, ys, labels, x=x)
+        else:
+            series_list = list(self._last_series_list)  # type: ignore[attr-defined]
+            self._validate_series_lengths(x if x is not None else self._last_x, series_list)  # type: ignore[attr-defined]
+
+        if not new_x:
+            self._apply_series_data(state, series_list)
+            tier = self._refresh_value_axis(state, series_list)
+            if tier < 3:
+                logger.debug("update(): tier %d (in place)", tier)
+                self._replace_value_labels(state)
+                if tier == 2 and state.layer is not None:
+                    state.layer.invalidate()
+                self._save_live(state, save_path)
+                if show:
+                    plt.show()
+                return state.fig, state.ax
+
+        logger.debug("update(): tier 3 (re-render)")
+        plt.close(state.fig)
+        call = dict(state.render_call)
+        save_kwargs = call.pop("save_kwargs", {})
+        call.update(
+            x=list(x) if x is not None else self._last_x,  # type: ignore[attr-defined]
+            ys=[vals for _, vals in series_list],
+            labels=[lbl for lbl, _ in series_list],
+            df=None,
+            x_col=None,
+            y_cols=None,
+            show=show,
+        )
+        if save_path is not None:
+            call["save_path"] = save_path
+        return getattr(self, state.kind)(**call, **save_kwargs)
+
+    def blit(
+        self,
+        ys: Union[Sequence[Any], Dict[str, Sequence[Any]]],
+        labels: Optional[Sequence[Optional[str]]] = None,
+        save_path: Optional[str] = None,
+        save_dpi: int = 500,
+        export_xlsx: bool = True,
+        export_xlsx_path: Optional[str] = None,
+    ) -> bytes:
+        """Re-render the last ``line()`` / ``bar()`` chart with new values.
+
+        The chart frame (figsize, theme, title stack, gridlines, ticks,
+        legend, footer and logo) is rasterised once into a cached static
+        layer; every call then only moves the existing data artists (lines,
+        bars and value labels) to the new values and draws them over that
+        bitmap. Suited to dashboards that regenerate the same chart on a
+        schedule: the axes are *not* rescaled, so values outside the current
+        y range are clipped (a warning is logged), and the value labels kept
+        are those the first render selected.
+
+        Parameters
+        ----------
+        ys, labels:
+            The new payload, shaped like the rendered one: same series count
+            and ``len(x)`` values each. A dict is matched to the rendered
+            series by label.
+        save_path:
+            Also write the PNG here (PNG output only).
+        save_dpi:
+            Render resolution; a change recaptures the static layer.
+        export_xlsx, export_xlsx_path:
+            As for :meth:`~.line_mixin.LineMixin.line`, when ``save_path`` is set.
+
+        Returns
+        -------
+        bytes
+            The encoded PNG.
+
+        Raises
+        ------
+        RuntimeError
+            If no ``line()`` or vertical ``bar()`` chart has been rendered.
+        """
+        state = self._live_state()
+        series_list = self._match_payload(state, ys, labels)
+        self._apply_series_data(state, series_list)
+
+        y_lo, y_hi = state.ax.get_ylim()
+        tops = self._series_tops(state, series_list)
+        if tops.size and (tops.min() < min(y_lo, y_hi) or tops.max() > max(y_lo, y_hi)):
+            logger.warning(
+                "blit(): values span [%g, %g], outside the cached y range [%g, %g]; "
+                "they are clipped",
+                tops.min(),
+                tops.max(),
+                y_lo,
+                y_hi,
+            )
+
+        if state.layer is None or state.layer.dpi != float(save_dpi):
+            state.layer = StaticLayer(
+                state.fig,
+                state.data_artists,
+                dpi=save_dpi,
+                rc=self._rc,  # type: ignore[attr-defined]
+            )
+        png = state.layer.to_png(save_path)
+        if save_path is not None:
+            logger.info("Saved chart -> %s", save_path)
+            if export_xlsx:
+                self._export_after_save(save_path, export_xlsx_path)
+        return png
+
+    # ── live-update plumbing ──────────────────────────────────────────────
+
+    def _record_render(
+        self,
+        fig: Any,
+        ax: Any,
+        kind: str,
+        series_artists: List[Any],
+        value_label_texts: Sequence[Any],
+        value_label_index: Sequence[int],
+        n_points: int,
+        label_spec: FormatterSpec,
+        stacked: bool = False,
+        ytick_texts: Sequence[Any] = (),
+        y_range: Optional[Tuple[float, float]] = None,
+        render_call: Optional[dict] = None,
+    ) -> None:
+        """Remember the data artists of a finished render for :meth:`update` / :meth:`blit`."""
+        annotations, label_offsets = self._plot_labels or ([], [])  # type: ignore[attr-defined]
+        self._render_state = RenderState(  # type: ignore[attr-defined]
+            fig=fig,
+            ax=ax,
+            kind=kind,
+            series_artists=list(series_artists),
+            value_labels=[
+                (artist, int(i) // n_points, int(i) % n_points)
+                for artist, i in zip(value_label_texts, value_label_index)
+            ],
+            label_spec=label_spec,
+            annotations=list(annotations),
+            label_offsets=list(label_offsets),
+            stacked=stacked,
+            ytick_texts=list(ytick_texts),
+            y_range=y_range,
+            render_call=dict(render_call or {}),
+        )
+
+    def _live_state(self) -> RenderState:
+        state = self._render_state  # type: ignore[attr-defined]
+        if state is None:
+            raise RuntimeError("No live chart to update. Call line() or bar() (vertical) first.")
+        return state
+
+    def _match_payload(
+        self,
+        state: RenderState,
+        ys: Union[Sequence[Any], Dict[str, Sequence[Any]]],
+        labels: Optional[Sequence[Optional[str]]],
+        x: Optional[Sequence[Any]] = None,
+    ) -> List[Tuple[Optional[str], List[float]]]:
+        """Normalise a payload and align it with the rendered series."""
+        current = [lbl for lbl, _ in self._last_series_list]  # type: ignore[attr-defined]
+        series_list = self._normalize_series(ys, labels)
+        if isinstance(ys, dict):
+            by_label = dict(series_list)
+            if set(by_label) != {str(lbl) for lbl in current}:
+                raise ValueError(
+                    f"Payload series {sorted(by_label)} do not match the rendered series {current}"
+                )
+            series_list = [(lbl, by_label[str(lbl)]) for lbl in current]
+        elif len(series_list) != len(current):
+            raise ValueError(f"Payload has {len(series_list)} series; the chart has {len(current)}")
+        else:
+            series_list = [(lbl, vals) for lbl, (_, vals) in zip(current, series_list)]
+        self._validate_series_lengths(x if x is not None else self._last_x, series_list)  # type: ignore[attr-defined]
+        self._validate_values(series_list)
+        return series_list
+
+    def _refresh_value_axis(
+        self, state: RenderState, series_list: List[Tuple[Optional[str], List[float]]]
+    ) -> int:
+        """Re-solve the value axis for new data; return the update tier (1-3).
+
+        1 = frame unchanged, 2 = limits / ticks / tick labels redrawn in
+        place, 3 = the layout depends on the change (see :meth:`update`).
+        """
+        call = state.render_call
+        tops = self._series_tops(state, series_list)
+        low = 0.0 if state.kind == "bar" else float(tops.min())
+        y_range = (low, float(tops.max()))
+        self._compute_max_y_value(series_list)
+        if y_range == state.y_range:
+            return 1
+        state.y_range = y_range
+
+        ax = state.ax
+        # Norm-max tick labels follow the data maximum even on a fixed axis.
+        relabel = isinstance(ax.yaxis.get_major_formatter(), NormMaxFormatter)
+        pinned = call.get("ylim") is not None or self.ylim is not None or self.y_scale is not None  # type: ignore[attr-defined]
+        if not pinned:
+            result = calc_y_axis(
+                y_range[0],
+                y_range[1],
+                state.kind,
+                has_top_label=call.get("show_value_labels", False),
+            )
+            if ax.get_ylim() != (result["y_min"], result["y_max"]) or list(
+                self._calculated_y_ticks or []  # type: ignore[attr-defined]
+            ) != list(result["ticks"]):
+                if (result["y_min"] < 0 < result["y_max"]) != self._baseline_relocated:  # type: ignore[attr-defined]
+                    return 3
+                ax.set_ylim(result["y_min"], result["y_max"])
+                self._calculated_y_ticks = result["ticks"]  # type: ignore[attr-defined]
+                self._y_tick_interval = result["tick_interval"]  # type: ignore[attr-defined]
+                self._apply_y_axis(  # type: ignore[attr-defined]
+                    ax,
+                    y_tick_step=call.get("y_tick_step"),
+                    max_y_ticks=call.get("max_y_ticks"),
+                    y_formatter=call.get("y_formatter"),
+                )
+                relabel = True
+        if not relabel:
+            return 1
+
+        old_texts = state.ytick_texts
+        fontsize = self._ts("tick_label")  # type: ignore[attr-defined]
+        old_width = estimate_text_extents([t.get_text() for t in old_texts], fontsize)[0]
+        for t in old_texts:
+            t.remove()
+        secondary = self.y_axis_side == "right"  # type: ignore[attr-defined]
+        if not self.show_y_axis:  # type: ignore[attr-defined]
+            state.ytick_texts = []
+        elif self.y_tick_labels_inside:  # type: ignore[attr-defined]
+            state.ytick_texts = self._draw_economist_ytick_labels(ax, secondary=secondary)  # type: ignore[attr-defined]
+        else:
+            state.ytick_texts = self._draw_outside_ytick_labels(ax, secondary=secondary)  # type: ignore[attr-defined]
+        new_width = estimate_text_extents([t.get_text() for t in state.ytick_texts], fontsize)[0]
+        if old_width.max(initial=0.0) != new_width.max(initial=0.0):
+            return 3
+        return 2
+
+    def _replace_value_labels(self, state: RenderState) -> None:
+        """Re-run the render's label de-overlap on the moved value labels.
+
+        Every label goes back to its pre-placement offset and visibility, so
+        an unchanged payload places them exactly as the render did.
+        """
+        if not state.value_labels:
+            return
+        values = [a for a, _, _ in state.value_labels]
+        movable = state.annotations + values
+        for text, offset in zip(movable, state.label_offsets):
+            text.xyann = offset
+        for text in values:
+            text.set_visible(True)
+        n_ann = len(state.annotations)
+        with rc_context(self._rc):  # type: ignore[attr-defined]
+            self._resolve_label_collisions(  # type: ignore[attr-defined]
+                state.ax,
+                movable,
+                priority=[1] * n_ann + [0] * len(values),
+                required=[True] * n_ann + [False] * len(values),
+                obstacles=state.ytick_texts,
+            )
+
+    def _save_live(self, state: RenderState, save_path: Optional[SavePath] = None) -> None:
+        """Re-save an in-place update as the render did (blitting PNG output)."""
+        call = state.render_call
+        target = save_path or call.get("save_path")
+        if target is None:
+            return
+        fmt = call.get("save_format")
+        if not is_multi_target(target):
+            fmt = fmt or os.path.splitext(str(target))[1].lower().lstrip(".")
+        save_dpi = call.get("save_dpi", 500)
+        save_kwargs = call.get("save_kwargs") or {}
+        if fmt == "png" and not save_kwargs:
+            if state.layer is None or state.layer.dpi != float(save_dpi):
+                state.layer = StaticLayer(
+                    state.fig,
+                    state.data_artists,
+                    dpi=save_dpi,
+                    rc=self._rc,  # type: ignore[attr-defined]
+                )
+            written = OutputTarget(target, "png", float(save_dpi))
+            if self.output_writer is not None:  # type: ignore[attr-defined]
+                # The layer's canvas buffer is reused by the next update: copy.
+                self.output_writer.submit(  # type: ignore[attr-defined]
+                    encode_raster, state.layer.render().copy(), written
+                )
+            else:
+                start = time.perf_counter()
+                state.layer.to_png(target)
+                record_written(written, start)
+            self._last_outputs = [written]  # type: ignore[attr-defined]
+        else:
+            self.save_figure(state.fig, target, dpi=save_dpi, fmt=fmt or None, **save_kwargs)  # type: ignore[attr-defined]
+        logger.info("Saved chart -> %s", target)
+        if call.get("export_xlsx", True):
+            self._export_after_save(target, call.get("export_xlsx_path"))
+
+    def _series_tops(
+        self, state: RenderState, series_list: List[Tuple[Optional[str], List[float]]]
+    ) -> np.ndarray:
+        """``(n_series, n_points)`` artist tops (cumulative for stacked bars)."""
+        values = np.array([vals for _, vals in series_list], dtype=float)
+        return np.cumsum(values, axis=0) if state.stacked else values
+
+    def _apply_series_data(
+        self, state: RenderState, series_list: List[Tuple[Optional[str], List[float]]]
+    ) -> None:
+        """Move the recorded artists (and value labels) to *series_list*."""
+        tops = self._series_tops(state, series_list)
+        bottoms = tops - np.array([vals for _, vals in series_list], dtype=float)
+        for s, (entry, (_, values)) in enumerate(zip(state.series_artists, series_list)):
+            if state.kind == "line":
+                entry.set_ydata(values)
+                continue
+            for i, rect in enumerate(entry):
+                rect.set_y(bottoms[s, i])
+                rect.set_height(values[i])
+
+        if state.value_labels:
+            texts = [
+                self._format_values(values, state.label_spec)  # type: ignore[attr-defined]
+                for _, values in series_list
+            ]
+            for artist, s, i in state.value_labels:
+                artist.xy = (artist.xy[0], tops[s, i])
+                artist.set_text(texts[s][i])
+
+        self._last_series_list = list(series_list)  # type: ignore[attr-defined]
+
+    # ── streaming frames ──────────────────────────────────────────────────
+
+    def _render_stream_frame(self, st: StreamState) -> bytes:
+        """Draw the buffered window: blit when the frame is live, else rebuild it."""
+        data = st.buffer.view()  # type: ignore[union-attr]
+        t, vals = data[:, 0], data[:, 1:].T
+        state = st.state
+        if state is None or self._render_state is not state:  # type: ignore[attr-defined]
+            self._build_stream_frame(st, t, vals)
+        else:
+            for line, v in zip(state.series_artists, vals):
+                line.set_data(t, v)
+            self._shift_stream_x(st, t)
+            tier = self._refresh_value_axis(state, list(zip(st.labels, vals)))  # type: ignore[arg-type]
+            if tier == 3:
+                self._build_stream_frame(st, t, vals)
+            elif tier == 2:
+                state.layer.invalidate()  # type: ignore[union-attr]
+        return st.state.layer.to_png(st.save_path)  # type: ignore[union-attr]
+
+    def _build_stream_frame(self, st: StreamState, t: np.ndarray, vals: np.ndarray) -> None:
+        """Full ``line()`` render of the window, then mark what later frames move."""
+        if st.state is not None:
+            plt.close(st.state.fig)
+        x = [mdates.num2date(v).replace(tzinfo=None) for v in t] if st.is_datetime else list(t)
+        fig, ax = self.line(  # type: ignore[attr-defined]
+            x=x,
+            ys=[list(v) for v in vals],
+            labels=st.labels,
+            show=False,
+            export_xlsx=False,
+            **st.line_kwargs,
+        )
+        state = self._render_state  # type: ignore[attr-defined]
+        lo, hi = float(t[0]), float(t[-1])
+        span = hi - lo
+        x_lo, x_hi = ax.get_xlim()
+        st.x_pad = ((lo - x_lo) / span, (x_hi - hi) / span) if span > 0 else (0.0, 0.0)
+
+        max_x_ticks = st.line_kwargs.get("max_x_ticks") or self.max_x_ticks  # type: ignore[attr-defined]
+        if st.is_datetime:
+            st.locator = mdates.AutoDateLocator(minticks=3, maxticks=max_x_ticks or 7)
+            if not (st.line_kwargs.get("x_date_format") or self.x_date_format):  # type: ignore[attr-defined]
+                # Wrapped so matplotlib does not re-point the formatter at the
+                # FixedLocator each frame installs: the label unit must keep
+                # following st.locator's last cadence.
+                auto = mdates.AutoDateFormatter(st.locator)
+                auto.scaled[1 / mdates.HOURS_PER_DAY] = "%H:%M"
+                auto.scaled[1 / mdates.MINUTES_PER_DAY] = "%H:%M"
+                ax.xaxis.set_major_formatter(FuncFormatter(auto))
+        else:
+            st.locator = MaxNLocator(nbins=max_x_ticks or "auto", steps=[1, 2, 2.5, 5, 10])
+        st.cadence, st.cadence_span = {}, 0.0
+
+        series = set(state.series_artists)
+        st.boundary = []
+        for line in ax.lines:
+            xs = np.asarray(line.get_xdata(), dtype=float)
+            if line not in series and xs.size == 2 and xs[0] == xs[1]:
+                st.boundary.append((line, 0 if abs(xs[0] - lo) <= abs(xs[0] - hi) else 1))
+
+        moving = [ax.xaxis, ax.spines["bottom"], *(line for line, _ in st.boundary)]
+        state.layer = StaticLayer(
+            fig,
+            state.data_artists + moving,
+            dpi=st.save_dpi,
+            rc=self._rc,  # type: ignore[attr-defined]
+        )
+        st.state = state
+        self._shift_stream_x(st, t)
+
+    def _shift_stream_x(self, st: StreamState, t: np.ndarray) -> None:
+        """Slide the x range, ticks, baseline and boundary ticks to the window."""
+        ax = st.state.ax  # type: ignore[union-attr]
+        lo, hi = float(t[0]), float(t[-1])
+        span = hi - lo
+        if span <= 0:
+            return
+        ax.set_xlim(lo - st.x_pad[0] * span, hi + st.x_pad[1] * span)
+        ax.spines["bottom"].set_bounds(lo, hi)
+        for line, edge in st.boundary:
+            line.set_xdata([(lo, hi)[edge]] * 2)
+        if not math.isclose(span, st.cadence_span, rel_tol=1e-9):
+            self._stream_cadence(st, lo, hi)
+        for which, (anchor, step) in st.cadence.items():
+            k = np.arange(math.ceil((lo - anchor) / step), math.floor((hi - anchor) / step) + 1)
+            locator = FixedLocator(anchor + step * k)
+            if which == "major":
+                ax.xaxis.set_major_locator(locator)
+            else:
+                ax.xaxis.set_minor_locator(locator)
+
+    def _stream_cadence(self, st: StreamState, lo: float, hi: float) -> None:
+        """Derive the major (and minor) tick ``(anchor, step)`` for span ``[lo, hi]``."""
+        if st.is_datetime:
+            locs = st.locator.tick_values(mdates.num2date(lo), mdates.num2date(hi))
+        else:
+            locs = st.locator.tick_values(lo, hi)
+        inside = np.array([v for v in locs if lo <= v <= hi])
+        st.cadence, st.cadence_span = {}, hi - lo
+        if inside.size < 2:
+            return
+        anchor, step = float(inside[0]), float(np.median(np.diff(inside)))
+        st.cadence["major"] = (anchor, step)
+        minor = st.line_kwargs.get("x_minor_ticks") or self.x_minor_ticks  # type: ignore[attr-defined]
+        if minor:
+            st.cadence["minor"] = (anchor, step / (minor + 1))
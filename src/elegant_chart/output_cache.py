@@ -0,0 +1,275 @@
+# elegant_chart/output_cache.py
+"""
+Content-addressed cache of rendered chart files.
+
+A render is fully determined by its inputs: the chart's configuration, the
+call's arguments and data, the fonts and logo images it draws with, and the
+library versions doing the drawing. :func:`fingerprint` hashes all of these
+into one key; :class:`OutputCache` keeps the files a render wrote under that
+key, and copies (or hard-links) them into place the next time the same key
+comes up, without drawing anything.
+
+See :meth:`~.cache_mixin.CacheMixin.render_cached` for the chart-side entry
+point. :func:`deterministic_output` makes the written bytes themselves a pure
+function of the inputs, so a re-render of unchanged inputs is byte-identical
+to the cached copy.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import datetime as _dt
+import hashlib
+import os
+import shutil
+import types
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+
+import matplotlib as mpl
+import numpy as np
+import pandas as pd
+
+from ._logging import logger
+
+
+def _library_versions() -> str:
+    try:
+        from importlib.metadata import version  # noqa: PLC0415
+
+        own = version("elegant_chart")
+    except Exception:  # not installed (e.g. running from a source tree)
+        own = "unknown"
+    import PIL  # noqa: PLC0415
+
+    return f"elegant_chart={own} matplotlib={mpl.__version__} pillow={PIL.__version__}"
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    """SHA-256 of a file's bytes; memoised per (path, size, mtime)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_digest(path: Any) -> Optional[str]:
+    """Digest of the file at *path*, or ``None`` if there is no such file."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return _file_digest(os.fspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _feed(h: Any, obj: Any) -> None:
+    """Feed a canonical, type-tagged encoding of *obj* into hash *h*."""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.generic):
+        _feed(h, obj.item())
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            _feed(h, obj.tolist())
+        else:
+            h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (pd.DataFrame, pd.Series)):
+        h.update(f"{type(obj).__name__}:".encode())
+        _feed(h, [str(d) for d in np.atleast_1d(obj.dtypes)])
+        _feed(h, list(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name)
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Index):
+        _feed(h, obj.to_numpy())
+    elif isinstance(obj, (_dt.date, _dt.time)):  # incl. datetime, pd.Timestamp
+        h.update(f"{type(obj).__name__}:{obj.isoformat()};".encode())
+    elif isinstance(obj, _dt.timedelta):
+        h.update(f"timedelta:{obj / _dt.timedelta(microseconds=1)!r};".encode())
+    elif isinstance(obj, os.PathLike):
+        _feed(h, os.fspath(obj))
+    elif isinstance(obj, dict):
+        # Insertion order matters here (series order, legend order …).
+        h.update(f"dict:{len(obj)}{{".encode())
+        for key, value in obj.items():
+            _feed(h, key)
+            _feed(h, value)
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)}[".encode())
+        for item in obj:
+            _feed(h, item)
+        h.update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        _feed(h, sorted(repr(item) for item in obj))
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        _feed(h, (type(obj).__qualname__, dataclasses.astuple(obj)))
+    elif callable(obj) and hasattr(obj, "__code__"):
+        _feed_function(h, obj, set())
+    else:
+        # Unknown objects fall back to repr; one holding a memory address
+        # only ever misses the cache, it never serves a wrong file.
+        h.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+
+def _code_names(code: types.CodeType) -> List[str]:
+    """Global (and attribute) names used by *code* and the code nested in it."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names += _code_names(const)
+    return names
+
+
+def _feed_function(h: Any, func: Any, seen: set) -> None:
+    """Hash what a formatter callable computes, not where it lives.
+
+    Besides its code, defaults and closure, the current values of the
+    module globals it reads are hashed, so a formatter looking up a
+    module-level table misses the cache once that table changes. Modules
+    are hashed by name, and functions it calls are hashed the same way
+    (once each, so mutual recursion terminates).
+    """
+    code = func.__code__
+    _feed(h, (func.__module__, func.__qualname__, code.co_code, code.co_names))
+    if id(code) in seen:
+        return
+    seen.add(id(code))
+    _feed(h, [c for c in code.co_consts if not hasattr(c, "co_code")])
+    _feed(h, func.__defaults__)
+    _feed(h, [cell.cell_contents for cell in func.__closure__ or ()])
+    namespace = getattr(func, "__globals__", {})
+    for name in dict.fromkeys(_code_names(code)):
+        if name not in namespace:
+            continue  # a builtin or an attribute name
+        value = namespace[name]
+        _feed(h, name)
+        if isinstance(value, types.ModuleType):
+            _feed(h, f"module:{value.__name__}")
+        elif callable(value) and hasattr(value, "__code__"):
+            _feed_function(h, value, seen)
+        else:
+            _feed(h, value)
+
+
+def fingerprint(*parts: Any, files: Sequence[Any] = ()) -> str:
+    """Hex SHA-256 of *parts* (any nesting of data, arrays, frames, callables),
+    the contents of *files*, and the elegant_chart / matplotlib / Pillow versions."""
+    h = hashlib.sha256()
+    _feed(h, _library_versions())
+    for part in parts:
+        _feed(h, part)
+    for path in files:
+        _feed(h, (os.fspath(path), file_digest(path)))
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def deterministic_output() -> Iterator[None]:
+    """Make files written inside the block a pure function of what is drawn.
+
+    PNG output carries no timestamp to begin with (only the ``Software``
+    text chunk); PDF and SVG stamp the creation date unless
+    ``SOURCE_DATE_EPOCH`` is set, and SVG salts its element ids with a
+    random value unless ``svg.hashsalt`` is set. Both are pinned here.
+    (An xlsx data export still records its save time; CSV is byte-stable.)
+    """
+    saved = os.environ.get("SOURCE_DATE_EPOCH")
+    if saved is None:
+        os.environ["SOURCE_DATE_EPOCH"] = "0"
+    try:
+        with mpl.rc_context({"svg.hashsalt": "elegant_chart"}):
+            yield
+    finally:
+        if saved is None:
+            os.environ.pop("SOURCE_DATE_EPOCH", None)
+
+
+def _place(source: Path, dest: Path, link: bool) -> None:
+    """Hard-link *source* to *dest* (replacing it), copying when linking is impossible."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        dest.unlink()
+    if link:
+        try:
+            os.link(source, dest)
+            return
+        except OSError:  # another filesystem, or no hard links there
+            pass
+    shutil.copyfile(source, dest)
+
+
+class OutputCache:
+    """A directory of rendered files, one entry per input fingerprint.
+
+    Parameters
+    ----------
+    directory:
+        Where entries live (created on first store). Entries are never
+        evicted automatically; deleting the directory is always safe.
+    link:
+        Serve hits as hard links instead of copies (no bytes copied; falls
+        back to copying across filesystems). A linked output shares storage
+        with its cache entry, so it must be replaced, never rewritten in
+        place — ``render_cached`` removes it before a fresh render, but a
+        plain ``savefig`` onto it would also rewrite the cached copy.
+
+    Example
+    -------
+    ::
+
+        cache = OutputCache("~/.cache/nightly-charts")
+        chart = ElegantChart(title="Revenue", output_cache=cache)
+        chart.render_cached("bar", "out/revenue.png", x=quarters, ys=revenue)
+        print(cache.hits, cache.misses)
+    """
+
+    def __init__(self, directory: Any, link: bool = False) -> None:
+        self.directory = Path(directory).expanduser()
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    @staticmethod
+    def _names(paths: Sequence[Any]) -> List[str]:
+        # Index-prefixed so two outputs with one basename cannot collide.
+        return [f"{i}_{os.path.basename(os.fspath(p))}" for i, p in enumerate(paths)]
+
+    def restore(self, key: str, paths: Sequence[Any]) -> bool:
+        """Place the files cached under *key* at *paths*; ``False`` (a miss) if absent."""
+        entry = self._entry(key)
+        names = self._names(paths)
+        if not all((entry / name).is_file() for name in names):
+            self.misses += 1
+            return False
+        for name, path in zip(names, paths):
+            _place(entry / name, Path(path), self.link)
+        self.hits += 1
+        logger.info("Output cache hit %s -> %d file(s)", key[:12], len(names))
+        return True
+
+    def store(self, key: str, paths: Sequence[Any]) -> None:
+        """Record the files at *paths* under *key* (atomically; first writer wins)."""
+        entry = self._entry(key)
+        if entry.exists():
+            return
+        staging = entry.with_name(f".{key}.{uuid.uuid4().hex}")
+        staging.mkdir(parents=True)
+        try:
+            # Copied, not linked: the outputs may later be rewritten in place.
+            for name, path in zip(self._names(paths), paths):
+                shutil.copyfile(path, staging / name)
+            staging.rename(entry)
+        except OSError:
+            if not entry.exists():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        logger.debug("Output cache stored %s (%d file(s))", key[:12], len(paths))
@@ -0,0 +1,537 @@
+"""Several output files from one finished figure layout.
+
+A render's ``save_path`` may name more than one target, e.g.
+``["chart.png", "chart.svg", "chart.pdf"]`` or dicts such as
+``{"path": "social.png", "dpi": 300}``. The chart is laid out once;
+:func:`write_outputs` then produces every target from that finished
+figure. Raster targets sharing a resolution are drawn in a single Agg pass
+and only *encoded* per format, on worker threads, while the main thread
+draws the next resolution or the vector formats (drawing a figure is never
+done from two threads at once).
+
+A dict target may also ask for responsive variants of one image:
+``{"path": "chart.png", "densities": [1, 2, 3], "thumbnail": 320}`` writes
+``chart.png``, ``chart@2x.png``, ``chart@3x.png`` and a 320 px wide
+``chart_thumb.png`` — all from the same layout — plus a ``chart.srcset.json``
+manifest ready for an HTML ``<img srcset>``.
+
+Raster targets go through an encoder stage with its own options — zlib
+level, adaptive palette quantization, WebP quality, metadata stripping —
+given next to the savefig keywords (see :func:`encode_raster`). SVG targets
+likewise take compact-writer options (see :func:`render_vector`). Options meant
+for other formats are ignored, so one set of keywords can serve a whole
+target list. Each written target reports its size and encode time.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.figure import Figure
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+from ._logging import logger
+from .background_writer import BackgroundWriter
+from .svg_compact import compact_svg
+from .types import SavePath
+
+# Formats encoded from a shared RGBA render, by their Pillow format name.
+_RASTER_FORMATS = {
+    "png": "PNG",
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "webp": "WEBP",
+    "tif": "TIFF",
+    "tiff": "TIFF",
+}
+
+# Encoder-stage options accepted alongside the savefig keywords (see encode_raster).
+ENCODE_OPTIONS = {"compress_level", "quantize", "quality", "strip_metadata"}
+
+# SVG writer options (see render_vector).
+SVG_OPTIONS = {"compact_svg", "svg_precision", "rasterize_dense"}
+
+# Keywords applied at encode time; anything else (bbox_inches, transparent,
+# facecolor …) changes the drawing, so the target gets a render of its own.
+_ENCODER_KWARGS = {"metadata", "pil_kwargs"} | ENCODE_OPTIONS
+
+# Data artists with at least this many vertices count as dense for
+# rasterize_dense=True.
+_DENSE_VERTICES = 2000
+
+# Alpha steps kept when quantizing a transparent image: enough for smooth
+# antialiased edges, few enough that the palette goes to distinct colours.
+_ALPHA_LEVELS = 16
+
+
+@dataclass
+class OutputTarget:
+    """One resolved output: where, in which format, at what dpi, with which savefig kwargs.
+
+    Density variants also carry their *density* (``None`` for a thumbnail),
+    an exact pixel *width* when the dpi must be derived from the figure
+    size, and the *manifest* path of the srcset group they belong to.
+    *size_bytes* and *encode_seconds* are filled in once written.
+    """
+
+    path: Any
+    format: str
+    dpi: float
+    savefig_kwargs: Dict[str, Any] = field(default_factory=dict)
+    density: Optional[float] = None
+    width: Optional[int] = None
+    manifest: Optional[str] = None
+    size_bytes: Optional[int] = None
+    encode_seconds: Optional[float] = None
+
+
+def is_multi_target(save_path: Any) -> bool:
+    """Whether *save_path* is a list/tuple of targets or a dict spec rather than one path."""
+    return isinstance(save_path, (list, tuple, dict))
+
+
+def first_output_path(save_path: SavePath) -> Any:
+    """The path of the first target (where side outputs like the data export go)."""
+    if not is_multi_target(save_path):
+        return save_path
+    first = save_path if isinstance(save_path, dict) else save_path[0]  # type: ignore[index]
+    return first["path"] if isinstance(first, dict) else first
+
+
+def resolve_targets(
+    save_path: SavePath, dpi: float, fmt: Optional[str] = None, **savefig_kwargs: Any
+) -> List[OutputTarget]:
+    """Normalise *save_path* into :class:`OutputTarget` entries.
+
+    Each entry is a path or a dict with ``"path"`` and optional ``"dpi"``,
+    ``"format"`` and extra savefig keywords (merged over *savefig_kwargs*).
+    A target's format is its ``"format"``, else its file extension, else
+    *fmt*, else ``rcParams["savefig.format"]``. A dict with ``"densities"``
+    and/or ``"thumbnail"`` expands into one target per variant, see
+    :func:`density_targets`.
+    """
+    items = list(save_path) if isinstance(save_path, (list, tuple)) else [save_path]
+    if not items:
+        raise ValueError("save_path must name at least one output")
+    targets = []
+    for item in items:
+        if isinstance(item, dict):
+            spec = dict(item)
+            if "path" not in spec:
+                raise ValueError(f"Output spec {item!r} has no 'path'")
+            path = spec.pop("path")
+            target_dpi = spec.pop("dpi", dpi)
+            target_fmt = spec.pop("format", None)
+            densities = spec.pop("densities", None)
+            thumbnail = spec.pop("thumbnail", None)
+            manifest = spec.pop("manifest", True)
+            kwargs = {**savefig_kwargs, **spec}
+        else:
+            path, target_dpi, target_fmt, kwargs = item, dpi, None, dict(savefig_kwargs)
+            densities = thumbnail = None
+        ext = ""
+        if isinstance(path, (str, os.PathLike)):
+            ext = os.path.splitext(os.fspath(path))[1].lower().lstrip(".")
+        target_fmt = (target_fmt or ext or fmt or mpl.rcParams["savefig.format"]).lower()
+        target = OutputTarget(path, target_fmt, float(target_dpi), kwargs)
+        if densities is None and thumbnail is None:
+            targets.append(target)
+        else:
+            targets += density_targets(target, densities or [1], thumbnail, manifest)
+    return targets
+
+
+def density_targets(
+    base: OutputTarget,
+    densities: Sequence[float],
+    thumbnail: Optional[int] = None,
+    manifest: Union[bool, str] = True,
+) -> List[OutputTarget]:
+    """Expand *base* into ``@Nx`` density variants and an optional thumbnail.
+
+    Density ``d`` is written at ``base.dpi * d`` to ``<stem>@<d>x<ext>``
+    (density 1 keeps *base*'s own path); *thumbnail* is a pixel width,
+    written to ``<stem>_thumb<ext>``. *manifest* is the srcset JSON path
+    (``True`` → ``<stem>.srcset.json``, ``False`` → none).
+    """
+    if base.format not in _RASTER_FORMATS:
+        raise ValueError(f"Density variants need a raster format, got {base.format!r}")
+    if not densities or any(d <= 0 for d in densities):
+        raise ValueError(f"densities must be positive numbers, got {list(densities)!r}")
+    if thumbnail is not None and thumbnail < 1:
+        raise ValueError(f"thumbnail must be a width in pixels >= 1, got {thumbnail!r}")
+    stem, ext = os.path.splitext(os.fspath(base.path))
+    if manifest is True:
+        manifest = f"{stem}.srcset.json"
+    group = manifest or None
+
+    def variant(path: str, dpi: float, **extra: Any) -> OutputTarget:
+        return OutputTarget(
+            path, base.format, dpi, dict(base.savefig_kwargs), manifest=group, **extra
+        )
+
+    targets = [
+        variant(os.fspath(base.path) if d == 1 else f"{stem}@{d:g}x{ext}", base.dpi * d, density=d)
+        for d in sorted(set(densities))
+    ]
+    if thumbnail is not None:
+        targets.append(variant(f"{stem}_thumb{ext}", base.dpi, width=int(thumbnail)))
+    return targets
+
+
+def _dpi_for_width(fig: Figure, width: int) -> float:
+    """The dpi at which *fig* renders exactly *width* pixels wide."""
+    fig_w = float(fig.get_size_inches()[0])
+    dpi = width / fig_w
+    while int(fig_w * dpi) < width:  # float rounding can land one pixel short
+        dpi = float(np.nextafter(dpi, np.inf))
+    return dpi
+
+
+def srcset_manifest(
+    size_inches: Tuple[float, float], targets: List[OutputTarget], manifest_path: str
+) -> Dict[str, Any]:
+    """Describe one variant group for an HTML ``<img srcset>``.
+
+    *size_inches* is the size of the figure the variants were drawn from.
+    Paths are relative to the manifest's directory. ``srcset`` uses width
+    descriptors (``chart.png 1080w``) and covers every variant;
+    ``srcset_density`` uses density descriptors (``chart@2x.png 2x``) and
+    leaves out the thumbnail. ``src`` is the smallest density (the fallback).
+    """
+    root = os.path.dirname(os.path.abspath(manifest_path))
+    fig_w, fig_h = size_inches
+    variants = []
+    for t in sorted(targets, key=lambda t: t.dpi):
+        variants.append(
+            {
+                "path": os.path.relpath(os.path.abspath(os.fspath(t.path)), root).replace(
+                    os.sep, "/"
+                ),
+                "density": t.density,
+                "dpi": t.dpi,
+                "width": int(fig_w * t.dpi),
+                "height": int(fig_h * t.dpi),
+                "bytes": t.size_bytes,
+            }
+        )
+    dense = [v for v in variants if v["density"] is not None]
+    base = dense[0] if dense else variants[0]
+    return {
+        "src": base["path"],
+        "width": base["width"],
+        "height": base["height"],
+        "srcset": ", ".join(f"{v['path']} {v['width']}w" for v in variants),
+        "srcset_density": ", ".join(f"{v['path']} {v['density']:g}x" for v in dense),
+        "variants": variants,
+    }
+
+
+def render_rgba(fig: Figure, dpi: float, **savefig_kwargs: Any) -> np.ndarray:
+    """Draw *fig* once at *dpi* (as ``savefig`` would) and return ``(h, w, 4)`` pixels.
+
+    With drawing keywords (``bbox_inches``, ``transparent`` …) the canvas
+    size is not known up front, so the pixels round-trip through an
+    uncompressed PNG instead of a raw buffer.
+    """
+    buf = io.BytesIO()
+    if savefig_kwargs or mpl.rcParams["savefig.bbox"] == "tight":
+        fig.savefig(buf, format="png", dpi=dpi, pil_kwargs={"compress_level": 0}, **savefig_kwargs)
+        buf.seek(0)
+        with Image.open(buf) as image:
+            return np.asarray(image.convert("RGBA"))
+    fig.savefig(buf, format="rgba", dpi=dpi)
+    width, height = (int(v) for v in fig.get_size_inches() * dpi)
+    return np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(height, width, 4)
+
+
+def quantize_rgba(rgba: np.ndarray, colors: int = 256) -> Image.Image:
+    """Reduce *rgba* to an adaptive palette of at most *colors* entries (no dithering).
+
+    Opaque images are quantized on RGB. Transparent ones first snap alpha
+    to :data:`_ALPHA_LEVELS` steps, so antialiased edges keep a (short)
+    alpha ramp in the palette instead of being cut to on/off.
+    """
+    if not 2 <= colors <= 256:
+        raise ValueError(f"quantize must be between 2 and 256 colours, got {colors}")
+    alpha = rgba[..., 3]
+    if alpha.min() == 255:
+        image = Image.fromarray(np.ascontiguousarray(rgba[..., :3]), "RGB")
+    else:
+        step = 255 / (_ALPHA_LEVELS - 1)
+        ramp = (np.round(alpha / step) * step).round().astype(np.uint8)
+        image = Image.fromarray(np.dstack([rgba[..., :3], ramp]), "RGBA")
+    return image.quantize(colors, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+
+
+def encode_raster(rgba: np.ndarray, target: OutputTarget) -> None:
+    """Encode *rgba* to *target* with Pillow, as matplotlib's own writers do.
+
+    The encoder-stage options in ``target.savefig_kwargs``:
+
+    ``compress_level``
+        PNG zlib level, 0 (fastest) – 9 (smallest); Pillow's default is 6.
+    ``quantize``
+        PNG only: ``True`` (256) or a colour count for an adaptive palette,
+        see :func:`quantize_rgba`. Theme palettes and antialiasing rarely
+        need more than a few hundred colours, so this typically halves
+        the file.
+    ``quality``
+        JPEG / WebP quality (1–100). WebP without a quality is lossless,
+        which for flat chart colours is both exact and smallest.
+    ``strip_metadata``
+        Drop the text chunks (Software, ``metadata``) and the dpi stamp.
+
+    Fills in ``target.size_bytes`` and ``target.encode_seconds``.
+    """
+    start = time.perf_counter()
+    opts = target.savefig_kwargs
+    pil_format = _RASTER_FORMATS[target.format]
+    pil_kwargs = dict(opts.get("pil_kwargs") or {})
+    strip = bool(opts.get("strip_metadata"))
+    if not strip:
+        pil_kwargs.setdefault("dpi", (target.dpi, target.dpi))
+    image = Image.fromarray(rgba, "RGBA")
+    if pil_format == "PNG":
+        if opts.get("compress_level") is not None:
+            pil_kwargs.setdefault("compress_level", int(opts["compress_level"]))
+        if not strip:
+            metadata = {
+                "Software": f"Matplotlib version{mpl.__version__}, https://matplotlib.org/",
+                **(opts.get("metadata") or {}),
+            }
+            info = PngInfo()
+            for key, value in metadata.items():
+                if value is not None:
+                    info.add_text(key, value)
+            pil_kwargs.setdefault("pnginfo", info)
+        quantize = opts.get("quantize")
+        if quantize:
+            image = quantize_rgba(rgba, 256 if quantize is True else int(quantize))
+    elif pil_format == "JPEG":
+        image = image.convert("RGB")
+        if opts.get("quality") is not None:
+            pil_kwargs.setdefault("quality", int(opts["quality"]))
+    elif pil_format == "WEBP":
+        if opts.get("quality") is None:
+            pil_kwargs.setdefault("lossless", True)
+        else:
+            pil_kwargs.setdefault("quality", int(opts["quality"]))
+    image.save(target.path, format=pil_format, **pil_kwargs)
+    record_written(target, start)
+
+
+def record_written(target: OutputTarget, start: float) -> None:
+    """Fill in *target*'s ``encode_seconds`` (since *start*, a ``perf_counter``
+    reading) and ``size_bytes``, and log the write."""
+    target.encode_seconds = time.perf_counter() - start
+    if isinstance(target.path, (str, os.PathLike)):
+        target.size_bytes = os.path.getsize(target.path)
+    logger.info(
+        "Wrote %s (%s, %s bytes) in %.0f ms",
+        target.path,
+        target.format,
+        target.size_bytes,
+        target.encode_seconds * 1000,
+    )
+
+
+def wants_encoder(savefig_kwargs: Dict[str, Any]) -> bool:
+    """Whether *savefig_kwargs* use encoder-stage or SVG writer options (so need
+    :func:`write_outputs`)."""
+    return not (ENCODE_OPTIONS | SVG_OPTIONS).isdisjoint(savefig_kwargs)
+
+
+def _drop_foreign_options(target: OutputTarget) -> None:
+    """Remove options meant for other formats (shared kwargs of a target list)."""
+    if target.format in _RASTER_FORMATS:
+        foreign = SVG_OPTIONS
+    elif target.format == "svg":
+        foreign = ENCODE_OPTIONS
+    else:
+        foreign = ENCODE_OPTIONS | SVG_OPTIONS
+    unused = foreign & target.savefig_kwargs.keys()
+    if unused:
+        logger.debug("Ignoring %s for %s output %s", sorted(unused), target.format, target.path)
+        for name in unused:
+            del target.savefig_kwargs[name]
+
+
+def _rasterize_dense(fig: Figure, min_vertices: int) -> List[Any]:
+    """Set ``rasterized=True`` on data artists with >= *min_vertices*; return them."""
+    toggled = []
+    for ax in fig.axes:
+        for artist in [*ax.lines, *ax.collections]:
+            if artist.get_rasterized():
+                continue
+            if hasattr(artist, "get_xydata"):
+                n = len(artist.get_xydata())
+            else:
+                n = sum(len(path.vertices) for path in artist.get_paths())
+                n = max(n, len(artist.get_offsets()))
+            if n >= min_vertices:
+                artist.set_rasterized(True)
+                toggled.append(artist)
+    return toggled
+
+
+def render_vector(fig: Figure, target: OutputTarget) -> bytes:
+    """Draw *target* as a vector document (SVG, PDF, EPS …) and return its bytes.
+
+    SVG targets honour the SVG writer options in their savefig kwargs:
+
+    ``compact_svg``
+        Text as ``<text>`` referencing the chart's font families
+        (``svg.fonttype = "none"``) instead of glyph outlines, then
+        :func:`~.svg_compact.compact_svg` in :func:`finish_vector`: CSS
+        classes for repeated styles, rounded coordinates, merged gridlines,
+        minified markup.
+    ``svg_precision``
+        Decimals kept by ``compact_svg`` (default 2).
+    ``rasterize_dense``
+        ``True`` or a vertex count (default 2000): data lines and collections
+        at least that dense are embedded as an image at the target dpi,
+        everything else stays vector.
+    """
+    opts = {k: v for k, v in target.savefig_kwargs.items() if k not in SVG_OPTIONS}
+    dense = target.savefig_kwargs.get("rasterize_dense")
+    rc = {"svg.fonttype": "none"} if target.savefig_kwargs.get("compact_svg") else {}
+    toggled: List[Any] = []
+    if dense:
+        toggled = _rasterize_dense(fig, _DENSE_VERTICES if dense is True else int(dense))
+    buf = io.BytesIO()
+    try:
+        with mpl.rc_context(rc):
+            fig.savefig(buf, dpi=target.dpi, format=target.format, **opts)
+    finally:
+        for artist in toggled:
+            artist.set_rasterized(False)
+    return buf.getvalue()
+
+
+def finish_vector(data: bytes, target: OutputTarget) -> None:
+    """Post-process (``compact_svg``) and write a :func:`render_vector` result."""
+    start = time.perf_counter()
+    if target.savefig_kwargs.get("compact_svg"):
+        precision = int(target.savefig_kwargs.get("svg_precision", 2))
+        data = compact_svg(data, precision).encode("utf-8")
+    if isinstance(target.path, (str, os.PathLike)):
+        with open(target.path, "wb") as fh:
+            fh.write(data)
+    else:
+        target.path.write(data)
+    record_written(target, start)
+
+
+def write_outputs(
+    fig: Figure,
+    targets: List[OutputTarget],
+    workers: Optional[int] = None,
+    writer: Optional[BackgroundWriter] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Write every target from the already laid-out *fig*.
+
+    Parameters
+    ----------
+    fig:
+        The finished figure; it is drawn, never modified.
+    targets:
+        From :func:`resolve_targets`. Each gets its ``size_bytes`` and
+        ``encode_seconds`` filled in.
+    workers:
+        Encoder threads for raster targets. ``None`` → one per raster target
+        (capped at the CPU count); ``1`` → encode one at a time.
+    writer:
+        Hand encoding and file writes to this queue and return as soon as
+        *fig* has been drawn; ``workers`` is then unused. Results (files,
+        sizes, manifests) are complete once the writer has flushed.
+
+    Returns
+    -------
+    ``{manifest_path: manifest}`` for every density-variant group written
+    (see :func:`srcset_manifest`); empty when there are none.
+    """
+    for target in targets:
+        _drop_foreign_options(target)
+        if target.width is not None:
+            target.dpi = _dpi_for_width(fig, target.width)
+    shared: Dict[float, List[OutputTarget]] = {}
+    own_render: List[OutputTarget] = []
+    vector: List[OutputTarget] = []
+    tight = mpl.rcParams["savefig.bbox"] == "tight"
+    for target in targets:
+        if target.format not in _RASTER_FORMATS:
+            vector.append(target)
+        elif set(target.savefig_kwargs) <= _ENCODER_KWARGS and not tight:
+            shared.setdefault(target.dpi, []).append(target)
+        else:
+            own_render.append(target)
+
+    # Drawing happens here, on the calling thread; only encoding and I/O are
+    # handed off — to the background writer, or to a local pool joined below.
+    n_raster = len(targets) - len(vector)
+    pool = None
+    if writer is None:
+        workers = workers or min(max(n_raster, 1), os.cpu_count() or 1)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="elegant-chart-out")
+    submit = writer.submit if writer is not None else pool.submit  # type: ignore[union-attr]
+    pending = []
+    try:
+        for dpi, group in shared.items():
+            rgba = render_rgba(fig, dpi)
+            pending += [submit(encode_raster, rgba, target) for target in group]
+        for target in own_render:
+            draw_kwargs = {
+                k: v for k, v in target.savefig_kwargs.items() if k not in _ENCODER_KWARGS
+            }
+            rgba = render_rgba(fig, target.dpi, **draw_kwargs)
+            pending.append(submit(encode_raster, rgba, target))
+        for target in vector:
+            pending.append(submit(finish_vector, render_vector(fig, target), target))
+        if pool is not None:
+            for job in pending:
+                job.result()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # Read here: a queued job must not touch the figure, which the caller
+    # may close or resize as soon as this returns.
+    size_inches = tuple(fig.get_size_inches())
+    manifests: Dict[str, Dict[str, Any]] = {}
+    if writer is None:
+        _write_manifests(size_inches, targets, manifests)
+    else:
+        writer.submit(_write_manifests, size_inches, targets, manifests)
+    logger.debug(
+        "Wrote %d outputs (%d raster passes for %d raster targets)",
+        len(targets),
+        len(shared) + len(own_render),
+        n_raster,
+    )
+    return manifests
+
+
+def _write_manifests(
+    size_inches: Tuple[float, float],
+    targets: List[OutputTarget],
+    manifests: Dict[str, Dict[str, Any]],
+) -> None:
+    """Write one srcset manifest per density-variant group, recording them in *manifests*."""
+    groups: Dict[str, List[OutputTarget]] = {}
+    for target in targets:
+        if target.manifest is not None:
+            groups.setdefault(target.manifest, []).append(target)
+    for path, group in groups.items():
+        manifests[path] = srcset_manifest(size_inches, group, path)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(manifests[path], fh, indent=2)
@@ -0,0 +1,178 @@
+"""Vectorized per-period ranking for bump (ranking-flow) charts."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Tie-breaking strategies accepted by :func:`rank_columns`, mirroring the
+# ``method=`` names of ``pandas.DataFrame.rank``.
+TIE_METHODS = ("first", "min", "max", "dense", "average")
+
+
+def rank_columns(
+    values: np.ndarray,
+    ascending: bool = False,
+    ties: str = "first",
+) -> np.ndarray:
+    """Rank every column of a ``(n_series, n_periods)`` matrix at once.
+
+    NaN cells are treated as "absent" — they are excluded from the ranking
+    and stay NaN in the result, so the present series in each period are
+    ranked ``1..k`` with no gaps left by missing entries.
+
+    Parameters
+    ----------
+    values:
+        2-D float array; rows are series, columns are periods.
+    ascending:
+        ``True`` → smallest value = rank 1. Default ``False`` (largest = rank 1).
+    ties:
+        How equal values within a period are ranked:
+
+        * ``"first"`` (default) — distinct ranks in input (row) order.
+        * ``"min"`` / ``"max"`` — every tied row gets the lowest / highest
+          rank of its group (competition ranking, e.g. ``1, 2, 2, 4``).
+        * ``"dense"`` — like ``"min"`` but without gaps (``1, 2, 2, 3``).
+        * ``"average"`` — the mean of the group's ranks (``1, 2.5, 2.5, 4``).
+
+    Returns
+    -------
+    np.ndarray
+        Float array of the same shape holding 1-based ranks, NaN where the
+        input is NaN.
+    """
+    if ties not in TIE_METHODS:
+        raise ValueError(f"ties must be one of {TIE_METHODS}, got {ties!r}")
+
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2:
+        raise ValueError(f"values must be 2-D (n_series, n_periods), got shape {values.shape}")
+
+    n_rows, n_cols = values.shape
+    ranks = np.full(values.shape, np.nan)
+    if values.size == 0:
+        return ranks
+
+    missing = np.isnan(values)
+    # Sort key: rank 1 sorts first. NaNs are pushed past every real value so
+    # the valid entries of each column always occupy the leading positions.
+    keys = values if ascending else -values
+    keys = np.where(missing, np.inf, keys)
+
+    # A stable sort keeps tied rows in input order — this *is* the "first"
+    # tie-break, and the grouping below builds the others on top of it.
+    order = np.argsort(keys, axis=0, kind="stable")
+    sorted_keys = np.take_along_axis(keys, order, axis=0)
+    position = np.arange(1, n_rows + 1, dtype=float)[:, None]
+
+    if ties == "first":
+        sorted_ranks = np.broadcast_to(position, (n_rows, n_cols))
+    else:
+        # Group boundaries along each sorted column.
+        same_as_prev = np.zeros((n_rows, n_cols), dtype=bool)
+        same_as_prev[1:] = sorted_keys[1:] == sorted_keys[:-1]
+        group_start = ~same_as_prev
+        same_as_next = np.zeros((n_rows, n_cols), dtype=bool)
+        same_as_next[:-1] = same_as_prev[1:]
+        group_end = ~same_as_next
+
+        min_rank = np.maximum.accumulate(np.where(group_start, position, 0.0), axis=0)
+        if ties == "min":
+            sorted_ranks = min_rank
+        elif ties == "dense":
+            sorted_ranks = np.cumsum(group_start, axis=0).astype(float)
+        else:
+            # Highest rank of each group: carry each group's end position
+            # backwards with a reversed running minimum.
+            end_pos = np.where(group_end, position, np.inf)
+            max_rank = np.minimum.accumulate(end_pos[::-1], axis=0)[::-1]
+            sorted_ranks = max_rank if ties == "max" else (min_rank + max_rank) / 2.0
+
+    np.put_along_axis(ranks, order, sorted_ranks, axis=0)
+    ranks[missing] = np.nan
+    return ranks
+
+
+def window_ranks(ranks: np.ndarray, top_n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Restrict a rank matrix to a top-N window, keeping exit/entry stubs.
+
+    Parameters
+    ----------
+    ranks:
+        ``(n_series, n_periods)`` rank matrix as returned by
+        :func:`rank_columns` (NaN where a series is absent).
+    top_n:
+        Size of the visible window: ranks ``1..top_n``.
+
+    Returns
+    -------
+    (keep, display)
+        ``keep`` is a boolean row mask of the series that enter the window in
+        at least one period — every other row can be dropped before any
+        drawing work. ``display`` is a copy of ``ranks`` in which
+        out-of-window cells are NaN, except the ones directly before an entry
+        or after an exit (skipping absent periods): those become
+        ``top_n + 1``, so a line clipped at the window's lower edge shows a
+        short stub leaving or joining the chart.
+    """
+    if top_n < 1:
+        raise ValueError(f"top_n must be >= 1, got {top_n}")
+
+    ranks = np.asarray(ranks, dtype=float)
+    n_rows, n_cols = ranks.shape
+    present = ~np.isnan(ranks)
+    inside = present & (ranks <= top_n)
+    keep = inside.any(axis=1)
+
+    # Column index of the nearest *present* cell strictly before / after each
+    # cell (-1 / n_cols when none), via a running max / reversed running min.
+    cols = np.arange(n_cols)
+    last_present = np.maximum.accumulate(np.where(present, cols, -1), axis=1)
+    prev_idx = np.full((n_rows, n_cols), -1)
+    prev_idx[:, 1:] = last_present[:, :-1]
+    next_present = np.minimum.accumulate(np.where(present, cols, n_cols)[:, ::-1], axis=1)[:, ::-1]
+    next_idx = np.full((n_rows, n_cols), n_cols)
+    next_idx[:, :-1] = next_present[:, 1:]
+
+    # Pad one always-outside column on each side so -1 / n_cols index safely.
+    padded = np.zeros((n_rows, n_cols + 2), dtype=bool)
+    padded[:, 1:-1] = inside
+    rows = np.arange(n_rows)[:, None]
+    prev_inside = padded[rows, prev_idx + 1]
+    next_inside = padded[rows, next_idx + 1]
+
+    stub = present & ~inside & (prev_inside | next_inside)
+    display = np.where(inside, ranks, np.nan)
+    display[stub] = top_n + 1
+    return keep, display
+
+
+def race_frames(
+    values: np.ndarray, ranks: np.ndarray, steps_per_period: int, off_rank: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Interpolate ``(n_series, n_periods)`` values and ranks to animation frames.
+
+    Absent cells (NaN rank) count as value 0 at rank *off_rank*, so series
+    joining or leaving slide in from / out to just below the visible window.
+    Values move linearly between periods; ranks are eased (smoothstep) so
+    overtakes start and settle gently.
+
+    Returns
+    -------
+    (t, values, ranks)
+        ``t`` is each frame's position in periods; ``values`` and ``ranks``
+        are ``(n_series, n_frames)``.
+    """
+    n_periods = values.shape[1]
+    vals = np.where(np.isnan(ranks), 0.0, np.nan_to_num(values, nan=0.0))
+    rnks = np.where(np.isnan(ranks), off_rank, ranks)
+    t = np.linspace(0.0, n_periods - 1, (n_periods - 1) * steps_per_period + 1)
+    i = np.minimum(t.astype(int), max(n_periods - 2, 0))
+    j = np.minimum(i + 1, n_periods - 1)
+    frac = t - i
+    ease = frac * frac * (3.0 - 2.0 * frac)
+    return (
+        t,
+        vals[:, i] + (vals[:, j] - vals[:, i]) * frac,
+        rnks[:, i] + (rnks[:, j] - rnks[:, i]) * ease,
+    )
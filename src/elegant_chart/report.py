@@ -0,0 +1,220 @@
+# elegant_chart/report.py
+"""
+Multi-chart PDF reports.
+
+:class:`ChartReport` writes charts into one multi-page PDF as they are
+rendered, through matplotlib's :class:`~matplotlib.backends.backend_pdf.PdfPages`:
+
+* every page is vector output, drawn straight from the figure — no PNG
+  round-trip and no external re-assembly step;
+* fonts are collected across the whole document and embedded once at the
+  end, subsetted to the glyphs actually used (TrueType / Type 42 by default,
+  so the text stays selectable and searchable);
+* each figure is closed as soon as its page is written, so a 120-chart
+  bulletin holds one figure in memory at a time;
+* each page is drawn under its chart's own rcParams overlay when the chart
+  is passed along, so it matches the chart's other saved outputs;
+* an optional table of contents (chart titles and page numbers) is laid out
+  on close and appended as the last page(s) of the document.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.backends.backend_pdf import PdfPages
+
+from ._logging import logger
+from .base import REFERENCE_FIGSIZE
+from .style_mixin import DEFAULT_THEME, THEMES, TYPE_SCALE
+
+
+class ChartReport:
+    """Stream rendered charts into one multi-page PDF, with an optional contents page.
+
+    Parameters
+    ----------
+    path:
+        Destination ``.pdf`` file. It is opened on the first :meth:`add`
+        and completed by :meth:`close`.
+    toc:
+        Lay out a table of contents (one line per chart: title and page
+        number) on close, after the last chart. Long reports spill onto as
+        many contents pages as needed.
+    toc_title:
+        Heading of the contents page.
+    theme:
+        Theme whose background and text colours the contents page uses.
+    metadata:
+        PDF document information, e.g. ``{"Title": "Monthly bulletin",
+        "Author": "Statistics team"}``.
+    fonttype:
+        ``42`` (default) embeds TrueType subsets; ``3`` embeds Type 3
+        subsets (matplotlib's default, smaller for very short texts).
+
+    Example
+    -------
+    ::
+
+        with ChartReport("out/bulletin.pdf", metadata={"Title": "Bulletin"}) as report:
+            for name, values in series.items():
+                chart = ElegantChart(title=name)
+                fig, _ = chart.line(x=months, ys=values, show=False)
+                report.add(fig, chart=chart)   # page written, figure closed
+    """
+
+    def __init__(
+        self,
+        path: Any,
+        toc: bool = True,
+        toc_title: str = "Contents",
+        theme: str = DEFAULT_THEME,
+        metadata: Optional[Dict[str, Any]] = None,
+        fonttype: int = 42,
+    ) -> None:
+        if fonttype not in (3, 42):
+            raise ValueError(f"fonttype must be 3 or 42, got {fonttype}")
+        if theme not in THEMES:
+            raise ValueError(f"Unknown theme {theme!r}; expected one of {sorted(THEMES)}")
+        self.path = path
+        self.toc = toc
+        self.toc_title = toc_title
+        self.theme = theme
+        self.fonttype = fonttype
+        self._pdf = PdfPages(path, metadata=metadata)
+        # (title, page size in inches) per chart page, in order.
+        self._entries: List[Tuple[str, Tuple[float, float]]] = []
+        self._closed = False
+
+    @property
+    def page_count(self) -> int:
+        """Chart pages written so far (the contents pages are added on close)."""
+        return len(self._entries)
+
+    def add(
+        self,
+        fig: Any,
+        title: Optional[str] = None,
+        close: bool = True,
+        chart: Any = None,
+    ) -> int:
+        """Write *fig* as the next page; returns its 1-based page number.
+
+        Parameters
+        ----------
+        fig:
+            A rendered figure, e.g. the first item returned by ``line()``.
+        title:
+            Contents entry for the page; default the chart's title, else
+            ``"Chart <n>"``.
+        close:
+            Close the figure once its page is written (the default). Pass
+            ``False`` to keep using it, e.g. to also ``plt.show()`` it.
+        chart:
+            The :class:`ElegantChart` that drew *fig*. The page is then drawn
+            under that chart's rcParams overlay (size-scaled text, tick
+            lengths …), as its own ``save_figure`` would; without it, tick
+            labels and ticks created at draw time fall back to the global
+            rcParams.
+        """
+        if self._closed:
+            raise RuntimeError("ChartReport is closed")
+        number = len(self._entries) + 1
+        rc = dict(getattr(chart, "_rc", None) or {})
+        with mpl.rc_context({**rc, "pdf.fonttype": self.fonttype}):
+            self._pdf.savefig(fig)
+        title = title or getattr(chart, "title", None) or f"Chart {number}"
+        self._entries.append((title, tuple(fig.get_size_inches())))
+        if close:
+            plt.close(fig)
+        logger.debug("Report page %d: %s", number, self._entries[-1][0])
+        return number
+
+    def close(self) -> None:
+        """Add the contents pages (if enabled) and finish the PDF; idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        with mpl.rc_context({"pdf.fonttype": self.fonttype}):
+            if self.toc and self._entries:
+                self._write_toc()
+            # Fonts are written here, once each, subset to every glyph used.
+            self._pdf.close()
+        logger.info("Saved report (%d charts) -> %s", len(self._entries), self.path)
+
+    def __enter__(self) -> "ChartReport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ── table of contents ─────────────────────────────────────────────────
+
+    def _write_toc(self) -> None:
+        """Append the contents pages after the last chart page."""
+        width, height = self._entries[0][1]
+        ref_w, ref_h = REFERENCE_FIGSIZE
+        scale = min(width / ref_w, height / ref_h, 1.0)
+        size = TYPE_SCALE["tick_label"] * scale
+        heading = TYPE_SCALE["title"] * scale
+        line = size * 1.6 / 72  # inches
+        margin = min(width, height) * 0.08
+        top = margin + heading * 2.0 / 72
+        per_page = max(1, int((height - top - margin) / line))
+        n_pages = math.ceil(len(self._entries) / per_page)
+
+        theme = THEMES[self.theme]
+        text_color = "#f0f0f0" if theme.dark else "#111111"
+        muted = "#999999" if theme.dark else "#666666"
+        available = {f.name for f in font_manager.fontManager.ttflist}
+        family = "SF Pro" if "SF Pro" in available else "sans-serif"
+        # Rough glyph width, to shorten titles that would run into the page numbers.
+        max_chars = max(8, int((width - 2 * margin - size * 3 / 72) / (size * 0.55 / 72)))
+
+        for page in range(n_pages):
+            fig = plt.figure(figsize=(width, height), facecolor=theme.bg_color)
+            to_x = 1.0 / width  # inches -> figure fraction
+            to_y = 1.0 / height
+            fig.text(
+                margin * to_x,
+                1 - margin * to_y,
+                self.toc_title,
+                fontsize=heading,
+                fontweight="bold",
+                color=text_color,
+                fontfamily=family,
+                va="top",
+                ha="left",
+            )
+            chunk = self._entries[page * per_page : (page + 1) * per_page]
+            for row, (title, _) in enumerate(chunk):
+                number = page * per_page + row + 1
+                y = 1 - (top + row * line) * to_y
+                if len(title) > max_chars:
+                    title = title[: max_chars - 1] + "…"
+                fig.text(
+                    margin * to_x,
+                    y,
+                    title,
+                    fontsize=size,
+                    color=text_color,
+                    fontfamily=family,
+                    va="top",
+                    ha="left",
+                )
+                fig.text(
+                    1 - margin * to_x,
+                    y,
+                    str(number),
+                    fontsize=size,
+                    color=muted,
+                    fontfamily=family,
+                    va="top",
+                    ha="right",
+                )
+            self._pdf.savefig(fig)
+            plt.close(fig)
@@ -0,0 +1,52 @@
+"""Fixed-capacity ring buffer of numeric rows for streaming charts.
+
+Storage is preallocated at twice the capacity and every row is written to
+both halves, so the last ``capacity`` rows are always one contiguous slice:
+:meth:`RingBuffer.view` never copies, however long the stream has run.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+class RingBuffer:
+    """The most recent *capacity* rows of *width* floats, oldest first."""
+
+    def __init__(self, capacity: int, width: int = 1) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if width < 1:
+            raise ValueError(f"width must be >= 1, got {width}")
+        self.capacity = int(capacity)
+        self.width = int(width)
+        self._data = np.full((2 * self.capacity, self.width), np.nan)
+        self._next = 0  # slot the next row goes to
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Sequence[float]) -> None:
+        """Add one row, evicting the oldest once full."""
+        values = np.asarray(row, dtype=float).reshape(-1)
+        if values.size != self.width:
+            raise ValueError(f"row must have {self.width} values, got {values.size}")
+        i = self._next
+        self._data[i] = values
+        self._data[i + self.capacity] = values
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def view(self) -> np.ndarray:
+        """``(len, width)`` read-only view of the buffered rows, oldest first."""
+        start = self._next if self._size == self.capacity else 0
+        out = self._data[start : start + self._size]
+        out.flags.writeable = False
+        return out
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
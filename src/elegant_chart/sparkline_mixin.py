@@ -0,0 +1,278 @@
+# elegant_chart/sparkline_mixin.py
+from __future__ import annotations
+
+import io
+import math
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import rc_context
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from PIL import Image
+
+from ._logging import logger
+from .types import SavePath
+
+# Largest canvas side (px) rendered in one pass when slicing glyphs into
+# individual PNGs; keeps peak memory flat however many rows are requested.
+_MAX_CANVAS_PX = 4096
+
+# Bar width as a fraction of each value's slot.
+_BAR_FILL = 0.8
+
+
+def _row_limits(
+    values: np.ndarray, sharey: bool, include_zero: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-row (or shared) finite ``(lo, hi)``; all-NaN rows get ``(nan, nan)``."""
+    finite = np.isfinite(values)
+    lo = np.where(finite, values, np.inf).min(axis=1)
+    hi = np.where(finite, values, -np.inf).max(axis=1)
+    empty = ~finite.any(axis=1)
+    if include_zero:
+        lo, hi = np.minimum(lo, 0.0), np.maximum(hi, 0.0)
+    if sharey and (~empty).any():
+        lo = np.full_like(lo, lo[~empty].min())
+        hi = np.full_like(hi, hi[~empty].max())
+    lo[empty] = hi[empty] = np.nan
+    return lo, hi
+
+
+def _normalize_rows(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Scale each row into ``[0, 1]``; flat rows sit at mid-height."""
+    span = (hi - lo)[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        norm = (values - lo[:, None]) / span
+    return np.where(span > 0, norm, np.where(np.isfinite(values), 0.5, np.nan))
+
+
+class SparklineMixin:
+    def sparkline(
+        self,
+        data: Union[np.ndarray, Sequence[Sequence[float]]],
+        kind: str = "line",
+        ncols: Optional[int] = None,
+        cell_size: Tuple[float, float] = (0.8, 0.2),
+        dpi: int = 200,
+        sharey: bool = False,
+        linewidth: float = 0.8,
+        mark_last: bool = True,
+        pad: float = 0.12,
+        as_images: bool = False,
+        show: bool = False,
+        save_path: Optional[SavePath] = None,
+        save_format: Optional[str] = None,
+        **save_kwargs: Any,
+    ) -> Union[Tuple[plt.Figure, plt.Axes], List[bytes]]:
+        """Render one tiny line or bar glyph per row of a 2-D array.
+
+        Sparklines have no title stack, legend, footer, gridlines, ticks or
+        labels, so none of the ``_finalize_axes`` layout passes run: every
+        glyph is scaled into its own cell of a single full-bleed axes and the
+        whole set is drawn as one collection in one pass.
+
+        Parameters
+        ----------
+        data:
+            ``(n_rows, n_points)`` values, one glyph per row. NaNs leave gaps.
+        kind:
+            ``"line"`` or ``"bar"`` (bars grow from zero; negatives use the
+            second series color).
+        ncols:
+            Glyphs per grid row. Default: enough columns for a roughly square
+            grid image. Ignored when ``as_images=True``.
+        cell_size:
+            ``(width, height)`` of one glyph cell in inches.
+        dpi:
+            Output resolution; with ``as_images=True`` each cell is snapped to
+            a whole number of pixels.
+        sharey:
+            ``False`` (default) → each glyph spans its own min–max. ``True`` →
+            one common scale, so glyphs compare across rows.
+        linewidth:
+            Line width in points (``kind="line"``).
+        mark_last:
+            Dot the last point of each line glyph.
+        pad:
+            Inner cell margin as a fraction of the cell height (the same
+            physical margin is used horizontally).
+        as_images:
+            ``True`` → return one in-memory PNG (``bytes``) per row instead of
+            a grid figure. Rows are drawn in large batches and sliced out of
+            the rendered canvas, so no per-glyph figure is ever created.
+        show, save_path, save_format, **save_kwargs:
+            Grid mode only; as for :meth:`~.line_mixin.LineMixin.line`.
+
+        Returns
+        -------
+        (fig, ax) in grid mode, else ``list[bytes]`` in row order.
+        """
+        values = np.asarray(data, dtype=float)
+        if values.ndim != 2 or values.size == 0:
+            raise ValueError(f"data must be a non-empty 2-D array, got shape {values.shape}")
+        if kind not in ("line", "bar"):
+            raise ValueError(f"kind must be 'line' or 'bar', got {kind!r}")
+        if ncols is not None and ncols < 1:
+            raise ValueError(f"ncols must be >= 1, got {ncols}")
+        cell_w, cell_h = cell_size
+        if cell_w <= 0 or cell_h <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+
+        n_rows = values.shape[0]
+        lo, hi = _row_limits(values, sharey, include_zero=(kind == "bar"))
+        norm = _normalize_rows(values, lo, hi)
+        baseline = _normalize_rows(np.zeros((n_rows, 1)), lo, hi)[:, 0]
+        logger.info("Rendering %d %s sparklines (sharey=%s)", n_rows, kind, sharey)
+
+        if as_images:
+            return self._render_sparkline_images(
+                norm, values, baseline, kind, cell_size, dpi, linewidth, mark_last, pad
+            )
+
+        ncols = ncols or max(1, round(math.sqrt(n_rows * cell_h / cell_w)))
+        nrows = math.ceil(n_rows / ncols)
+        with rc_context(self._rc):  # type: ignore[attr-defined]
+            fig = plt.figure(figsize=(ncols * cell_w, nrows * cell_h), dpi=dpi)
+            fig.patch.set_facecolor(self.bg_color)  # type: ignore[attr-defined]
+            ax = self._draw_sparkline_cells(
+                fig, norm, values, baseline, kind, ncols, cell_size, linewidth, mark_last, pad
+            )
+            if save_path is not None:
+                self.save_figure(fig, save_path, dpi=dpi, fmt=save_format, **save_kwargs)  # type: ignore[attr-defined]
+                logger.info("Saved sparklines -> %s", save_path)
+            if show:
+                plt.show()
+        return fig, ax
+
+    # ── sparkline stages ──────────────────────────────────────────────────
+
+    def _render_sparkline_images(
+        self,
+        norm: np.ndarray,
+        values: np.ndarray,
+        baseline: np.ndarray,
+        kind: str,
+        cell_size: Tuple[float, float],
+        dpi: int,
+        linewidth: float,
+        mark_last: bool,
+        pad: float,
+    ) -> List[bytes]:
+        """Draw rows batch by batch on an off-screen canvas and slice out PNGs."""
+        cell_w_px = max(1, round(cell_size[0] * dpi))
+        cell_h_px = max(1, round(cell_size[1] * dpi))
+        # Snap the cell to whole pixels so every glyph crops out exactly.
+        snapped = (cell_w_px / dpi, cell_h_px / dpi)
+        ncols = max(1, _MAX_CANVAS_PX // cell_w_px)
+        batch = ncols * max(1, _MAX_CANVAS_PX // cell_h_px)
+
+        images: List[bytes] = []
+        with rc_context(self._rc):  # type: ignore[attr-defined]
+            for start in range(0, len(norm), batch):
+                stop = min(start + batch, len(norm))
+                cols = min(ncols, stop - start)
+                rows = math.ceil((stop - start) / cols)
+                fig = Figure(figsize=(cols * snapped[0], rows * snapped[1]), dpi=dpi)
+                canvas = FigureCanvasAgg(fig)
+                fig.patch.set_facecolor(self.bg_color)  # type: ignore[attr-defined]
+                self._draw_sparkline_cells(
+                    fig,
+                    norm[start:stop],
+                    values[start:stop],
+                    baseline[start:stop],
+                    kind,
+                    cols,
+                    snapped,
+                    linewidth,
+                    mark_last,
+                    pad,
+                )
+                canvas.draw()
+                pixels = np.asarray(canvas.buffer_rgba())
+                for i in range(stop - start):
+                    r, c = divmod(i, cols)
+                    cell = pixels[
+                        r * cell_h_px : (r + 1) * cell_h_px, c * cell_w_px : (c + 1) * cell_w_px
+                    ]
+                    buf = io.BytesIO()
+                    Image.fromarray(cell).save(buf, format="PNG", dpi=(dpi, dpi))
+                    images.append(buf.getvalue())
+        return images
+
+    def _draw_sparkline_cells(
+        self,
+        fig: Figure,
+        norm: np.ndarray,
+        values: np.ndarray,
+        baseline: np.ndarray,
+        kind: str,
+        ncols: int,
+        cell_size: Tuple[float, float],
+        linewidth: float,
+        mark_last: bool,
+        pad: float,
+    ) -> plt.Axes:
+        """Lay every glyph into its grid cell on one full-bleed axes.
+
+        Cell ``i`` occupies ``[c, c + 1] × [top - r - 1, top - r]`` in data
+        units, so the whole grid is a single collection drawn in one pass.
+        """
+        n_rows, n_points = norm.shape
+        nrows = math.ceil(n_rows / ncols)
+        ax = fig.add_axes((0.0, 0.0, 1.0, 1.0))
+        ax.set_xlim(0, ncols)
+        ax.set_ylim(0, nrows)
+        ax.set_axis_off()
+
+        pad_y = pad
+        pad_x = pad * cell_size[1] / cell_size[0]
+        idx = np.arange(n_rows)
+        col0 = (idx % ncols) + pad_x
+        row0 = (nrows - 1 - idx // ncols) + pad_y
+        inner_w = 1.0 - 2.0 * pad_x
+        inner_h = 1.0 - 2.0 * pad_y
+        ys = row0[:, None] + norm * inner_h
+        primary = self._series_color(0)  # type: ignore[attr-defined]
+
+        if kind == "line":
+            frac = np.linspace(0.0, 1.0, n_points) if n_points > 1 else np.full(1, 0.5)
+            xs = col0[:, None] + frac[None, :] * inner_w
+            segments = np.stack([xs, ys], axis=-1)
+            ax.add_collection(
+                LineCollection(
+                    segments,
+                    colors=primary,
+                    linewidths=linewidth,
+                    capstyle="round",
+                    joinstyle="round",
+                )
+            )
+            if mark_last:
+                last = np.isfinite(ys[:, -1])
+                ax.plot(
+                    xs[last, -1],
+                    ys[last, -1],
+                    linestyle="none",
+                    marker="o",
+                    markersize=linewidth * 2.2,
+                    color=primary,
+                    markeredgewidth=0,
+                )
+            return ax
+
+        slot = inner_w / n_points
+        left = col0[:, None] + (np.arange(n_points) + (1.0 - _BAR_FILL) / 2.0) * slot
+        base = np.broadcast_to((row0 + baseline * inner_h)[:, None], ys.shape)
+        ok = np.isfinite(ys)
+        x0, x1 = left[ok], left[ok] + _BAR_FILL * slot
+        y0, y1 = base[ok], ys[ok]
+        verts = np.stack(
+            [np.column_stack(p) for p in ((x0, y0), (x0, y1), (x1, y1), (x1, y0))], axis=1
+        )
+        negative = self._series_color(1)  # type: ignore[attr-defined]
+        colors = np.where(values[ok] < 0, negative, primary)
+        ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors="none"))
+        return ax
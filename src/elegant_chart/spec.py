@@ -0,0 +1,333 @@
+# elegant_chart/spec.py
+"""
+Declarative chart specs and compiled render plans.
+
+A spec describes one chart as data — JSON, YAML or a plain dict — instead of
+a Python script::
+
+    {
+      "version": 1,
+      "kind": "line",
+      "chart": {"title": "Annual GDP Growth", "ylabel": "%", "theme": "newsroom_muted"},
+      "data": {"x": [2015, 2016, 2017], "ys": {"GDP": [3.1, -0.8, 5.4]}},
+      "render": {"y_formatter": "plain", "save_path": "out/gdp.png"}
+    }
+
+* ``kind`` — ``"bar"``, ``"line"`` or ``"bump"``.
+* ``chart`` — :class:`~.base.ChartBase` constructor parameters.
+* ``data`` — inline ``x`` / ``ys`` (/ ``labels``), or ``path`` to a
+  ``.csv`` / ``.parquet`` / ``.xlsx`` table with ``x_col`` and ``y_cols``
+  (a relative path resolves against the spec file's directory).
+  ``parse_dates: true`` turns the x values into datetimes.
+* ``render`` — every other argument of the ``bar()`` / ``line()`` /
+  ``bump()`` call, including ``save_path`` and savefig / encoder options.
+  Relative ``save_path`` and ``export_xlsx_path`` values resolve against
+  the spec file's directory too, like ``data.path``.
+
+:func:`compile_spec` validates the whole spec once — unknown keys, theme,
+formatter specs, output targets, the data itself — and resolves it to a
+:class:`RenderPlan`: the constructor and call arguments plus the prepared
+data (normalised series and x plan, or the bump rank plan). A plan is
+immutable and made of plain data, so it pickles cheaply and can be executed
+any number of times, in this process or in a worker pool.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+
+from .base import ChartBase
+from .elegant_chart import ElegantChart
+from .outputs import ENCODE_OPTIONS, SVG_OPTIONS, resolve_targets
+from .style_mixin import THEMES
+
+SPEC_VERSION = 1
+SPEC_KINDS = ("bar", "line", "bump")
+_SPEC_KEYS = {"version", "kind", "chart", "data", "render"}
+
+# Constructor parameters holding live objects rather than configuration;
+# pass them to RenderPlan.render() instead.
+_RUNTIME_PARAMS = {"output_writer", "export_workbook", "output_cache"}
+
+# Call arguments that carry the data; a plan holds them already prepared.
+_DATA_PARAMS = {"x", "ys", "labels", "df", "x_col", "y_cols"}
+# bump's ranking options are written under "render" but also feed its prep.
+_BUMP_DATA_PARAMS = {"x", "ys", "ascending", "pre_ranked", "ties", "top_n"}
+_DATA_KEYS = {"x", "ys", "labels", "path", "x_col", "y_cols", "parse_dates"}
+
+# savefig keywords a spec may pass through besides the encoder / SVG options.
+_SAVEFIG_OPTIONS = {
+    "transparent",
+    "bbox_inches",
+    "pad_inches",
+    "facecolor",
+    "edgecolor",
+    "metadata",
+    "pil_kwargs",
+}
+
+_TABLE_READERS = {".csv": pd.read_csv, ".parquet": pd.read_parquet, ".xlsx": pd.read_excel}
+
+
+def load_spec(path: Any) -> Dict[str, Any]:
+    """Read a spec from a ``.json``, ``.yaml`` or ``.yml`` file.
+
+    Raises
+    ------
+    ValueError
+        For another extension, or a document that is not a mapping.
+    ImportError
+        For YAML without PyYAML installed.
+    """
+    ext = os.path.splitext(os.fspath(path))[1].lower()
+    with open(path, encoding="utf-8") as fh:
+        if ext == ".json":
+            spec = json.load(fh)
+        elif ext in (".yaml", ".yml"):
+            try:
+                import yaml  # noqa: PLC0415
+            except ImportError as exc:
+                raise ImportError(
+                    "PyYAML is required for YAML chart specs. Install it with: pip install pyyaml"
+                ) from exc
+            spec = yaml.safe_load(fh)
+        else:
+            raise ValueError(f"Chart specs are .json, .yaml or .yml files, got {os.fspath(path)!r}")
+    if not isinstance(spec, dict):
+        raise ValueError(f"{os.fspath(path)!r} does not hold a chart spec (a mapping)")
+    return spec
+
+
+def _parameters(fn: Any) -> Dict[str, inspect.Parameter]:
+    return {
+        name: p
+        for name, p in inspect.signature(fn).parameters.items()
+        if name != "self" and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+    }
+
+
+def _check_keys(section: str, given: Mapping[str, Any], allowed: set) -> None:
+    unknown = sorted(set(given) - allowed)
+    if unknown:
+        raise ValueError(f"Unknown {section} key(s) {unknown}; expected some of {sorted(allowed)}")
+
+
+def _from_json(params: Dict[str, inspect.Parameter], values: Mapping[str, Any]) -> Dict[str, Any]:
+    """JSON has no tuples: restore them where a parameter expects one (figsize,
+    xlim, ``("norm_max", 2)`` formatter specs …)."""
+    out = {}
+    for name, value in values.items():
+        annotation = str(params[name].annotation) if name in params else ""
+        if isinstance(value, list) and ("Tuple" in annotation or "FormatterSpec" in annotation):
+            value = tuple(value)
+        out[name] = value
+    return out
+
+
+def _resolve_path(path: Any, base_dir: Optional[str]) -> Any:
+    """*path* joined onto *base_dir* when it is relative."""
+    if base_dir is None or not isinstance(path, str) or os.path.isabs(path):
+        return path
+    return os.path.join(base_dir, path)
+
+
+def _resolve_save_path(save_path: Any, base_dir: Optional[str]) -> Any:
+    """A ``save_path`` spec (path, target dict or list of them) with relative paths resolved."""
+    if isinstance(save_path, list):
+        return [_resolve_save_path(item, base_dir) for item in save_path]
+    if isinstance(save_path, Mapping) and "path" in save_path:
+        return {**save_path, "path": _resolve_path(save_path["path"], base_dir)}
+    return _resolve_path(save_path, base_dir)
+
+
+def _load_data(data: Mapping[str, Any], base_dir: Optional[str]) -> Dict[str, Any]:
+    """The spec's ``data`` section as renderer keyword arguments."""
+    _check_keys("data", data, _DATA_KEYS)
+    data = dict(data)
+    parse_dates = data.pop("parse_dates", False)
+    path = data.pop("path", None)
+    if path is not None:
+        if "x" in data or "ys" in data:
+            raise ValueError("data takes either a 'path' table or inline 'x'/'ys', not both")
+        path = _resolve_path(path, base_dir)
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in _TABLE_READERS:
+            raise ValueError(f"data path must be one of {sorted(_TABLE_READERS)}, got {path!r}")
+        frame = _TABLE_READERS[ext](path)
+        if parse_dates:
+            frame[data["x_col"]] = pd.to_datetime(frame[data["x_col"]])
+        data["df"] = frame
+    elif parse_dates and data.get("x") is not None:
+        data["x"] = list(pd.to_datetime(data["x"]).to_pydatetime())
+    return data
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """A validated chart spec, resolved and ready to draw.
+
+    Build one with :func:`compile_spec`. Every field is plain, picklable
+    data: ``chart_kwargs`` and ``call_kwargs`` are ``(name, value)`` pairs
+    (output paths already resolved), and ``prepared`` the renderer's
+    geometry-independent prep — ``("render", (x, series_list, x_plan))``
+    for bar/line, ``("bump", (bump_plan, series))`` for bump — which an
+    execution takes instead of re-validating the data.
+
+    Formatter *objects* are built by each chart on execution: they read the
+    chart's live tick interval and maximum, so they cannot be shared.
+    """
+
+    kind: str
+    chart_kwargs: Tuple[Tuple[str, Any], ...]
+    call_kwargs: Tuple[Tuple[str, Any], ...]
+    prepared: Tuple[str, Any]
+
+    @property
+    def save_path(self) -> Any:
+        return dict(self.call_kwargs).get("save_path")
+
+    def render(self, **overrides: Any) -> Tuple[Any, Any]:
+        """Draw the chart; returns ``(fig, ax)`` like the renderer.
+
+        *overrides* go to the constructor when they name one of its
+        parameters (``output_writer=``, ``output_cache=`` …) and to the
+        call otherwise (``save_path=``, ``show=`` …). ``show`` defaults to
+        ``False``.
+        """
+        constructor = _parameters(ChartBase.__init__)
+        chart_kwargs = dict(self.chart_kwargs)
+        call_kwargs = {**dict(self.call_kwargs), "show": False}
+        for name, value in overrides.items():
+            (chart_kwargs if name in constructor else call_kwargs)[name] = value
+        chart = ElegantChart(**chart_kwargs)
+        kind, prep = self.prepared
+        chart._prep_memo = {kind: prep}
+        try:
+            return getattr(chart, self.kind)(x=None, ys=None, **call_kwargs)
+        finally:
+            chart._prep_memo = None
+
+    def run(self, **overrides: Any) -> Any:
+        """:meth:`render`, close the figure, and return the plan's ``save_path``.
+
+        The picklable entry point for worker pools, e.g.
+        ``pool.map(RenderPlan.run, plans)``.
+        """
+        import matplotlib.pyplot as plt  # noqa: PLC0415
+
+        fig, _ = self.render(**overrides)
+        plt.close(fig)
+        return overrides.get("save_path", self.save_path)
+
+
+def compile_spec(
+    spec: Union[Mapping[str, Any], str, "os.PathLike[str]"], base_dir: Optional[str] = None
+) -> RenderPlan:
+    """Validate *spec* (a mapping or a spec file path) and resolve it to a :class:`RenderPlan`.
+
+    Parameters
+    ----------
+    spec:
+        The spec, or a ``.json`` / ``.yaml`` file holding it (see
+        :func:`load_spec`).
+    base_dir:
+        Directory that relative ``data.path``, ``render.save_path`` and
+        ``render.export_xlsx_path`` values resolve against; defaults to the
+        spec file's directory (for a mapping, the working directory).
+
+    Raises
+    ------
+    ValueError
+        For anything the chart would reject — unknown keys, an unknown
+        theme, a bad formatter spec or output target, invalid data — with
+        the offending section named.
+    """
+    if not isinstance(spec, Mapping):
+        if base_dir is None:
+            base_dir = os.path.dirname(os.path.abspath(os.fspath(spec)))
+        spec = load_spec(spec)
+    _check_keys("spec", spec, _SPEC_KEYS)
+    version = spec.get("version", SPEC_VERSION)
+    if version != SPEC_VERSION:
+        raise ValueError(f"Unsupported spec version {version!r}; this library reads {SPEC_VERSION}")
+    kind = spec.get("kind")
+    if kind not in SPEC_KINDS:
+        raise ValueError(f"spec kind must be one of {SPEC_KINDS}, got {kind!r}")
+
+    constructor = _parameters(ChartBase.__init__)
+    chart_spec = spec.get("chart") or {}
+    _check_keys("chart", chart_spec, set(constructor) - _RUNTIME_PARAMS)
+    chart_kwargs = _from_json(constructor, chart_spec)
+    theme_name = chart_kwargs.get("theme", constructor["theme"].default)
+    if theme_name not in THEMES:
+        raise ValueError(f"Unknown theme {theme_name!r}; expected one of {sorted(THEMES)}")
+
+    chart = ElegantChart(**chart_kwargs)
+    renderer = getattr(chart, kind)
+    call_params = _parameters(renderer)
+    render_spec = spec.get("render") or {}
+    save_options = ENCODE_OPTIONS | SVG_OPTIONS | _SAVEFIG_OPTIONS
+    _check_keys("render", render_spec, (set(call_params) - _DATA_PARAMS - {"show"}) | save_options)
+    call_kwargs = _from_json(call_params, render_spec)
+    if call_kwargs.get("save_path") is not None:
+        call_kwargs["save_path"] = _resolve_save_path(call_kwargs["save_path"], base_dir)
+    if call_kwargs.get("export_xlsx_path") is not None:
+        call_kwargs["export_xlsx_path"] = _resolve_path(call_kwargs["export_xlsx_path"], base_dir)
+    data = _load_data(spec.get("data") or {}, base_dir)
+    if kind == "bump":
+        _check_keys("bump data", data, {"x", "ys"})
+        if data.get("x") is None or not data.get("ys"):
+            raise ValueError("A bump spec needs inline data 'x' and 'ys'")
+        data.update({k: render_spec[k] for k in _BUMP_DATA_PARAMS & render_spec.keys()})
+
+    # ── resolve: formatter specs, output targets, the data ──────────────
+    for name in ("y_formatter", "x_formatter"):
+        fmt = call_kwargs.get(name, chart_kwargs.get(name))
+        if fmt is not None:
+            try:
+                chart._build_formatter(fmt).format_many([1234.5])
+            except Exception as exc:
+                raise ValueError(f"Invalid {name} {fmt!r}: {exc}") from exc
+    if call_kwargs.get("save_path") is not None:
+        save_kwargs = {k: v for k, v in call_kwargs.items() if k not in call_params}
+        resolve_targets(
+            call_kwargs["save_path"],
+            call_kwargs.get("save_dpi", call_params["save_dpi"].default),
+            call_kwargs.get("save_format"),
+            **save_kwargs,
+        )
+
+    chart._prep_memo = {}
+    if kind == "bump":
+        chart._prepare_bump(
+            data.get("x"),
+            data.get("ys"),
+            data.get("ascending", call_params["ascending"].default),
+            data.get("pre_ranked", call_params["pre_ranked"].default),
+            data.get("ties", call_params["ties"].default),
+            data.get("top_n", call_params["top_n"].default),
+        )
+    else:
+        chart._prepare_data(
+            data.get("x"),
+            data.get("ys"),
+            data.get("labels"),
+            data.get("df"),
+            data.get("x_col"),
+            data.get("y_cols"),
+            call_kwargs.get("xlim"),
+        )
+    ((prep_kind, prepared),) = chart._prep_memo.items()
+
+    return RenderPlan(
+        kind=kind,
+        chart_kwargs=tuple(chart_kwargs.items()),
+        call_kwargs=tuple((k, v) for k, v in call_kwargs.items() if k not in _BUMP_DATA_PARAMS),
+        prepared=(prep_kind, prepared),
+    )
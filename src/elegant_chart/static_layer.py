@@ -0,0 +1,167 @@
+"""Cached static layers for repeat renders of a fixed chart frame.
+
+A :class:`StaticLayer` rasterises everything except a chart's data artists
+(background, title stack, gridlines, ticks, legend, footer and logo) once,
+keeps that bitmap, and on every later render only restores it and draws the
+data artists on top via the Agg canvas's ``copy_from_bbox`` /
+``restore_region``. :class:`RenderState` is the record ``line()`` / ``bar()``
+leave behind so a later payload can find those artists again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib import rc_context
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from ._logging import logger
+
+
+@dataclass
+class RenderState:
+    """Data artists of the last ``line()`` / vertical ``bar()`` render.
+
+    ``series_artists`` holds one entry per series: its ``Line2D`` for line
+    charts, its list of bar ``Rectangle`` patches for bar charts.
+    ``value_labels`` holds ``(annotation, series index, point index)``
+    triples for the value labels that were drawn, ``annotations`` the
+    in-plot annotations they were placed around and ``label_offsets`` the
+    pre-placement offsets of both (annotations first), ``ytick_texts`` the
+    y-tick label texts, ``y_range`` the data range the value axis was solved
+    for and ``render_call`` the arguments of the render itself (replayed
+    when an update needs a fresh layout).
+    """
+
+    fig: Figure
+    ax: Any
+    kind: str
+    series_artists: List[Any]
+    value_labels: List[Tuple[Any, int, int]] = field(default_factory=list)
+    label_spec: Any = None
+    annotations: List[Any] = field(default_factory=list)
+    label_offsets: List[Tuple[float, float]] = field(default_factory=list)
+    stacked: bool = False
+    ytick_texts: List[Any] = field(default_factory=list)
+    y_range: Optional[Tuple[float, float]] = None
+    render_call: dict = field(default_factory=dict)
+    layer: Optional["StaticLayer"] = None
+
+    @property
+    def data_artists(self) -> List[Artist]:
+        artists: List[Artist] = []
+        for entry in self.series_artists:
+            artists.extend(entry if isinstance(entry, list) else [entry])
+        artists.extend(a for a, _, _ in self.value_labels)
+        return artists
+
+
+class StaticLayer:
+    """Background bitmap of *fig* with *artists* removed, plus a fast redraw.
+
+    Parameters
+    ----------
+    fig:
+        A fully laid-out figure. Figures on non-Agg canvases get an Agg
+        canvas attached.
+    artists:
+        The data artists; hidden while the background is captured and
+        drawn (in zorder) on top of it by :meth:`render`.
+    dpi:
+        Render resolution. ``None`` keeps the figure's own dpi. The figure's
+        dpi is only switched while drawing and restored afterwards.
+    rc:
+        The rcParams overlay the figure was rendered under (a chart's
+        ``_rc``). Tick locators and text sizes read rcParams at draw time,
+        so capturing outside it would lay out a different frame than the
+        chart's own save.
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        artists: Sequence[Artist],
+        dpi: Optional[float] = None,
+        rc: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.fig = fig
+        self.artists = sorted(artists, key=lambda a: a.get_zorder())
+        self.dpi = float(dpi) if dpi is not None else float(fig.dpi)
+        self.rc = dict(rc or {})
+        if not hasattr(fig.canvas, "copy_from_bbox"):
+            FigureCanvasAgg(fig)
+        self._background: Any = None
+        self._frame_key: Optional[Tuple[float, ...]] = None
+
+    def _current_key(self) -> Tuple[float, ...]:
+        w, h = self.fig.get_size_inches()
+        return (float(w), float(h), self.dpi)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the cached background still matches the figure size and dpi."""
+        return self._background is not None and self._frame_key == self._current_key()
+
+    def invalidate(self) -> None:
+        """Drop the cached background (e.g. after the axis limits or ticks change)."""
+        self._background = None
+
+    @contextlib.contextmanager
+    def _drawing(self) -> Iterator[None]:
+        """Draw under the chart's rcParams at the layer's dpi, then restore the figure dpi."""
+        saved_dpi = self.fig.dpi
+        with rc_context(self.rc):
+            self.fig.set_dpi(self.dpi)
+            try:
+                yield
+            finally:
+                self.fig.set_dpi(saved_dpi)
+
+    def capture(self) -> None:
+        """Draw the figure without the data artists and cache the bitmap."""
+        with self._drawing():
+            self._capture()
+
+    def _capture(self) -> None:
+        canvas = self.fig.canvas
+        visible = [a.get_visible() for a in self.artists]
+        for a in self.artists:
+            a.set_visible(False)
+        try:
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        finally:
+            for a, v in zip(self.artists, visible):
+                a.set_visible(v)
+        self._frame_key = self._current_key()
+        logger.debug("Captured static layer at %.0f dpi", self.dpi)
+
+    def render(self) -> np.ndarray:
+        """Restore the background, draw the visible data artists, return RGBA pixels."""
+        with self._drawing():
+            if not self.valid:
+                self._capture()
+            canvas = self.fig.canvas
+            canvas.restore_region(self._background)
+            for a in self.artists:
+                if a.get_visible():
+                    self.fig.draw_artist(a)
+            return np.asarray(canvas.buffer_rgba())
+
+    def to_png(self, save_path: Optional[str] = None) -> bytes:
+        """:meth:`render` and encode as PNG; also written to *save_path* when given."""
+        buf = io.BytesIO()
+        Image.fromarray(self.render()).save(buf, format="PNG", dpi=(self.dpi, self.dpi))
+        data = buf.getvalue()
+        if save_path is not None:
+            with open(os.fspath(save_path), "wb") as fh:
+                fh.write(data)
+        return data
@@ -189,10 +189,7 @@ class StyleMixin:
             {
                 "figure.dpi": dpi,
                 "font.family": self.font_main_family,
-                "axes.titlesize": self._ts("title"),
-                "axes.labelsize": self._ts("axis_label"),
-                "xtick.labelsize": self._ts("tick_label"),
-                "ytick.labelsize": self._ts("tick_label"),
+                **self._scaled_rc(),
                 "axes.edgecolor": self.color_axes_edge,
                 "axes.labelcolor": self.color_axes_label,
                 "text.color": self.color_text_main,
@@ -204,6 +201,15 @@ class StyleMixin:
             }
         )
 
+    def _scaled_rc(self) -> dict:
+        """The rcParams that follow ``_figure_scale`` (text sizes)."""
+        return {
+            "axes.titlesize": self._ts("title"),
+            "axes.labelsize": self._ts("axis_label"),
+            "xtick.labelsize": self._ts("tick_label"),
+            "ytick.labelsize": self._ts("tick_label"),
+        }
+
     def _series_color(self, idx: int, label: Optional[str] = None) -> str:
         """Resolve a series' color: explicit ``color_map`` override, else by role.
 
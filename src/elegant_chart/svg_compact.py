@@ -0,0 +1,189 @@
+# elegant_chart/svg_compact.py
+"""
+Size-tuned rewriting of matplotlib's SVG output.
+
+:func:`compact_svg` takes the document ``savefig(format="svg")`` writes and
+returns an equivalent, much smaller one:
+
+* coordinates, lengths and transforms rounded to ``precision`` decimals, and
+  path data written without redundant whitespace;
+* every distinct inline ``style`` moved once into a CSS class;
+* the per-tick gridline paths of each axis merged into a single path;
+* ids nobody references, empty wrapper groups, no-op ``rotate(0 …)``
+  transforms, comments and the RDF metadata block dropped;
+* no indentation or line breaks.
+
+Text stays as ``<text>`` only if the figure was saved with
+``svg.fonttype = "none"`` (see :func:`~.outputs.render_vector`); glyph paths are
+left untouched otherwise.
+"""
+
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Set, Union
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+# Attributes holding coordinates / lengths worth rounding.
+_NUMERIC_ATTRS = {
+    "d",
+    "x",
+    "y",
+    "x1",
+    "y1",
+    "x2",
+    "y2",
+    "cx",
+    "cy",
+    "r",
+    "rx",
+    "ry",
+    "width",
+    "height",
+    "transform",
+    "points",
+}
+_NUMBER = re.compile(r"-?\d+\.\d+(?:[eE][-+]?\d+)?")
+_PATH_COMMAND_GAP = re.compile(r"\s*([MLHVCSQTAZmlhvcsqtaz])\s*")
+_NOOP_ROTATE = re.compile(r"^rotate\(-?0(?:\.0+)?(?: [-\d.e]+ [-\d.e]+)?\)$")
+_STYLE_GAP = re.compile(r"\s*([:;,])\s*")
+_REFERENCE = re.compile(r"url\(#([^)]+)\)")
+_HREF = f"{{{XLINK_NS}}}href"
+
+
+def _tag(element: ET.Element) -> str:
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def _rounder(precision: int):
+    def fmt(match: "re.Match[str]") -> str:
+        text = f"{round(float(match.group()), precision):.{precision}f}"
+        text = text.rstrip("0").rstrip(".") if "." in text else text
+        return "0" if text in ("", "-0") else text
+
+    return fmt
+
+
+def _merge_gridlines(root: ET.Element) -> int:
+    """Merge each axis' gridline paths (one per tick) into one path; return paths removed."""
+    removed = 0
+    for axis in root.iter(f"{{{SVG_NS}}}g"):
+        if not axis.get("id", "").startswith("matplotlib.axis"):
+            continue
+        first: Dict[tuple, ET.Element] = {}
+        for tick in list(axis):
+            if _tag(tick) != "g" or not re.match(r"[xy]tick_\d+$", tick.get("id", "")):
+                continue
+            for holder in list(tick):
+                paths = list(holder)
+                if (
+                    _tag(holder) != "g"
+                    or len(paths) != 1
+                    or _tag(paths[0]) != "path"
+                    or paths[0].get("clip-path") is None
+                ):
+                    continue
+                path = paths[0]
+                key = (path.get("style"), path.get("clip-path"), path.get("transform"))
+                if key in first:
+                    first[key].set("d", first[key].get("d", "") + " " + path.get("d", ""))
+                    tick.remove(holder)
+                    removed += 1
+                else:
+                    first[key] = path
+    return removed
+
+
+def _referenced_ids(root: ET.Element) -> Set[str]:
+    refs: Set[str] = set()
+    for element in root.iter():
+        for name, value in element.attrib.items():
+            if name == _HREF and value.startswith("#"):
+                refs.add(value[1:])
+            else:
+                refs.update(_REFERENCE.findall(value))
+    return refs
+
+
+def _unwrap_bare_groups(parent: ET.Element) -> None:
+    """Splice attribute-less ``<g>`` children into their parent, depth first."""
+    children: List[ET.Element] = []
+    for child in list(parent):
+        _unwrap_bare_groups(child)
+        if _tag(child) == "g" and not child.attrib:
+            children.extend(child)
+        else:
+            children.append(child)
+    parent[:] = children
+
+
+def compact_svg(svg: Union[str, bytes], precision: int = 2) -> str:
+    """Rewrite a matplotlib SVG document for size; see the module docstring.
+
+    Parameters
+    ----------
+    svg:
+        The document as written by ``savefig(format="svg")``.
+    precision:
+        Decimals kept in coordinates and lengths (user units are points, so
+        the default 2 is far below a pixel at any sensible size).
+
+    Returns
+    -------
+    str
+        The compacted document, starting with ``<svg``.
+    """
+    if precision < 0:
+        raise ValueError(f"precision must be >= 0, got {precision}")
+    root = ET.fromstring(svg)  # drops comments and the doctype
+    for metadata in root.findall(f"{{{SVG_NS}}}metadata"):
+        root.remove(metadata)
+
+    _merge_gridlines(root)
+    referenced = _referenced_ids(root)
+    fmt = _rounder(precision)
+    classes: Dict[str, str] = {}
+    style_element: Optional[ET.Element] = None
+
+    for element in root.iter():
+        tag = _tag(element)
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+        if tag == "style":
+            style_element = element
+            continue
+        if element is not root:
+            for name in _NUMERIC_ATTRS & element.attrib.keys():
+                value = _NUMBER.sub(fmt, element.get(name, ""))
+                if name == "d":
+                    value = _PATH_COMMAND_GAP.sub(r"\1", " ".join(value.split()))
+                if name == "transform" and _NOOP_ROTATE.match(value):
+                    del element.attrib[name]
+                    continue
+                element.set(name, value)
+        if "id" in element.attrib and element.get("id") not in referenced:
+            del element.attrib["id"]
+        style = element.attrib.pop("style", None)
+        if style:
+            style = _STYLE_GAP.sub(r"\1", style.strip()).rstrip(";")
+            name = classes.setdefault(style, f"s{len(classes)}")
+            existing = element.get("class")
+            element.set("class", f"{existing} {name}" if existing else name)
+        if tag != "text":
+            element.text = element.text.strip() or None if element.text else None
+
+    _unwrap_bare_groups(root)
+    css = "".join(f".{name}{{{style}}}" for style, name in classes.items())
+    if style_element is None:
+        defs = ET.Element(f"{{{SVG_NS}}}defs")
+        style_element = ET.SubElement(defs, f"{{{SVG_NS}}}style", {"type": "text/css"})
+        root.insert(0, defs)
+    base = _STYLE_GAP.sub(r"\1", (style_element.text or "").strip())
+    style_element.text = base + css
+    return ET.tostring(root, encoding="unicode")
@@ -1,5 +1,6 @@
 # elegant_chart/types.py
-from typing import Callable, Tuple, Union, Optional
+import os
+from typing import Any, Callable, Dict, Sequence, Tuple, Union, Optional
 
 FormatterCallable = Callable[[float, int], str]
 FormatterSpec = Union[
@@ -9,6 +10,13 @@ FormatterSpec = Union[
     None,
 ]
 
+# One output path, or several targets (paths and/or {"path", "dpi", "format",
+# "densities", "thumbnail", **savefig_kwargs} dicts) written from a single
+# layout — see outputs.py.
+OutputPath = Union[str, "os.PathLike[str]"]
+OutputSpec = Union[OutputPath, Dict[str, Any]]
+SavePath = Union[OutputSpec, Sequence[OutputSpec]]
+
 
 class YFormatter:
     COMPACT = "compact"
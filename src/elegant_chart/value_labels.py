@@ -0,0 +1,130 @@
+"""Density-based culling of value labels.
+
+Label footprints are estimated analytically from character counts (no
+text rendering), and only the labels that fit are handed back for drawing:
+the last point, the global extrema, an evenly spaced every-k-th subset
+and, where room remains, local turning points.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .label_placement import place_labels
+
+# Average glyph advance of the label font as a fraction of its size. Value
+# labels are mostly digits, which sit close to 0.55-0.6 em in sans-serifs;
+# erring wide keeps the estimate conservative.
+CHAR_WIDTH_EM = 0.6
+LINE_HEIGHT_EM = 1.2
+
+# Culling priorities (higher = placed first, wins any contest for space).
+_PRIO_LAST = 4.0
+_PRIO_GLOBAL_EXTREMUM = 3.0
+_PRIO_STRIDE = 2.0
+_PRIO_LOCAL_EXTREMUM = 1.0
+
+# Horizontal / vertical anchor fractions for matplotlib's ha / va names.
+_HA_FRACTION = {"left": 0.0, "center": 0.5, "right": 1.0}
+_VA_FRACTION = {"bottom": 0.0, "baseline": 0.0, "center": 0.5, "center_baseline": 0.5, "top": 1.0}
+
+
+def estimate_text_extents(texts: Sequence[str], fontsize: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Estimate single-line label ``(widths, heights)`` in the units of *fontsize*."""
+    n_chars = np.char.str_len(np.asarray(texts, dtype=str)) if len(texts) else np.zeros(0)
+    widths = n_chars * (CHAR_WIDTH_EM * fontsize)
+    heights = np.where(n_chars > 0, LINE_HEIGHT_EM * fontsize, 0.0)
+    return widths.astype(float), heights.astype(float)
+
+
+def anchored_boxes(
+    anchors: np.ndarray,
+    widths: np.ndarray,
+    heights: np.ndarray,
+    ha: str = "center",
+    va: str = "bottom",
+    offset: Tuple[float, float] = (0.0, 0.0),
+) -> np.ndarray:
+    """Build ``(n, 4)`` boxes for texts anchored at *anchors* with ``ha`` / ``va``."""
+    anchors = np.asarray(anchors, dtype=float).reshape(-1, 2)
+    x0 = anchors[:, 0] + offset[0] - _HA_FRACTION[ha] * widths
+    y0 = anchors[:, 1] + offset[1] - _VA_FRACTION[va] * heights
+    return np.column_stack([x0, y0, x0 + widths, y0 + heights])
+
+
+def label_priority(values: Sequence[float], stride: int = 1) -> np.ndarray:
+    """Culling priority of each point of one series.
+
+    The last point ranks highest, then the global maximum / minimum, then
+    every ``stride``-th point counted back from the last (so the regular
+    rhythm always includes it), then interior local extrema.
+    """
+    v = np.asarray(values, dtype=float).ravel()
+    n = len(v)
+    prio = np.zeros(n)
+    if n == 0:
+        return prio
+    finite = np.isfinite(v)
+    if n > 2:
+        d = np.diff(v)
+        turning = np.zeros(n, dtype=bool)
+        turning[1:-1] = d[:-1] * d[1:] < 0
+        prio[turning] = _PRIO_LOCAL_EXTREMUM
+    stride = max(int(stride), 1)
+    prio[(n - 1 - np.arange(n)) % stride == 0] = _PRIO_STRIDE
+    if finite.any():
+        prio[np.nanargmax(np.where(finite, v, np.nan))] = _PRIO_GLOBAL_EXTREMUM
+        prio[np.nanargmin(np.where(finite, v, np.nan))] = _PRIO_GLOBAL_EXTREMUM
+    prio[n - 1] = _PRIO_LAST
+    prio[~finite] = -1.0
+    return prio
+
+
+def cull_value_labels(
+    boxes: np.ndarray,
+    series_values: Sequence[Sequence[float]],
+    along: int = 0,
+    padding: float = 0.0,
+) -> np.ndarray:
+    """Return a keep-mask of the value labels that fit without overlapping.
+
+    Parameters
+    ----------
+    boxes:
+        ``(n, 4)`` estimated label boxes for every series, concatenated in
+        ``series_values`` order.
+    series_values:
+        The labelled values, one sequence per series; drives the
+        per-series priorities of :func:`label_priority`.
+    along:
+        Axis (0 = x, 1 = y) along which consecutive labels advance; sets the
+        stride from the typical label extent versus point spacing.
+    padding:
+        Extra clearance around each box, in the boxes' units.
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    priorities = []
+    start = 0
+    for values in series_values:
+        n = len(values)
+        seg = boxes[start : start + n]
+        stride = 1
+        if n > 1:
+            extent = float(np.nanmedian(seg[:, 2 + along] - seg[:, along])) + 2 * padding
+            centers = (seg[:, along] + seg[:, 2 + along]) / 2.0
+            spacing = float(np.nanmedian(np.abs(np.diff(centers))))
+            if spacing > 0:
+                stride = int(np.ceil(extent / spacing))
+        priorities.append(label_priority(values, stride))
+        start += n
+    priority = np.concatenate(priorities) if priorities else np.zeros(0)
+    # Labels of missing values (or off-screen anchors) are never drawn.
+    drawable = (priority >= 0) & np.isfinite(boxes).all(axis=1)
+    accepted, _ = place_labels(
+        boxes[drawable], candidates=((0.0, 0.0),), priority=priority[drawable], padding=padding
+    )
+    keep = np.zeros(len(boxes), dtype=bool)
+    keep[drawable] = accepted
+    return keep
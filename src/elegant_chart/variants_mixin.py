@@ -0,0 +1,103 @@
+# elegant_chart/variants_mixin.py
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+
+from ._logging import logger
+from .base import FIGSIZE_PRESETS, REFERENCE_FIGSIZE
+
+# Renderers whose geometry-independent prep is shared across sizes.
+_VARIANT_KINDS = ("line", "bar", "bump")
+
+
+class VariantsMixin:
+    def size_variants(
+        self,
+        kind: str,
+        save_path: str,
+        sizes: Optional[Union[Sequence[str], Dict[str, Tuple[float, float]]]] = None,
+        save_dpi: int = 500,
+        export_xlsx: bool = True,
+        export_xlsx_path: Optional[str] = None,
+        **render_kwargs: Any,
+    ) -> Dict[str, str]:
+        """Save one chart at several canvas sizes (feed, square, landscape, story …).
+
+        Equivalent to calling ``line()`` / ``bar()`` / ``bump()`` once per
+        size with ``figsize`` changed, but the data work — DataFrame
+        extraction, normalisation, validation, the x plan (or the bump rank
+        matrix) — runs once; only the layout is redone per size. Typography
+        and geometry follow each canvas through ``_figure_scale`` and the
+        text sizes of the rcParams overlay.
+
+        Parameters
+        ----------
+        kind:
+            ``"line"``, ``"bar"`` or ``"bump"``.
+        save_path:
+            Output path template containing ``{name}``, e.g.
+            ``"out/revenue_{name}.png"``; formatted with each size name.
+        sizes:
+            Names from :data:`~.base.FIGSIZE_PRESETS` (``"feed"`` 4:5,
+            ``"square"`` 1:1, ``"landscape"`` 16:9, ``"story"`` 9:16), or a
+            ``{name: (width_in, height_in)}`` dict. Default: every preset.
+        save_dpi:
+            As for the renderer; at 500 DPI every preset is 1080 px on its
+            short side.
+        export_xlsx, export_xlsx_path:
+            The (shared) data is exported once, next to the first variant.
+        **render_kwargs:
+            Passed to the renderer (``x``, ``ys``, ``labels``, ``df`` …).
+
+        Returns
+        -------
+        dict
+            ``{size_name: written_path}``. Each figure is closed after saving.
+        """
+        if kind not in _VARIANT_KINDS:
+            raise ValueError(f"kind must be one of {_VARIANT_KINDS}, got {kind!r}")
+        if "{name}" not in save_path:
+            raise ValueError("size_variants() save_path must contain a '{name}' placeholder.")
+        if sizes is None:
+            sizes = dict(FIGSIZE_PRESETS)
+        elif not isinstance(sizes, dict):
+            unknown = [name for name in sizes if name not in FIGSIZE_PRESETS]
+            if unknown:
+                raise ValueError(
+                    f"Unknown size preset(s) {unknown}; expected one of {list(FIGSIZE_PRESETS)}"
+                )
+            sizes = {name: FIGSIZE_PRESETS[name] for name in sizes}
+        if not sizes:
+            raise ValueError("size_variants() needs at least one size")
+
+        render = getattr(self, kind)
+        ref_w, ref_h = REFERENCE_FIGSIZE
+        saved = (self.figsize, self._figure_scale, self._rc)  # type: ignore[attr-defined]
+        written: Dict[str, str] = {}
+        self._prep_memo = {}  # type: ignore[attr-defined]
+        try:
+            for i, (name, (fw, fh)) in enumerate(sizes.items()):
+                self.figsize = (fw, fh)  # type: ignore[attr-defined]
+                self._figure_scale = min(fw / ref_w, fh / ref_h)  # type: ignore[attr-defined]
+                # The rc overlay's text sizes were scaled for the constructor's canvas.
+                self._rc = {**saved[2], **self._scaled_rc()}  # type: ignore[attr-defined]
+                path = save_path.format(name=name)
+                fig, _ = render(
+                    **render_kwargs,
+                    show=False,
+                    save_path=path,
+                    save_dpi=save_dpi,
+                    export_xlsx=export_xlsx and i == 0,
+                    export_xlsx_path=export_xlsx_path,
+                )
+                plt.close(fig)
+                written[name] = path
+        finally:
+            self.figsize, self._figure_scale, self._rc = saved  # type: ignore[attr-defined]
+            self._prep_memo = None  # type: ignore[attr-defined]
+            # The recorded render belonged to a figure that is now closed.
+            self._render_state = None  # type: ignore[attr-defined]
+        logger.info("Saved %d size variants of %s chart %r", len(written), kind, self.title)  # type: ignore[attr-defined]
+        return written
@@ -1,6 +1,9 @@
 import math
 
-from elegant_chart.axis_utils import calc_y_axis
+import numpy as np
+import pytest
+
+from elegant_chart.axis_utils import calc_shared_y_axis, calc_y_axis, calc_y_axis_many
 
 
 def _assert_evenly_spaced(result):
@@ -86,3 +89,40 @@ def test_touch_avoidance_bumps_y_max():
     result = calc_y_axis(0, 100, "bar")
     assert result["y_max"] > 100
     _assert_evenly_spaced(result)
+
+
+def test_calc_y_axis_returns_fresh_dicts_from_cache():
+    first = calc_y_axis(0, 83, "bar")
+    first["ticks"].append(999)
+    assert 999 not in calc_y_axis(0, 83, "bar")["ticks"]
+
+
+def test_calc_y_axis_many_matches_scalar():
+    rng = np.random.default_rng(0)
+    mins = rng.normal(size=300) * 10.0 ** rng.integers(-3, 6, 300)
+    maxs = mins + np.abs(rng.normal(size=300)) * 10.0 ** rng.integers(-3, 6, 300)
+    mins[::10] = 0.0
+    maxs[::17] = mins[::17]
+    for chart_type in ("line", "bar"):
+        for top in (False, True):
+            many = calc_y_axis_many(mins, maxs, chart_type, has_top_label=top)
+            for i, (lo, hi) in enumerate(zip(mins, maxs)):
+                one = calc_y_axis(lo, hi, chart_type, has_top_label=top)
+                np.testing.assert_allclose(many["ticks"][i], one["ticks"], rtol=1e-9)
+                assert math.isclose(many["y_max"][i], one["y_max"], rel_tol=1e-9)
+                assert many["n_ticks"][i] == len(one["ticks"])
+                assert bool(many["zero_baseline"][i]) == one["zero_baseline"]
+
+
+def test_calc_y_axis_many_length_mismatch_raises():
+    with pytest.raises(ValueError, match="same length"):
+        calc_y_axis_many([0, 1], [1], "line")
+
+
+def test_shared_scale_covers_every_range():
+    mins, maxs = [10, 40, 5], [80, 130, 60]
+    shared = calc_shared_y_axis(mins, maxs, "bar")
+    assert shared == calc_y_axis(5, 130, "bar")
+    many = calc_y_axis_many(mins, maxs, "bar", shared=True)
+    assert (many["y_max"] == shared["y_max"]).all()
+    assert all(list(t) == shared["ticks"] for t in many["ticks"])
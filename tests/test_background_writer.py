@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from elegant_chart.background_writer import BackgroundWriter
+
+
+def test_jobs_run_in_order_and_flush_waits_for_them():
+    seen = []
+    with BackgroundWriter() as writer:
+        for i in range(10):
+            writer.submit(seen.append, i)
+        writer.flush()
+        assert seen == list(range(10))
+
+
+def test_errors_come_back_on_the_next_call_and_the_queue_keeps_going():
+    seen = []
+    writer = BackgroundWriter()
+    writer.submit(lambda: 1 / 0)
+    writer.submit(seen.append, "after")
+    with pytest.raises(ZeroDivisionError):
+        writer.flush()
+    assert seen == ["after"]
+    writer.flush()  # the error was handed back once
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(seen.append, "closed")
+
+
+def test_submit_blocks_while_max_pending_jobs_wait():
+    release = threading.Event()
+    writer = BackgroundWriter(max_pending=1)
+    writer.submit(release.wait)  # running
+    writer.submit(lambda: None)  # fills the queue
+    blocked = threading.Thread(target=writer.submit, args=(lambda: None,))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join(5)
+    assert not blocked.is_alive()
+    writer.close()
+    with pytest.raises(ValueError):
+        BackgroundWriter(max_pending=0)
+
+
+def test_a_raising_block_keeps_its_exception_and_still_drains_the_queue():
+    seen = []
+    with pytest.raises(KeyError):
+        with BackgroundWriter() as writer:
+            writer.submit(lambda: 1 / 0)
+            writer.submit(seen.append, "after")
+            raise KeyError("body")
+    assert seen == ["after"]
+    # On a clean exit the job error is still raised.
+    with pytest.raises(ZeroDivisionError):
+        with BackgroundWriter() as writer:
+            writer.submit(lambda: 1 / 0)
@@ -6,16 +6,18 @@ Uses the Agg (non-interactive) backend so tests run without a display.
 All chart calls use show=False so plt.show() is never triggered.
 """
 
+import io
 import os
 import pytest
 import matplotlib
 
 matplotlib.use("Agg")  # must be set before importing pyplot
 
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from elegant_chart import ElegantChart
 
@@ -467,6 +469,42 @@ def test_line_value_labels_on():
     plt.close(fig)
 
 
+def _visible_value_labels(ax):
+    from matplotlib.text import Annotation
+
+    return [t for t in ax.texts if isinstance(t, Annotation) and t.get_visible()]
+
+
+def test_dense_value_labels_are_deoverlapped():
+    x = list(range(120))
+    ys = [100 + (i % 3) for i in x]
+    c = make_chart()
+    fig, ax = c.line(x=x, ys=ys, show_value_labels=True, show=False)
+    visible = _visible_value_labels(ax)
+    assert 0 < len(visible) < len(x)
+    renderer = fig.canvas.get_renderer()
+    boxes = [t.get_window_extent(renderer) for t in visible]
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1 :]:
+            assert not (a.x0 < b.x1 and b.x0 < a.x1 and a.y0 < b.y1 and b.y0 < a.y1)
+    plt.close(fig)
+
+
+def test_label_overlap_avoidance_can_be_disabled():
+    x = list(range(120))
+    c = make_chart(avoid_label_overlap=False)
+    fig, ax = c.line(x=x, ys=[100] * len(x), show_value_labels=True, show=False)
+    assert len(_visible_value_labels(ax)) == len(x)
+    plt.close(fig)
+
+
+def test_annotations_survive_value_label_collisions():
+    c = make_chart(annotations=[{"x": 1, "y": 20, "text": "Peak"}])
+    fig, ax = c.bar(x=[0, 1, 2], ys=[10, 20, 30], show_value_labels=True, show=False)
+    assert any(t.get_text() == "Peak" and t.get_visible() for t in ax.texts)
+    plt.close(fig)
+
+
 # ── auto bar width ────────────────────────────────────────────────────────────
 
 
@@ -857,3 +895,759 @@ def test_bar_series_colors_follow_role_table():
     assert to_hex(ax.patches[2].get_facecolor()) == expected_b
     assert to_hex(ax.patches[3].get_facecolor()) == expected_b
     plt.close(fig)
+
+
+# ── bump chart ──────────────────────────────────────────────────────────────
+
+
+def test_bump_basic():
+    c = make_chart()
+    assert_figure(
+        c.bump(
+            x=[2020, 2021, 2022],
+            ys={"A": [10, 20, 30], "B": [30, 10, None], "C": [20, 30, 10]},
+            highlight=["A"],
+            show=False,
+        )
+    )
+
+
+def test_bump_accepts_pre_ranked_array():
+    c = make_chart()
+    ranks = np.array([[1, 2], [2, 1]])
+    fig, ax = c.bump(
+        x=[2020, 2021],
+        ys={"A": [5.0, 4.0], "B": [3.0, 9.0]},
+        pre_ranked=ranks,
+        show_labels=False,
+        show=False,
+    )
+    assert list(ax.get_yticks()) == [1, 2]
+    plt.close(fig)
+
+
+def test_bump_pre_ranked_shape_mismatch_raises():
+    c = make_chart()
+    with pytest.raises(ValueError, match="pre_ranked"):
+        c.bump(x=[2020, 2021], ys={"A": [1, 2]}, pre_ranked=np.ones((2, 2)), show=False)
+
+
+def test_bump_rejects_unknown_ties_even_when_pre_ranked(tmp_path):
+    from elegant_chart import compile_spec
+
+    c = make_chart()
+    ys = {"A": [1.0, 2.0], "B": [2.0, 1.0]}
+    for pre_ranked in (True, np.array([[1, 2], [2, 1]])):
+        with pytest.raises(ValueError, match="ties"):
+            c.bump(x=[1, 2], ys=ys, pre_ranked=pre_ranked, ties="dens", show=False)
+    with pytest.raises(ValueError, match="ties"):
+        c.bar_race(str(tmp_path / "r.gif"), [1, 2], ys, ties="dens")
+    spec = {"kind": "bump", "data": {"x": [1, 2], "ys": ys}}
+    with pytest.raises(ValueError, match="ties"):
+        compile_spec({**spec, "render": {"pre_ranked": True, "ties": "dens"}})
+    plt.close("all")
+
+
+def test_bump_uses_collections_for_ghosts_rank_lines_and_dots():
+    c = make_chart()
+    ys = {f"S{i}": list(np.arange(6) * (i % 3 + 1) + i) for i in range(12)}
+    fig, ax = c.bump(x=list(range(6)), ys=ys, highlight=["S0", "S1"], show=False)
+    # One Line2D per hero line only — ghosts and rank lines are collections.
+    assert len(ax.lines) == 2
+    # rank-line collection + ghost collection + one dot collection per hero
+    assert len(ax.collections) == 4
+    plt.close(fig)
+
+
+def test_bump_top_n_culls_series_and_ranks():
+    c = make_chart()
+    ys = {f"S{i}": [100 - i, 100 - i, 100 - i] for i in range(20)}
+    ys["Riser"] = [0, 50, 1000]
+    fig, ax = c.bump(x=[1, 2, 3], ys=ys, highlight=["Riser"], top_n=5, show=False)
+    assert list(ax.get_yticks()) == [1, 2, 3, 4, 5]
+    labels = {t.get_text() for t in ax.texts}
+    assert "Riser" in labels
+    assert "S19" not in labels
+    plt.close(fig)
+
+
+def test_bump_variants_writes_one_file_per_highlight_set(tmp_path):
+    c = make_chart()
+    ys = {"A": [1, 2, 3], "B": [3, 2, 1], "C": [2, 3, 2]}
+    paths = c.bump_variants(
+        x=[2021, 2022, 2023],
+        ys=ys,
+        highlights={"a": ["A"], "bc": ["B", "C"]},
+        save_path=str(tmp_path / "bump_{name}.png"),
+        export_xlsx=False,
+    )
+    assert set(paths) == {"a", "bc"}
+    for path in paths.values():
+        assert os.path.exists(path) and os.path.getsize(path) > 0
+    # Different hero overlays must yield different images.
+    assert open(paths["a"], "rb").read() != open(paths["bc"], "rb").read()
+
+
+def test_bump_variants_requires_name_placeholder(tmp_path):
+    c = make_chart()
+    with pytest.raises(ValueError, match="name"):
+        c.bump_variants(
+            x=[1, 2], ys={"A": [1, 2]}, highlights={"a": ["A"]}, save_path=str(tmp_path / "x.png")
+        )
+
+
+def test_y_scale_applies_a_shared_axis():
+    from elegant_chart.axis_utils import calc_shared_y_axis
+
+    shared = calc_shared_y_axis([0, 0], [40, 130], "bar")
+    tops = []
+    for ys in ([10, 40, 20], [100, 130, 90]):
+        c = make_chart(y_scale=shared)
+        fig, ax = c.bar(x=["A", "B", "C"], ys=ys, show=False)
+        tops.append(ax.get_ylim()[1])
+        plt.close(fig)
+    assert tops[0] == tops[1] == shared["y_max"]
+
+
+# ── facet (small multiples) ─────────────────────────────────────────────────
+
+
+def _facet_panels(n):
+    return {f"P{i}": [i, i * 2 + 1, i * 3 + 2] for i in range(1, n + 1)}
+
+
+def test_facet_grid_shape_hides_unused_cells():
+    c = make_chart()
+    fig, axes = c.facet(x=[1, 2, 3], panels=_facet_panels(5), show=False)
+    assert axes.shape == (2, 3)
+    assert [ax.get_visible() for ax in axes.ravel()] == [True] * 5 + [False]
+    assert axes[0, 0].get_title(loc="left") == "P1"
+    plt.close(fig)
+
+
+def test_facet_sharey_uses_one_axis_for_every_panel():
+    c = make_chart()
+    fig, axes = c.facet(x=[1, 2, 3], panels=_facet_panels(4), show=False)
+    assert len({ax.get_ylim() for ax in axes.ravel()}) == 1
+    plt.close(fig)
+
+
+def test_facet_explicit_ylim_beats_y_scale():
+    scale = {"y_min": 0, "y_max": 50, "ticks": [0, 25, 50], "tick_interval": 25}
+    c = make_chart(ylim=(0, 20), y_scale=scale)
+    fig, axes = c.facet(x=[1, 2, 3], panels=_facet_panels(2), show=False)
+    assert {ax.get_ylim() for ax in axes.ravel()} == {(0, 20)}
+    plt.close(fig)
+
+
+def test_facet_ylim_keeps_formatted_ticks_on_the_first_column():
+    c = make_chart(ylim=(0, 5000))
+    panels = {f"p{i}": [1000, 2500, 4000] for i in range(5)}
+    fig, axes = c.facet(x=[1, 2, 3], panels=panels, ncols=3, show=False)
+    labels = [[t.get_text() for t in ax.get_yticklabels()] for ax in axes.ravel()[:5]]
+    assert labels[0] == labels[3] == ["0", "1K", "2K", "3K", "4K", "5K"]
+    assert not any(t for i in (1, 2, 4) for t in labels[i])
+    assert {ax.get_ylim() for ax in axes.ravel()[:5]} == {(0, 5000)}
+    plt.close(fig)
+
+
+def test_facet_independent_y_axes():
+    c = make_chart()
+    panels = {"small": [1, 2, 3], "large": [100, 250, 400]}
+    fig, axes = c.facet(x=[1, 2, 3], panels=panels, kind="bar", sharey=False, show=False)
+    assert axes[0, 0].get_ylim()[1] < axes[0, 1].get_ylim()[1]
+    plt.close(fig)
+
+
+def test_facet_rejects_unknown_kind():
+    c = make_chart()
+    with pytest.raises(ValueError, match="kind"):
+        c.facet(x=[1, 2], panels={"a": [1, 2]}, kind="area", show=False)
+
+
+def test_facet_saves_and_exports_panel_columns(tmp_path):
+    c = make_chart()
+    out = tmp_path / "facet.png"
+    fig, _ = c.facet(
+        x=[1, 2, 3],
+        panels={"a": {"x": [1, 2, 3], "y": [3, 2, 1]}, "b": [4, 5, 6]},
+        show=False,
+        save_path=str(out),
+    )
+    plt.close(fig)
+    assert out.exists() and out.stat().st_size > 0
+    df = pd.read_excel(tmp_path / "chart_data.xlsx")
+    assert list(df.columns[1:]) == ["a — x", "a — y", "b"]
+
+
+# ── sparklines ──────────────────────────────────────────────────────────────
+
+
+def test_sparkline_grid_draws_every_row_in_one_collection():
+    from matplotlib.collections import LineCollection
+
+    c = make_chart()
+    data = np.arange(60, dtype=float).reshape(12, 5)
+    fig, ax = c.sparkline(data, ncols=4)
+    collections = [a for a in ax.collections if isinstance(a, LineCollection)]
+    assert len(collections) == 1 and len(collections[0].get_segments()) == 12
+    assert ax.get_xlim() == (0, 4) and ax.get_ylim() == (0, 3)
+    assert not ax.axison and not ax.texts
+    plt.close(fig)
+
+
+def test_sparkline_images_are_one_png_per_row():
+    from PIL import Image
+
+    c = make_chart()
+    data = np.random.default_rng(0).standard_normal((7, 20))
+    data[3] = np.nan
+    images = c.sparkline(data, kind="bar", as_images=True, cell_size=(0.5, 0.2), dpi=100)
+    assert len(images) == 7
+    for png in images:
+        assert Image.open(io.BytesIO(png)).size == (50, 20)
+
+
+def test_sparkline_rejects_non_2d_data():
+    c = make_chart()
+    with pytest.raises(ValueError, match="2-D"):
+        c.sparkline([1, 2, 3])
+
+
+# ── live updates: static layer + blit ───────────────────────────────────────
+
+
+def test_blit_moves_line_data_over_cached_frame():
+    c = make_chart()
+    fig, ax = c.line(x=[1, 2, 3], ys={"a": [1, 2, 3], "b": [3, 2, 1]}, show=False)
+    png = c.blit({"b": [2, 2, 2], "a": [1, 1, 1]}, export_xlsx=False)
+    assert png[:4] == b"\x89PNG"
+    assert list(ax.lines[0].get_ydata()) == [1, 1, 1]
+    assert list(ax.lines[1].get_ydata()) == [2, 2, 2]
+    layer = c._render_state.layer
+    c.blit({"a": [2, 2, 2], "b": [1, 1, 1]}, export_xlsx=False)
+    assert c._render_state.layer is layer and layer.valid
+    plt.close(fig)
+
+
+def _png_pixels(data):
+    from PIL import Image
+
+    return np.asarray(Image.open(io.BytesIO(data) if isinstance(data, bytes) else data))
+
+
+def test_blit_frame_matches_the_chart_save(tmp_path):
+    c = make_chart()
+    x = list(range(2000, 2013))
+    y = [float(v % 7 + 1) for v in range(13)]
+    out = tmp_path / "line.png"
+    fig, _ = c.line(x=x, ys=y, save_path=str(out), save_dpi=100, export_xlsx=False, show=False)
+    dpi = fig.dpi
+    png = c.blit(y, save_dpi=100, export_xlsx=False)
+    assert np.array_equal(_png_pixels(png), _png_pixels(out))
+    assert fig.dpi == dpi
+    plt.close(fig)
+
+
+def test_blit_updates_stacked_bars_and_value_labels(tmp_path):
+    c = make_chart()
+    fig, ax = c.bar(
+        x=["A", "B"],
+        ys={"s": [1, 2], "t": [3, 4]},
+        stacked=True,
+        show_value_labels=True,
+        show=False,
+    )
+    out = tmp_path / "live.png"
+    c.blit({"s": [2, 1], "t": [1, 1]}, save_path=str(out), export_xlsx=False)
+    assert out.exists()
+    patches = c._render_state.series_artists
+    assert [r.get_height() for r in patches[1]] == [1, 1]
+    assert [r.get_y() for r in patches[1]] == [2, 1]
+    labels = {t.get_text() for t in _visible_value_labels(ax)}
+    assert labels <= {"1", "2"}
+    plt.close(fig)
+
+
+def test_blit_requires_a_rendered_chart_and_matching_payload():
+    c = make_chart()
+    with pytest.raises(RuntimeError):
+        c.blit([1, 2, 3])
+    fig, _ = c.line(x=[1, 2, 3], ys=[1, 2, 3], show=False)
+    with pytest.raises(ValueError):
+        c.blit([1, 2])
+    with pytest.raises(ValueError):
+        c.blit([[1, 2, 3], [3, 2, 1]])
+    plt.close(fig)
+    c.bump(x=[1, 2], ys={"A": [1, 2], "B": [2, 1]}, show=False)
+    with pytest.raises(RuntimeError):
+        c.blit([1, 2])
+    plt.close("all")
+
+
+def _ytick_label_texts(c):
+    return [t.get_text() for t in c._render_state.ytick_texts]
+
+
+def test_update_same_axis_moves_data_in_place(tmp_path):
+    c = make_chart()
+    out = tmp_path / "live.png"
+    fig, ax = c.line(x=[1, 2, 3], ys=[10, 50, 90], show=False, save_path=str(out))
+    ylim = ax.get_ylim()
+    before = out.read_bytes()
+    fig2, ax2 = c.update([20, 60, 80])
+    assert fig2 is fig and ax2 is ax and ax.get_ylim() == ylim
+    assert list(ax.lines[0].get_ydata()) == [20, 60, 80]
+    assert out.read_bytes() != before
+    plt.close(fig)
+
+
+def test_update_unchanged_payload_resaves_identical_pixels(tmp_path):
+    c = make_chart()
+    out = tmp_path / "live.png"
+    ys = {"a": [10, 50, 20, 60, 30], "b": [50, 10, 60, 20, 70]}
+    fig, _ = c.line(
+        x=[1, 2, 3, 4, 5],
+        ys=ys,
+        show_value_labels=True,
+        save_path=str(out),
+        save_dpi=100,
+        export_xlsx=False,
+        show=False,
+    )
+    first = _png_pixels(out)
+    c.update(ys)
+    assert np.array_equal(_png_pixels(out), first)
+    plt.close(fig)
+
+
+def test_update_re_places_value_labels_that_now_collide():
+    c = make_chart()
+    x = list(range(1, 9))
+    fig, ax = c.line(
+        x=x,
+        ys={"a": [10, 50, 20, 60, 30, 70, 40, 80], "b": [50, 10, 60, 20, 70, 30, 80, 40]},
+        show_value_labels=True,
+        show=False,
+    )
+    c.update({"a": [10, 50, 20, 60, 30, 70, 40, 80], "b": [11, 51, 21, 61, 31, 71, 41, 81]})
+    renderer = fig.canvas.get_renderer()
+    boxes = [
+        t.get_window_extent(renderer) for t, _, _ in c._render_state.value_labels if t.get_visible()
+    ]
+    assert 0 < len(boxes) < 16
+    assert not any(a.overlaps(b) for i, a in enumerate(boxes) for b in boxes[i + 1 :])
+    plt.close(fig)
+
+
+def test_update_new_ticks_relabel_axis_in_place():
+    c = make_chart()
+    fig, ax = c.line(x=[1, 2, 3], ys=[10, 50, 90], show=False)
+    old_labels = list(c._render_state.ytick_texts)
+    fig2, _ = c.update([10, 50, 130])
+    assert fig2 is fig
+    assert ax.get_ylim()[1] > 130
+    assert not any(t in ax.texts for t in old_labels)
+    assert all(t in ax.texts for t in c._render_state.ytick_texts)
+    assert _ytick_label_texts(c)[-1] == str(int(ax.get_yticks()[-1]))
+    plt.close(fig)
+
+
+def test_update_rerenders_when_tick_labels_widen_or_x_changes():
+    c = make_chart()
+    fig, ax = c.bar(x=["a", "b"], ys={"s": [1, 2]}, show=False)
+    fig2, ax2 = c.update({"s": [1000, 2500]})
+    assert fig2 is not fig and "2K" in _ytick_label_texts(c)
+    assert [r.get_height() for r in c._render_state.series_artists[0]] == [1000, 2500]
+    fig3, ax3 = c.update(x=["a", "b", "c"], ys={"s": [1, 2, 3]})
+    assert fig3 is not fig2 and len(c._render_state.series_artists[0]) == 3
+    plt.close("all")
+
+
+def test_update_requires_a_rendered_chart():
+    c = make_chart()
+    with pytest.raises(RuntimeError):
+        c.update([1, 2, 3])
+
+
+# ── streaming (stream / append) ─────────────────────────────────────────────
+
+
+def test_stream_frames_keep_the_latest_window(tmp_path):
+    c = make_chart()
+    out = tmp_path / "stream.png"
+    c.stream(window=10, max_fps=0, save_path=str(out), save_dpi=100)
+    assert c.append(0, {"a": 1.0, "b": 2.0}) is None  # one point: no frame yet
+    for i in range(1, 25):
+        frame = c.append(i, {"a": float(i % 4), "b": float(i % 3)})
+    assert frame[:8] == b"\x89PNG\r\n\x1a\n" and out.read_bytes() == frame
+    ax = c._render_state.ax
+    assert list(ax.lines[0].get_xdata()) == list(range(15, 25))
+    assert 15 <= min(ax.get_xticks()) and max(ax.get_xticks()) <= 24
+    plt.close("all")
+
+
+def test_stream_datetime_ticks_slide_with_the_window():
+    c = make_chart()
+    c.stream(window=30, max_fps=0, save_dpi=100)
+    t0 = datetime(2024, 5, 1, 8, 0)
+    for i in range(90):
+        c.append(t0 + timedelta(minutes=i), [float(i % 7)])
+    ax = c._render_state.ax
+    labels = [lbl.get_text() for lbl in ax.get_xticklabels()]
+    assert 3 <= len(labels) <= 8
+    assert all(lbl.count(":") == 1 for lbl in labels)  # "%H:%M" ticks
+    lo, hi = (
+        mdates.date2num(t0 + timedelta(minutes=60)),
+        mdates.date2num(t0 + timedelta(minutes=89)),
+    )
+    assert all(lo <= v <= hi for v in ax.get_xticks())
+    plt.close("all")
+
+
+def test_stream_rate_cap_and_input_checks():
+    c = make_chart()
+    with pytest.raises(RuntimeError):
+        c.append(0, 1.0)
+    c.stream(window=5, max_fps=0.001)
+    c.append(0, 1.0)
+    assert c.append(1, 2.0) is not None  # first frame is never capped
+    assert c.append(2, 3.0) is None
+    assert c.append(3, 4.0, force=True) is not None
+    with pytest.raises(ValueError):
+        c.append(4, [1.0, 2.0])
+    with pytest.raises(ValueError):
+        c.append(datetime(2024, 1, 1), 1.0)
+    with pytest.raises(ValueError):
+        c.stream(window=1)
+    plt.close("all")
+
+
+# ── animation ───────────────────────────────────────────────────────────────
+
+
+def test_animate_line_reveals_series_into_a_gif(tmp_path):
+    from PIL import Image
+
+    c = make_chart()
+    out = tmp_path / "reveal.gif"
+    fig, ax = c.animate_line(
+        str(out),
+        x=list(range(10)),
+        ys={"a": list(range(10)), "b": [5] * 10},
+        frames=18,
+        fps=10,
+        dpi=40,
+        hold=0,
+        show_value_labels=True,
+    )
+    with Image.open(out) as im:
+        assert im.n_frames > 1
+    assert list(ax.lines[0].get_xdata()) == list(range(10))  # ends fully drawn
+    assert all(a.get_visible() for a, _, _ in c._render_state.value_labels)
+    plt.close(fig)
+
+
+def test_animate_line_snapshots_share_one_y_scale(tmp_path):
+    c = make_chart()
+    snaps = [[1, 2, 3], [10, 20, 30], [100, 50, 200]]
+    fig, ax = c.animate_line(
+        str(tmp_path / "snaps.gif"), x=[1, 2, 3], ys=snaps, snapshots=True, dpi=40
+    )
+    assert ax.get_ylim()[1] >= 200 and list(ax.lines[0].get_ydata()) == [100, 50, 200]
+    assert c.y_scale is None
+    plt.close(fig)
+
+
+def test_animate_line_pipes_blitted_frames_through_ffmpeg_writer(tmp_path, monkeypatch):
+    # A stand-in ffmpeg that records its arguments and the frame bytes.
+    fake = tmp_path / "ffmpeg"
+    fake.write_text(
+        '#!/bin/sh\necho "$@" > "$0.args"\ncat > "$0.frames"\n'
+        'for last; do :; done\necho ok > "$last"\n'
+    )
+    fake.chmod(0o755)
+    monkeypatch.setitem(matplotlib.rcParams, "animation.ffmpeg_path", str(fake))
+    c = make_chart(figsize=(3, 2))
+    fig, _ = c.animate_line(str(tmp_path / "a.mp4"), x=[1, 2, 3], ys=[1, 2, 3], dpi=41, hold=0)
+    args = (tmp_path / "ffmpeg.args").read_text().split()
+    # FFMpegWriter's own command line: h264 frames cropped to even pixels.
+    size = args[args.index("-s") + 1]
+    assert size == "122x82" and "yuv420p" in args
+    assert (tmp_path / "ffmpeg.frames").stat().st_size == 2 * 122 * 82 * 4
+    assert (tmp_path / "a.mp4").exists()
+    plt.close(fig)
+
+
+def test_animate_line_feeds_writer_instances_through_grab_frame(tmp_path):
+    from matplotlib import animation
+
+    c = make_chart()
+    out = tmp_path / "a.html"
+    fig, _ = c.animate_line(
+        str(out), x=[1, 2, 3], ys=[1, 2, 3], dpi=40, hold=0, writer=animation.HTMLWriter()
+    )
+    assert out.stat().st_size > 0
+    assert len(list(tmp_path.glob("a_frames/*.png"))) == 2
+    plt.close(fig)
+
+
+def test_animate_line_rejects_bad_writers_and_args(tmp_path):
+    c = make_chart()
+    with pytest.raises(ValueError):
+        c.animate_line(str(tmp_path / "a.gif"), x=[1, 2], ys=[1, 2], writer=object())
+    with pytest.raises(ValueError):
+        c.animate_line(str(tmp_path / "a.gif"), x=[1, 2], ys=[1, 2], fps=0)
+    with pytest.raises(ValueError):
+        c.animate_line(str(tmp_path / "a.gif"), x=[1], ys=[1])
+    plt.close("all")
+
+
+def test_bar_race_reuses_one_artist_set_per_series(tmp_path):
+    from PIL import Image
+
+    c = make_chart()
+    ys = {"a": [1, 5, 9], "b": [4, 3, 2], "c": [0.2, 2, 8], "d": [0.1, 0.4, 0.3]}
+    out = tmp_path / "race.gif"
+    fig, ax = c.bar_race(
+        str(out), [2021, 2022, 2023], ys, top_n=3, steps_per_period=3, dpi=40, hold=0
+    )
+    with Image.open(out) as im:
+        assert im.n_frames > 1
+    bars = [
+        p for p in ax.patches if isinstance(p, matplotlib.patches.Rectangle) and p is not ax.patch
+    ]
+    assert len(bars) == 3  # "d" never reaches the top 3
+    assert sorted(b.get_width() for b in bars) == [2, 8, 9]
+    names = {t.get_text(): t for t in ax.texts if t.get_visible()}
+    assert names["a"].xy[1] < names["c"].xy[1] < names["b"].xy[1]  # final order a, c, b
+    assert c._render_state is None
+    # Rescaled every frame, so nothing of the value axis is in the cached frame.
+    assert not ax.xaxis.get_visible()
+    assert not any(line.get_visible() for line in ax.get_xgridlines())
+    with pytest.raises(ValueError):
+        c.bar_race(str(tmp_path / "neg.gif"), [1, 2], {"a": [1, -1]})
+    plt.close("all")
+
+
+# ── multi-format output ─────────────────────────────────────────────────────
+
+
+def test_bar_writes_every_listed_output_from_one_render(tmp_path):
+    c = make_chart()
+    outs = [
+        tmp_path / "c.png",
+        tmp_path / "c.svg",
+        tmp_path / "c.pdf",
+        {"path": tmp_path / "s.png", "dpi": 50},
+    ]
+    fig, _ = c.bar(x=["A", "B"], ys=[1, 2], save_path=outs, show=False)
+    for p in ["c.png", "c.svg", "c.pdf", "s.png"]:
+        assert (tmp_path / p).stat().st_size > 0
+    assert (tmp_path / "chart_data.xlsx").exists()  # export sits next to the first target
+    plt.close(fig)
+
+
+# ── size variants ───────────────────────────────────────────────────────────
+
+
+def test_size_variants_lay_out_each_preset_from_one_data_prep(tmp_path, monkeypatch):
+    from PIL import Image
+
+    c = make_chart()
+    calls = []
+    original = c._normalize_series
+    monkeypatch.setattr(c, "_normalize_series", lambda *a: calls.append(1) or original(*a))
+    out = c.size_variants(
+        "bar",
+        str(tmp_path / "c_{name}.png"),
+        sizes=["square", "landscape"],
+        save_dpi=100,
+        x=["A", "B", "C"],
+        ys=[1, 2, 3],
+    )
+    assert len(calls) == 1
+    with Image.open(out["square"]) as sq, Image.open(out["landscape"]) as ls:
+        assert sq.size == (216, 216) and ls.size == (384, 216)
+    assert (tmp_path / "chart_data.xlsx").exists()
+    assert c.figsize == (2.16, 2.70) and c._prep_memo is None
+
+
+@pytest.mark.parametrize("kind", ["line", "bar"])
+def test_size_variants_match_direct_renders_at_each_preset(tmp_path, kind):
+    from elegant_chart.base import FIGSIZE_PRESETS
+
+    data = dict(x=[2019, 2020, 2021, 2022], ys={"a": [3, 5, 4, 6], "b": [2, 3, 5, 4]})
+    out = make_chart().size_variants(
+        kind, str(tmp_path / "v_{name}.png"), save_dpi=50, export_xlsx=False, **data
+    )
+    for name, figsize in FIGSIZE_PRESETS.items():
+        direct = tmp_path / f"d_{name}.png"
+        fig, _ = getattr(make_chart(figsize=figsize), kind)(
+            **data, save_path=str(direct), save_dpi=50, export_xlsx=False, show=False
+        )
+        plt.close(fig)
+        assert np.array_equal(_png_pixels(out[name]), _png_pixels(direct)), name
+
+
+def test_size_variants_bump_and_bad_args(tmp_path):
+    c = make_chart()
+    out = c.size_variants(
+        "bump",
+        str(tmp_path / "b_{name}.png"),
+        sizes={"wide": (4.0, 2.0)},
+        save_dpi=50,
+        x=[1, 2],
+        ys={"a": [1, 2], "b": [2, 1]},
+        export_xlsx=False,
+    )
+    assert os.path.exists(out["wide"])
+    with pytest.raises(ValueError):
+        c.size_variants("line", str(tmp_path / "no_placeholder.png"), x=[1], ys=[1])
+    with pytest.raises(ValueError):
+        c.size_variants("line", str(tmp_path / "{name}.png"), sizes=["poster"], x=[1], ys=[1])
+    with pytest.raises(ValueError):
+        c.size_variants("pie", str(tmp_path / "{name}.png"), x=[1], ys=[1])
+
+
+# ── encoder options ─────────────────────────────────────────────────────────
+
+
+def test_bar_encoder_options_apply_to_a_single_path(tmp_path):
+    from PIL import Image
+
+    c = make_chart()
+    fig, _ = c.bar(
+        x=["A", "B"], ys=[1, 2], save_path=str(tmp_path / "q.png"), quantize=True, show=False
+    )
+    with Image.open(tmp_path / "q.png") as im:
+        assert im.mode == "P"
+    plt.close(fig)
+
+
+def test_render_reports_size_and_encode_time_of_each_output(tmp_path):
+    c = make_chart()
+    assert c.last_outputs == []
+    outs = [str(tmp_path / "r.png"), str(tmp_path / "r.svg")]
+    fig, _ = c.bar(x=["A", "B"], ys=[1, 2], save_path=outs, export_xlsx=False, show=False)
+    report = {t.format: t for t in c.last_outputs}
+    assert set(report) == {"png", "svg"}
+    for target in report.values():
+        assert target.size_bytes == os.path.getsize(target.path)
+        assert target.encode_seconds >= 0
+    single = tmp_path / "s.png"
+    (target,) = c.save_figure(fig, str(single), dpi=40)
+    assert c.last_outputs == [target] and target.size_bytes == single.stat().st_size
+    plt.close(fig)
+
+
+# ── background output writer ────────────────────────────────────────────────
+
+
+def test_output_writer_saves_and_exports_in_the_background(tmp_path):
+    from elegant_chart import BackgroundWriter
+
+    with BackgroundWriter(max_pending=2) as writer:
+        c = make_chart(output_writer=writer)
+        for i in range(3):
+            fig, _ = c.bar(
+                x=["A", "B"],
+                ys=[i, 2],
+                save_path=str(tmp_path / f"c{i}.png"),
+                show=False,
+                export_xlsx_path=str(tmp_path / f"c{i}.xlsx"),
+            )
+            plt.close(fig)
+        c.flush_outputs()
+        for i in range(3):
+            assert (tmp_path / f"c{i}.png").stat().st_size > 0
+            assert pd.read_excel(tmp_path / f"c{i}.xlsx")["value"].tolist() == [i, 2]
+        fig, _ = c.bar(
+            x=["A"],
+            ys=[1],
+            save_path=str(tmp_path / "missing" / "c.png"),
+            show=False,
+            export_xlsx=False,
+        )
+        plt.close(fig)
+        with pytest.raises(OSError):
+            c.flush_outputs()
+
+
+# ── data export formats ─────────────────────────────────────────────────────
+
+
+def test_export_format_csv_writes_chart_data_csv(tmp_path):
+    c = make_chart(export_format="csv")
+    fig, _ = c.bar(x=["A", "B"], ys=[1, 2], save_path=str(tmp_path / "c.png"), show=False)
+    plt.close(fig)
+    assert pd.read_csv(tmp_path / "chart_data.csv")["value"].tolist() == [1, 2]
+    assert not (tmp_path / "chart_data.xlsx").exists()
+    with pytest.raises(ValueError):
+        make_chart(export_format="json")
+
+
+def test_export_workbook_collects_one_sheet_per_chart(tmp_path):
+    from elegant_chart import ExportWorkbook
+
+    with ExportWorkbook(tmp_path / "run.xlsx") as book:
+        c = make_chart(export_workbook=book)
+        for name, ys in (("revenue", [1, 2]), ("margin", [3, 4])):
+            fig, _ = c.bar(x=["A", "B"], ys=ys, save_path=str(tmp_path / f"{name}.png"), show=False)
+            plt.close(fig)
+    sheets = pd.read_excel(tmp_path / "run.xlsx", sheet_name=None)
+    assert {k: v["value"].tolist() for k, v in sheets.items()} == {
+        "revenue": [1, 2],
+        "margin": [3, 4],
+    }
+    assert not (tmp_path / "chart_data.xlsx").exists()
+
+
+# ── pdf report ──────────────────────────────────────────────────────────────
+
+
+def test_chart_report_collects_rendered_charts(tmp_path):
+    from elegant_chart import ChartReport
+
+    with ChartReport(tmp_path / "bulletin.pdf") as report:
+        for title in ("Revenue", "Margin"):
+            c = make_chart(title=title)
+            fig, _ = c.bar(x=["A", "B"], ys=[1, 2], show=False)
+            report.add(fig, chart=c)
+    assert report.page_count == 2
+    assert (tmp_path / "bulletin.pdf").read_bytes().startswith(b"%PDF")
+
+
+# ── output cache ────────────────────────────────────────────────────────────
+
+
+def test_render_cached_skips_unchanged_renders(tmp_path):
+    from elegant_chart import OutputCache
+
+    cache = OutputCache(tmp_path / "cache")
+    out = tmp_path / "out"
+    out.mkdir()
+    kwargs = dict(x=["A", "B"], ys=[1, 2], export_xlsx_path=str(out / "c.csv"))
+    c = make_chart(output_cache=cache)
+    assert c.render_cached("bar", str(out / "c.png"), **kwargs) is False
+    first = (out / "c.png").read_bytes()
+    (out / "c.png").unlink()
+    assert c.render_cached("bar", str(out / "c.png"), **kwargs) is True
+    assert (out / "c.png").read_bytes() == first
+    assert pd.read_csv(out / "c.csv")["value"].tolist() == [1, 2]
+    with pytest.raises(RuntimeError):
+        c.export_data(str(out / "again.csv"))  # nothing was drawn on the hit
+    # Changed data or config renders again.
+    assert c.render_cached("bar", str(out / "c.png"), **{**kwargs, "ys": [1, 3]}) is False
+    assert (
+        make_chart(output_cache=cache, title="Other").render_cached(
+            "bar", str(out / "c.png"), **kwargs
+        )
+        is False
+    )
+    # Independent renders of the same inputs are byte-identical.
+    fresh = make_chart(output_cache=OutputCache(tmp_path / "cache2"))
+    assert fresh.render_cached("bar", str(out / "d.png"), **kwargs) is False
+    assert (out / "d.png").read_bytes() == first
+    with pytest.raises(RuntimeError):
+        make_chart().render_cached("bar", str(out / "c.png"), **kwargs)
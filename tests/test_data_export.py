@@ -0,0 +1,56 @@
+import math
+
+import pandas as pd
+import pytest
+
+from elegant_chart.data_export import ExportWorkbook, export_columns, export_format_for, write_table
+
+
+def _columns():
+    return export_columns(["A", "B", "C"], [("rev", [1.5, math.nan, 3.0]), (None, [1, 2, 3])])
+
+
+@pytest.mark.parametrize("ext", ["csv", "xlsx"])
+def test_write_table_round_trips_with_nan_blanked(tmp_path, ext):
+    path = tmp_path / f"data.{ext}"
+    write_table(path, _columns())
+    frame = pd.read_csv(path) if ext == "csv" else pd.read_excel(path)
+    assert list(frame.columns) == ["x", "rev", "value"]
+    assert frame["x"].tolist() == ["A", "B", "C"]
+    assert frame["rev"].isna().tolist() == [False, True, False]
+    assert frame["value"].tolist() == [1, 2, 3]
+
+
+def test_parquet_export_needs_pyarrow_or_writes_the_table(tmp_path):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError):
+                write_table(tmp_path / "data.parquet", _columns())
+            return
+    write_table(tmp_path / "data.parquet", _columns())
+    assert pd.read_parquet(tmp_path / "data.parquet")["value"].tolist() == [1, 2, 3]
+
+
+def test_export_format_comes_from_the_argument_or_extension():
+    assert export_format_for("a.CSV") == "csv"
+    assert export_format_for("a.dat", "parquet") == "parquet"
+    with pytest.raises(ValueError):
+        export_format_for("a.json")
+
+
+def test_export_workbook_sanitises_and_dedupes_sheet_names(tmp_path):
+    path = tmp_path / "run.xlsx"
+    with ExportWorkbook(path) as book:
+        assert book.add_sheet("revenue", _columns()) == "revenue"
+        assert book.add_sheet("Revenue", _columns()) == "Revenue (2)"
+        assert book.add_sheet("q1/q2: [draft]?", _columns()) == "q1_q2_ _draft__"
+        assert book.add_sheet("x" * 40, _columns()) == "x" * 31
+    with pytest.raises(RuntimeError):
+        book.add_sheet("late", _columns())
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert list(sheets) == ["revenue", "Revenue (2)", "q1_q2_ _draft__", "x" * 31]
+    assert sheets["revenue"]["value"].tolist() == [1, 2, 3]
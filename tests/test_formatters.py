@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from elegant_chart import ElegantChart
+from elegant_chart.formatters import (
+    CallableFormatter,
+    CompactFormatter,
+    NormMaxFormatter,
+    PercentFormatter,
+    PlainFormatter,
+    TemplateFormatter,
+    decimals_for_interval,
+)
+
+VALUES = [0.0, -0.001, 0.25, 12.5, 999.96, 1000, -1500, 2.5e6, 3e9, 1.25e10, float("nan")]
+
+
+def _scalar_compact(x, decimals):
+    """Reference (pre-batch) compact formatter."""
+    for scale, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(x) >= scale:
+            return f"{x / scale:.1f}".rstrip("0").rstrip(".") + suffix
+    out = f"{x:.{decimals}f}"
+    return out[1:] if out.startswith("-") and float(out) == 0 else out
+
+
+@pytest.mark.parametrize("interval", [None, 1.0, 0.5, 0.01])
+def test_compact_matches_reference(interval):
+    fmt = CompactFormatter(lambda: interval)
+    expected = [_scalar_compact(v, decimals_for_interval(interval)) for v in VALUES]
+    assert fmt.format_many(VALUES) == expected
+
+
+def test_decimals_for_interval():
+    assert decimals_for_interval(None) == 0
+    assert decimals_for_interval(5.0) == 0
+    assert decimals_for_interval(0.25) == 1
+    assert decimals_for_interval(0.01) == 2
+
+
+def test_memo_is_dropped_when_interval_changes():
+    state = {"interval": 1.0}
+    fmt = CompactFormatter(lambda: state["interval"])
+    assert fmt(2.5) == "2"
+    state["interval"] = 0.1
+    assert fmt(2.5) == "2.5"
+
+
+def test_plain_percent_and_template():
+    assert PlainFormatter().format_many(VALUES) == [f"{v:g}" for v in VALUES]
+    assert PercentFormatter().format_many(VALUES) == [f"{v * 100:g}%" for v in VALUES]
+    assert TemplateFormatter("{x:.1f}u").format_many([1, 2.25]) == ["1.0u", "2.2u"]
+
+
+def test_norm_max():
+    fmt = NormMaxFormatter(lambda: 8.0, decimals=2)
+    assert fmt.format_many([2, 4, 1]) == ["0.25", "0.5", "0.12"]
+    assert NormMaxFormatter(lambda: None).format_many([1, 2]) == ["", ""]
+
+
+def test_callable_receives_tick_positions():
+    fmt = CallableFormatter(lambda x, pos: f"{pos}:{x:g}")
+    assert fmt.format_ticks([10, 20]) == ["0:10", "1:20"]
+    assert fmt.format_many([10, 20]) == ["0:10", "0:20"]
+
+
+def test_format_many_accepts_arrays():
+    assert PlainFormatter().format_many(np.array([[1.0, 2.0]])) == ["1", "2"]
+
+
+def test_chart_reuses_one_formatter_per_spec():
+    c = ElegantChart()
+    assert c._build_formatter("compact") is c._build_formatter(None)
+    assert c._build_formatter("plain") is not c._build_formatter("compact")
+    assert c._format_values([1500, 2], "compact") == ["1.5K", "2"]
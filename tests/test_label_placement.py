@@ -0,0 +1,68 @@
+import numpy as np
+
+from elegant_chart.label_placement import LabelGrid, place_labels
+
+
+def test_grid_detects_overlap_across_cells():
+    grid = LabelGrid(10, 10)
+    grid.insert((0, 0, 25, 8))
+    assert grid.collides((20, 4, 30, 12))
+    assert not grid.collides((26, 0, 40, 8))
+
+
+def test_touching_boxes_do_not_collide():
+    grid = LabelGrid(10, 10)
+    grid.insert((0, 0, 10, 10))
+    assert not grid.collides((10, 0, 20, 10))
+
+
+def test_non_overlapping_labels_stay_put():
+    boxes = np.array([[0, 0, 10, 5], [20, 0, 30, 5]], dtype=float)
+    accepted, offsets = place_labels(boxes)
+    assert accepted.all()
+    np.testing.assert_array_equal(offsets, 0)
+
+
+def test_overlapping_label_is_nudged_up_one_line():
+    boxes = np.array([[0, 0, 10, 5], [5, 0, 15, 5]], dtype=float)
+    accepted, offsets = place_labels(boxes)
+    assert accepted.all()
+    np.testing.assert_array_equal(offsets[1], [0, 5])
+
+
+def test_label_with_no_free_candidate_is_dropped():
+    boxes = np.array([[0, 0, 10, 5]] * 4, dtype=float)
+    accepted, offsets = place_labels(boxes)
+    # Original spot, one line up, one line down — the fourth has nowhere to go.
+    np.testing.assert_array_equal(accepted, [True, True, True, False])
+    np.testing.assert_array_equal(offsets[3], [0, 0])
+
+
+def test_priority_decides_who_keeps_the_spot():
+    boxes = np.array([[0, 0, 10, 5]] * 4, dtype=float)
+    accepted, offsets = place_labels(boxes, priority=[0, 0, 0, 1])
+    assert accepted[3]
+    np.testing.assert_array_equal(offsets[3], [0, 0])
+    assert not accepted[2]
+
+
+def test_obstacles_are_avoided():
+    boxes = np.array([[0, 0, 10, 5]], dtype=float)
+    obstacles = np.array([[0, 0, 10, 5], [0, 5, 10, 10]], dtype=float)
+    accepted, offsets = place_labels(boxes, obstacles=obstacles)
+    assert accepted[0]
+    np.testing.assert_array_equal(offsets[0], [0, -5])
+
+
+def test_required_label_is_never_dropped():
+    boxes = np.array([[0, 0, 10, 5]] * 4, dtype=float)
+    accepted, offsets = place_labels(boxes, required=[False, False, False, True])
+    assert accepted[3]
+    np.testing.assert_array_equal(offsets[3], [0, 0])
+
+
+def test_empty_boxes_are_accepted_without_taking_space():
+    boxes = np.array([[0, 0, 0, 0], [0, 0, 10, 5]], dtype=float)
+    accepted, offsets = place_labels(boxes)
+    assert accepted.all()
+    np.testing.assert_array_equal(offsets, 0)
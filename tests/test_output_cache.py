@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from elegant_chart.output_cache import OutputCache, fingerprint
+
+
+def test_fingerprint_is_stable_and_sees_every_input():
+    frame = pd.DataFrame({"a": [1.0, 2.0]})
+    base = fingerprint({"x": [1, 2], "y": np.arange(3.0)}, frame, lambda v: f"{v:.1f}")
+    same = fingerprint({"x": [1, 2], "y": np.arange(3.0)}, frame.copy(), lambda v: f"{v:.1f}")
+    assert base == same
+    assert base != fingerprint({"y": np.arange(3.0), "x": [1, 2]}, frame, lambda v: f"{v:.1f}")
+    assert base != fingerprint({"x": [1, 2], "y": np.arange(3.0) + 1}, frame, lambda v: f"{v:.1f}")
+    assert base != fingerprint({"x": [1, 2], "y": np.arange(3.0)}, frame * 2, lambda v: f"{v:.1f}")
+    assert base != fingerprint({"x": [1, 2], "y": np.arange(3.0)}, frame, lambda v: f"{v:.2f}")
+    assert fingerprint(1) != fingerprint(1.0) != fingerprint("1")
+
+
+UNITS = {"rev": "EUR"}
+
+
+def _unit_label(v):
+    return f"{v:.1f} {_unit_of('rev')}"
+
+
+def _unit_of(key):
+    return UNITS[key] if key in UNITS else _unit_label(0)
+
+
+def test_callables_hash_the_globals_they_read(monkeypatch):
+    first = fingerprint(_unit_label)
+    assert fingerprint(_unit_label) == first
+    # The table is read one call down; the mutual recursion still terminates.
+    monkeypatch.setitem(UNITS, "rev", "USD")
+    assert fingerprint(_unit_label) != first
+
+
+def test_file_inputs_change_the_fingerprint(tmp_path):
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(b"one")
+    first = fingerprint("chart", files=[logo])
+    logo.write_bytes(b"two!")
+    assert fingerprint("chart", files=[logo]) != first
+
+
+@pytest.mark.parametrize("link", [False, True])
+def test_store_then_restore_places_the_files(tmp_path, link):
+    cache = OutputCache(tmp_path / "cache", link=link)
+    out = [tmp_path / "out" / "c.png", tmp_path / "out" / "chart_data.csv"]
+    assert not cache.restore("ab" * 32, out)
+    out[0].parent.mkdir()
+    out[0].write_bytes(b"png")
+    out[1].write_text("x,value\n")
+    cache.store("ab" * 32, out)
+    for path in out:
+        path.unlink()
+    assert cache.restore("ab" * 32, out)
+    assert out[0].read_bytes() == b"png" and out[1].read_text() == "x,value\n"
+    assert (cache.hits, cache.misses) == (1, 1)
+    # A file missing from the requested set is a miss.
+    assert not cache.restore("ab" * 32, out + [tmp_path / "out" / "c.svg"])
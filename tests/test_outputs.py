@@ -0,0 +1,162 @@
+import io
+import json
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from elegant_chart.outputs import (
+    first_output_path,
+    quantize_rgba,
+    render_rgba,
+    resolve_targets,
+    write_outputs,
+)
+
+
+def _figure():
+    fig, ax = plt.subplots(figsize=(2, 1.5), dpi=50)
+    ax.plot([0, 1], [0, 1], color="red")
+    return fig
+
+
+def test_resolve_targets_format_and_dpi_precedence():
+    targets = resolve_targets(
+        ["a.png", {"path": "b.png", "dpi": 72, "format": "jpg"}, "noext"],
+        dpi=300,
+        fmt="pdf",
+        transparent=False,
+    )
+    assert [(t.format, t.dpi) for t in targets] == [("png", 300), ("jpg", 72), ("pdf", 300)]
+    assert targets[1].savefig_kwargs == {"transparent": False}
+    assert first_output_path([{"path": "b.png"}, "a.svg"]) == "b.png"
+    assert first_output_path("c.png") == "c.png"
+
+
+def test_resolve_targets_rejects_empty_and_pathless_specs():
+    with pytest.raises(ValueError):
+        resolve_targets([], dpi=100)
+    with pytest.raises(ValueError):
+        resolve_targets([{"dpi": 100}], dpi=100)
+
+
+def test_shared_raster_pass_matches_savefig(tmp_path):
+    fig = _figure()
+    out = [
+        str(tmp_path / "a.png"),
+        str(tmp_path / "a.svg"),
+        {"path": str(tmp_path / "b.png"), "dpi": 20},
+    ]
+    write_outputs(fig, resolve_targets(out, dpi=40), workers=2)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=40)
+    with Image.open(tmp_path / "a.png") as ours, Image.open(buf) as ref:
+        assert np.array_equal(np.asarray(ours), np.asarray(ref))
+    with Image.open(tmp_path / "b.png") as small:
+        assert small.size == (40, 30)
+    assert (tmp_path / "a.svg").read_text().lstrip().startswith("<?xml")
+    plt.close(fig)
+
+
+def test_encoder_errors_reach_the_caller(tmp_path):
+    fig = _figure()
+    with pytest.raises(OSError):
+        write_outputs(fig, resolve_targets([str(tmp_path / "missing" / "a.png")], dpi=20))
+    plt.close(fig)
+
+
+def test_density_variants_share_one_layout_and_write_a_srcset_manifest(tmp_path):
+    fig = _figure()
+    spec = {"path": str(tmp_path / "c.png"), "densities": [1, 2], "thumbnail": 33}
+    manifests = write_outputs(fig, resolve_targets(spec, dpi=40))
+    for name, size in [("c.png", (80, 60)), ("c@2x.png", (160, 120)), ("c_thumb.png", (33, 24))]:
+        with Image.open(tmp_path / name) as im:
+            assert im.size == size
+    manifest = manifests[str(tmp_path / "c.srcset.json")]
+    assert json.loads((tmp_path / "c.srcset.json").read_text()) == manifest
+    assert manifest["src"] == "c.png"
+    assert manifest["srcset"] == "c_thumb.png 33w, c.png 80w, c@2x.png 160w"
+    assert manifest["srcset_density"] == "c.png 1x, c@2x.png 2x"
+    plt.close(fig)
+
+
+def test_queued_manifests_use_the_figure_size_at_submit_time(tmp_path):
+    import threading
+
+    from elegant_chart.background_writer import BackgroundWriter
+
+    fig = _figure()
+    release = threading.Event()
+    spec = {"path": str(tmp_path / "c.png"), "densities": [1, 2]}
+    with BackgroundWriter(max_pending=8) as writer:
+        writer.submit(release.wait)  # hold the queue until the figure has changed
+        manifests = write_outputs(fig, resolve_targets(spec, dpi=40), writer=writer)
+        fig.set_size_inches(5, 5)
+        plt.close(fig)
+        release.set()
+    manifest = manifests[str(tmp_path / "c.srcset.json")]
+    assert (manifest["width"], manifest["height"]) == (80, 60)
+
+
+def test_density_variants_reject_vector_formats_and_bad_densities():
+    with pytest.raises(ValueError):
+        resolve_targets({"path": "c.svg", "densities": [1, 2]}, dpi=100)
+    with pytest.raises(ValueError):
+        resolve_targets({"path": "c.png", "densities": [0]}, dpi=100)
+
+
+def test_encoder_quantizes_strips_and_reports(tmp_path):
+    fig = _figure()
+    targets = resolve_targets(
+        [str(tmp_path / "q.png"), {"path": str(tmp_path / "t.png"), "transparent": True}],
+        dpi=40,
+        quantize=64,
+        compress_level=9,
+        strip_metadata=True,
+    )
+    write_outputs(fig, targets)
+    with Image.open(tmp_path / "q.png") as q, Image.open(tmp_path / "t.png") as t:
+        assert q.mode == t.mode == "P"
+        assert "Software" not in q.info and "dpi" not in q.info
+        assert len(q.getcolors()) <= 64
+        assert "transparency" in t.info
+    assert all(tg.size_bytes > 0 and tg.encode_seconds >= 0 for tg in targets)
+    plt.close(fig)
+
+
+def test_webp_defaults_to_lossless_and_foreign_options_are_ignored(tmp_path):
+    fig = _figure()
+    rgba = render_rgba(fig, 40)
+    write_outputs(fig, resolve_targets([str(tmp_path / "c.webp")], dpi=40))
+    with Image.open(tmp_path / "c.webp") as im:
+        assert np.array_equal(np.asarray(im.convert("RGBA")), rgba)
+    targets = resolve_targets(
+        [str(tmp_path / "c.svg"), str(tmp_path / "c.png")], dpi=40, quantize=True, compact_svg=True
+    )
+    write_outputs(fig, targets)
+    assert "quantize" not in targets[0].savefig_kwargs
+    assert "compact_svg" not in targets[1].savefig_kwargs
+    with pytest.raises(ValueError):
+        quantize_rgba(rgba, colors=1)
+    plt.close(fig)
+
+
+def test_compact_svg_writer_uses_text_and_can_rasterize_dense_lines(tmp_path):
+    fig, ax = plt.subplots(figsize=(2, 1.5))
+    ax.plot(np.arange(3000), np.sin(np.arange(3000) / 50.0))
+    ax.set_title("Hello")
+    plain, compact, dense = (str(tmp_path / f"{n}.svg") for n in ("plain", "compact", "dense"))
+    write_outputs(fig, resolve_targets([plain], dpi=72))
+    write_outputs(fig, resolve_targets([compact], dpi=72, compact_svg=True))
+    write_outputs(fig, resolve_targets([dense], dpi=72, compact_svg=True, rasterize_dense=True))
+    text = open(compact).read()
+    assert ">Hello</text>" in text and "\n" not in text
+    assert os.path.getsize(compact) < os.path.getsize(plain)
+    assert "<image" in open(dense).read() and not ax.lines[0].get_rasterized()
+    plt.close(fig)
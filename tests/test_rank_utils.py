@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from elegant_chart.rank_utils import race_frames, rank_columns, window_ranks
+
+NAN = float("nan")
+
+
+def test_descending_ranks_each_column_independently():
+    values = np.array([[10, 1], [30, 3], [20, 2]], dtype=float)
+    ranks = rank_columns(values)
+    np.testing.assert_array_equal(ranks, [[3, 3], [1, 1], [2, 2]])
+
+
+def test_ascending_smallest_is_rank_one():
+    values = np.array([[10], [30], [20]], dtype=float)
+    np.testing.assert_array_equal(rank_columns(values, ascending=True), [[1], [3], [2]])
+
+
+def test_nan_cells_are_skipped_and_stay_nan():
+    values = np.array([[NAN, 5], [7, NAN], [3, 9]], dtype=float)
+    ranks = rank_columns(values)
+    # Present series are ranked 1..k with no gap left by the absent one.
+    np.testing.assert_array_equal(ranks, [[NAN, 2], [1, NAN], [2, 1]])
+
+
+def test_all_nan_column_stays_nan():
+    values = np.array([[NAN, 1], [NAN, 2]], dtype=float)
+    ranks = rank_columns(values)
+    assert np.isnan(ranks[:, 0]).all()
+    np.testing.assert_array_equal(ranks[:, 1], [2, 1])
+
+
+@pytest.mark.parametrize(
+    "ties, expected",
+    [
+        ("first", [1, 2, 3, 4]),
+        ("min", [1, 2, 2, 4]),
+        ("max", [1, 3, 3, 4]),
+        ("dense", [1, 2, 2, 3]),
+        ("average", [1, 2.5, 2.5, 4]),
+    ],
+)
+def test_tie_methods(ties, expected):
+    values = np.array([[40], [30], [30], [10]], dtype=float)
+    np.testing.assert_array_equal(rank_columns(values, ties=ties)[:, 0], expected)
+
+
+def test_ties_with_missing_values():
+    values = np.array([[5], [NAN], [5], [1]], dtype=float)
+    ranks = rank_columns(values, ties="min")[:, 0]
+    np.testing.assert_array_equal(ranks, [1, NAN, 1, 3])
+
+
+def test_unknown_tie_method_raises():
+    with pytest.raises(ValueError, match="ties"):
+        rank_columns(np.zeros((2, 2)), ties="random")
+
+
+def test_matches_per_column_argsort_on_random_data():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(50, 20))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    ranks = rank_columns(values)
+    for j in range(values.shape[1]):
+        col = values[:, j]
+        valid = ~np.isnan(col)
+        expected = np.full(col.shape, np.nan)
+        order = np.argsort(-col[valid], kind="stable")
+        expected[np.where(valid)[0][order]] = np.arange(1, valid.sum() + 1)
+        np.testing.assert_array_equal(ranks[:, j], expected)
+
+
+def test_window_ranks_drops_series_never_in_top_n():
+    ranks = np.array([[1, 1, 2], [2, 3, 3], [3, 2, 1], [4, 4, 4]], dtype=float)
+    keep, _ = window_ranks(ranks, 2)
+    np.testing.assert_array_equal(keep, [True, True, True, False])
+
+
+def test_window_ranks_adds_exit_and_entry_stubs():
+    ranks = np.array([[2, 3, 4, 3, 2]], dtype=float)
+    _, display = window_ranks(ranks, 2)
+    # Exit stub after period 0, entry stub before period 4; the far-out
+    # middle period is hidden.
+    np.testing.assert_array_equal(display[0], [2, 3, NAN, 3, 2])
+
+
+def test_window_ranks_stubs_bridge_absent_periods():
+    ranks = np.array([[1, NAN, 5, 6]], dtype=float)
+    _, display = window_ranks(ranks, 2)
+    np.testing.assert_array_equal(display[0], [1, NAN, 3, NAN])
+
+
+def test_race_frames_interpolates_values_and_eases_ranks():
+    values = np.array([[10, 30], [20, 10]], dtype=float)
+    t, vals, ranks = race_frames(values, rank_columns(values), steps_per_period=4, off_rank=3)
+    np.testing.assert_allclose(t, [0, 0.25, 0.5, 0.75, 1])
+    np.testing.assert_allclose(vals[0], [10, 15, 20, 25, 30])
+    np.testing.assert_allclose(ranks[:, [0, 2, 4]], [[2, 1.5, 1], [1, 1.5, 2]])
+    assert ranks[0, 1] > 1.75  # smoothstep starts slower than linear
+
+
+def test_race_frames_absent_series_slide_from_off_rank():
+    values = np.array([[NAN, 5], [8, 4]], dtype=float)
+    _, vals, ranks = race_frames(values, rank_columns(values), steps_per_period=2, off_rank=3)
+    np.testing.assert_allclose(vals[0], [0, 2.5, 5])
+    np.testing.assert_allclose(ranks[0], [3, 2, 1])
@@ -0,0 +1,70 @@
+import io
+import re
+from types import SimpleNamespace
+
+import matplotlib.pyplot as plt
+import pytest
+
+from elegant_chart.report import ChartReport
+
+
+def _kids(path):
+    pages = re.search(rb"/Type /Pages\s*/Kids \[([^\]]*)\]\s*/Count (\d+)", path.read_bytes())
+    return [int(n) for n in re.findall(rb"(\d+) 0 R", pages.group(1))], int(pages.group(2))
+
+
+def test_pages_stream_in_order_and_figures_are_closed(tmp_path):
+    path = tmp_path / "report.pdf"
+    with ChartReport(path, toc=False) as report:
+        for i in range(3):
+            fig = plt.figure(figsize=(2.16, 2.7))
+            fig.text(0.5, 0.5, f"chart {i}")
+            assert report.add(fig) == i + 1
+            assert not plt.fignum_exists(fig.number)
+    kids, count = _kids(path)
+    assert count == 3 and kids == sorted(kids)
+    # One embedded (subsetted) font file for the one font used on every page.
+    assert path.read_bytes().count(b"/FontFile2") == 1
+    with pytest.raises(RuntimeError):
+        report.add(plt.figure())
+    plt.close("all")
+
+
+def test_contents_pages_go_last_and_spill_over(tmp_path):
+    path = tmp_path / "report.pdf"
+    with ChartReport(path, metadata={"Title": "Bulletin"}) as report:
+        for i in range(40):
+            report.add(plt.figure(figsize=(2.16, 2.7)), f"Chart {i}")
+    kids, count = _kids(path)
+    assert count > 40
+    n_toc = count - 40
+    # Pages keep their drawing order: 40 charts, then the contents pages.
+    assert n_toc >= 1 and kids == sorted(kids)
+    assert b"Bulletin" in path.read_bytes()
+    with pytest.raises(ValueError):
+        ChartReport(tmp_path / "x.pdf", fonttype=1)
+
+
+def _report_bytes(**add_kwargs):
+    buf = io.BytesIO()
+    with ChartReport(buf, toc=False) as report:
+        fig = plt.figure(figsize=(2.16, 2.7))
+        fig.add_subplot().plot([0, 1], [0, 1])
+        report.add(fig, **add_kwargs)
+    return buf.getvalue()
+
+
+def test_pages_draw_under_the_chart_rc(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    chart = SimpleNamespace(title="Revenue", _rc={"xtick.labelsize": 30})
+    plain = _report_bytes()
+    assert _report_bytes() == plain
+    assert _report_bytes(chart=chart) != plain
+    assert plt.rcParams["xtick.labelsize"] != 30
+
+    # The chart's title is the default contents entry; file-like targets work.
+    buf = io.BytesIO()
+    with ChartReport(buf) as report:
+        report.add(plt.figure(), chart=chart)
+        assert report._entries[0][0] == "Revenue"
+    assert buf.getvalue().startswith(b"%PDF")
@@ -0,0 +1,38 @@
+import pytest
+
+from elegant_chart.ring_buffer import RingBuffer
+
+
+def test_rows_come_back_oldest_first_until_full():
+    buf = RingBuffer(4, width=2)
+    for i in range(3):
+        buf.append([i, 10 * i])
+    assert len(buf) == 3
+    assert buf.view().tolist() == [[0, 0], [1, 10], [2, 20]]
+
+
+def test_wraps_and_keeps_the_latest_rows_contiguous():
+    buf = RingBuffer(3)
+    for i in range(10):
+        buf.append([i])
+        view = buf.view()
+        assert view[:, 0].tolist() == list(range(max(0, i - 2), i + 1))
+        assert view.base is not None and view.flags.c_contiguous
+
+
+def test_view_is_read_only_and_clear_empties():
+    buf = RingBuffer(2)
+    buf.append([1.0])
+    with pytest.raises(ValueError):
+        buf.view()[0, 0] = 5.0
+    buf.clear()
+    assert len(buf) == 0 and buf.view().shape == (0, 1)
+
+
+def test_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+    with pytest.raises(ValueError):
+        RingBuffer(2, width=0)
+    with pytest.raises(ValueError):
+        RingBuffer(2, width=2).append([1.0])
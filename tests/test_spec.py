@@ -0,0 +1,99 @@
+import json
+import pickle
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from elegant_chart import ElegantChart
+from elegant_chart.spec import compile_spec
+
+
+def _spec(tmp_path, **render):
+    return {
+        "kind": "line",
+        "chart": {"title": "GDP", "figsize": [2.16, 2.7]},
+        "data": {"x": [2019, 2020, 2021], "ys": {"GDP": [3.7, -6.3, 18.9]}},
+        "render": {
+            "y_formatter": ["norm_max", 1],
+            "export_xlsx": False,
+            "save_path": str(tmp_path / "spec.png"),
+            **render,
+        },
+    }
+
+
+def test_plan_renders_what_the_script_would_and_survives_pickling(tmp_path):
+    plan = pickle.loads(pickle.dumps(compile_spec(_spec(tmp_path))))
+    assert plan.run() == str(tmp_path / "spec.png")
+    assert plan.run(save_path=str(tmp_path / "again.png")) == str(tmp_path / "again.png")
+
+    chart = ElegantChart(title="GDP", figsize=(2.16, 2.7))
+    fig, _ = chart.line(
+        x=[2019, 2020, 2021],
+        ys={"GDP": [3.7, -6.3, 18.9]},
+        y_formatter=("norm_max", 1),
+        save_path=str(tmp_path / "script.png"),
+        export_xlsx=False,
+        show=False,
+    )
+    plt.close(fig)
+    expected = (tmp_path / "script.png").read_bytes()
+    assert (tmp_path / "spec.png").read_bytes() == expected
+    assert (tmp_path / "again.png").read_bytes() == expected
+
+
+def test_spec_file_with_table_data_and_bump(tmp_path, monkeypatch):
+    pd.DataFrame({"month": ["2024-01-01", "2024-02-01"], "a": [1, 2], "b": [3, 1]}).to_csv(
+        tmp_path / "data.csv", index=False
+    )
+    spec = {
+        "kind": "bar",
+        "data": {"path": "data.csv", "x_col": "month", "y_cols": ["a", "b"], "parse_dates": True},
+        # Relative outputs resolve against the spec file, like data.path.
+        "render": {"save_path": ["bar.png", {"path": "bar.svg"}]},
+    }
+    (tmp_path / "bar.json").write_text(json.dumps(spec))
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")
+    plan = compile_spec(tmp_path / "bar.json")
+    assert plan.prepared[1][2].is_datetime
+    plan.run()
+    assert (tmp_path / "bar.png").stat().st_size > 0 and (tmp_path / "bar.svg").is_file()
+    assert pd.read_excel(tmp_path / "chart_data.xlsx")["a"].tolist() == [1, 2]
+
+    bump = compile_spec(
+        {
+            "kind": "bump",
+            "data": {"x": ["Q1", "Q2"], "ys": {"p": [1, 2], "q": [2, 1], "r": [0, 0]}},
+            "render": {"top_n": 2, "save_path": str(tmp_path / "bump.png"), "export_xlsx": False},
+        }
+    )
+    bump.run()
+    assert (tmp_path / "bump.png").stat().st_size > 0
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"kind": "pie"},
+        {"version": 2},
+        {"chart": {"colour": "red"}},
+        {"chart": {"theme": "neon"}},
+        {"chart": {"output_writer": None}},
+        {"render": {"bogus": 1}},
+        {"render": {"y_formatter": "{:.1q}"}},
+        {"render": {"save_path": {"path": "c.svg", "densities": [2]}}},
+        {"data": {"x": [1, 2], "ys": [1]}},
+    ],
+)
+def test_compile_rejects_invalid_specs(tmp_path, change):
+    spec = _spec(tmp_path)
+    for key, value in change.items():
+        spec[key] = {**spec[key], **value} if isinstance(spec.get(key), dict) else value
+    with pytest.raises(ValueError):
+        compile_spec(spec)
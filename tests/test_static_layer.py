@@ -0,0 +1,75 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from elegant_chart.static_layer import StaticLayer
+
+
+def _figure():
+    fig, ax = plt.subplots(figsize=(2, 1.5), dpi=50)
+    ax.plot([0, 1], [0, 1], color="grey")  # static
+    (line,) = ax.plot([0, 1], [1, 0], color="red", zorder=3)  # above the spines
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    return fig, line
+
+
+def test_render_matches_a_full_draw():
+    fig, line = _figure()
+    layer = StaticLayer(fig, [line])
+    blitted = layer.render().copy()
+    fig.canvas.draw()
+    full = np.asarray(fig.canvas.buffer_rgba())
+    assert blitted.shape == full.shape == (75, 100, 4)
+    assert np.array_equal(blitted, full)
+    plt.close(fig)
+
+
+def test_background_excludes_data_artists_and_is_reused():
+    fig, line = _figure()
+    layer = StaticLayer(fig, [line])
+    first = layer.render().copy()
+    assert line.get_visible()
+    line.set_ydata([0.5, 0.5])
+    second = layer.render().copy()
+    assert not np.array_equal(first, second)
+    line.set_visible(False)
+    empty = layer.render().copy()
+    layer.capture()
+    assert np.array_equal(empty, np.asarray(fig.canvas.buffer_rgba()))
+    plt.close(fig)
+
+
+def test_dpi_and_size_changes_invalidate_the_cache():
+    fig, line = _figure()
+    layer = StaticLayer(fig, [line], dpi=100)
+    assert layer.render().shape == (150, 200, 4)
+    assert layer.valid
+    fig.set_size_inches(3, 1.5)
+    assert not layer.valid
+    assert layer.render().shape == (150, 300, 4)
+    layer.invalidate()
+    assert not layer.valid
+    plt.close(fig)
+
+
+def test_draws_under_rc_and_restores_the_figure_dpi():
+    fig, line = _figure()
+    plain = StaticLayer(fig, [line], dpi=100).render().copy()
+    layer = StaticLayer(fig, [line], dpi=100, rc={"xtick.labelsize": 30})
+    assert not np.array_equal(layer.render(), plain)
+    assert fig.dpi == 50
+    assert plt.rcParams["xtick.labelsize"] != 30
+    plt.close(fig)
+
+
+def test_to_png_writes_file(tmp_path):
+    fig, line = _figure()
+    out = tmp_path / "frame.png"
+    data = StaticLayer(fig, [line]).to_png(str(out))
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    assert out.read_bytes() == data
+    plt.close(fig)
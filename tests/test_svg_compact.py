@@ -0,0 +1,55 @@
+import re
+
+from elegant_chart.svg_compact import compact_svg
+
+_DOC = """<?xml version="1.0" encoding="utf-8" standalone="no"?>
+<svg xmlns:xlink="http://www.w3.org/1999/xlink" width="100pt" height="50pt" viewBox="0 0 100 50"
+     xmlns="http://www.w3.org/2000/svg" version="1.1">
+ <metadata><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/></metadata>
+ <defs>
+  <style type="text/css">*{stroke-linejoin: round; stroke-linecap: butt}</style>
+ </defs>
+ <g id="figure_1">
+  <g id="axes_1">
+   <g id="matplotlib.axis_2">
+    <g id="ytick_1">
+     <g id="line2d_1">
+      <path d="M 0.123456 10.987654\x20
+L 100 10.987654\x20
+" clip-path="url(#p1)" style="fill: none; stroke: #444444"/>
+     </g>
+     <!-- 10 -->
+     <text style="font-size: 5px; fill: #eee" x="1.23456" y="2.5" \
+transform="rotate(-0 1.23456 2.5)">10</text>
+    </g>
+    <g id="ytick_2">
+     <g id="line2d_2">
+      <path d="M 0 20\x20
+L 100 20\x20
+" clip-path="url(#p1)" style="fill: none; stroke: #444444"/>
+     </g>
+     <text style="font-size: 5px; fill: #eee" x="1" y="12">20</text>
+    </g>
+   </g>
+  </g>
+ </g>
+ <defs><clipPath id="p1"><rect x="0" y="0" width="100" height="50"/></clipPath></defs>
+</svg>
+"""
+
+
+def test_gridlines_merge_and_styles_become_classes():
+    out = compact_svg(_DOC)
+    paths = re.findall(r"<path [^>]*>", out)
+    assert len(paths) == 1
+    assert 'd="M0.12 10.99L100 10.99M0 20L100 20"' in paths[0]
+    assert out.count('class="s1"') == 2  # the two tick labels share one class
+    assert ".s0{fill:none;stroke:#444444}" in out
+
+
+def test_metadata_comments_unused_ids_and_noop_transforms_are_dropped():
+    out = compact_svg(_DOC, precision=1)
+    assert "metadata" not in out and "<!--" not in out and "\n" not in out
+    assert 'id="p1"' in out and 'id="figure_1"' not in out and "<g" not in out
+    assert "rotate" not in out and 'x="1.2"' in out
+    assert ">10</text>" in out and ">20</text>" in out
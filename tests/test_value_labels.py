@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from elegant_chart.value_labels import (
+    anchored_boxes,
+    cull_value_labels,
+    estimate_text_extents,
+    label_priority,
+)
+
+
+def test_estimated_boxes_scale_with_text_length():
+    widths, heights = estimate_text_extents(["1", "100", ""], fontsize=10)
+    assert widths[1] == pytest.approx(3 * widths[0])
+    assert heights[2] == 0
+    boxes = anchored_boxes(np.array([[50.0, 0.0]]), widths[1:2], heights[1:2])
+    np.testing.assert_allclose(boxes[0], [50 - widths[1] / 2, 0, 50 + widths[1] / 2, heights[1]])
+
+
+def test_priority_ranks_last_then_extrema_then_stride():
+    prio = label_priority([5, 9, 1, 4, 3, 6, 2], stride=3)
+    assert prio[-1] == prio.max()
+    assert prio[1] == prio[2]  # global max / min
+    assert prio[3] > prio[4]  # stride point (3 back from the last) beats a turning point
+
+
+def test_cull_keeps_last_and_drops_overlaps():
+    n = 200
+    anchors = np.column_stack([np.arange(n) * 2.0, np.zeros(n)])
+    boxes = anchored_boxes(anchors, np.full(n, 10.0), np.full(n, 5.0))
+    values = np.sin(np.arange(n) / 7.0)
+    keep = cull_value_labels(boxes, [values])
+    assert keep[-1]
+    # 10-wide labels every 2 units: at most one in five can fit.
+    assert 10 <= keep.sum() <= n // 5
+    kept = boxes[keep]
+    order = np.argsort(kept[:, 0])
+    assert (kept[order][1:, 0] >= kept[order][:-1, 2]).all()
+
+
+def test_cull_never_draws_missing_values():
+    boxes = anchored_boxes(np.array([[0.0, 0.0], [100.0, 0.0]]), np.full(2, 5.0), np.full(2, 5.0))
+    keep = cull_value_labels(boxes, [[1.0, float("nan")]])
+    np.testing.assert_array_equal(keep, [True, False])